@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+
+# Copyright (c) CTU  - All Rights Reserved
+# Created on: 10/17/26
+#     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+#
+# Benchmark of the joint getters used in the robot control loop. Joints cache their local poses and limits, so reading
+# them does not query PhysX getters. The uncached variant invalidates joint caches before every read to show the
+# speedup.
+
+import time
+import numpy as np
+from pyphysx import *
+from pyphysx_utils.urdf_robot_parser import URDFRobot
+
+num_steps = 10000
+
+
+def benchmark_joint_getters(robot, invalidate_cache):
+    """ Return average duration of reading local poses and limits of all movable joints in seconds. """
+    start_time = time.time()
+    for _ in range(num_steps):
+        for joint in robot.movable_joints.values():
+            if invalidate_cache:
+                joint.invalidate_cache()
+            joint.local_poses
+            joint.get_limits()
+    return (time.time() - start_time) / num_steps
+
+
+for kinematic in [False, True]:
+    robot = URDFRobot("crane_robot.urdf", kinematic=kinematic)
+    robot.attach_root_node_to_pose((0, 0, 0))
+    robot.reset_pose()
+    for joint in robot.movable_joints.values():
+        joint.set_joint_velocity(0.1)
+
+    uncached = benchmark_joint_getters(robot, invalidate_cache=True)
+    cached = benchmark_joint_getters(robot, invalidate_cache=False)
+    print(f'{"Kinematic" if kinematic else "Dynamic"} robot joint getters: uncached {uncached * 1e6:.1f} us, '
+          f'cached {cached * 1e6:.1f} us, speedup {uncached / cached:.1f}x')
@@ -10,6 +10,8 @@
 #include <Physics.h>
 #include <BasePhysxPointer.h>
 #include "RigidActor.h"
+#include <Articulation.h>
+#include <array_utils.h>
 
 class Aggregate : public BasePhysxPointer<physx::PxAggregate> {
 public:
@@ -27,11 +29,57 @@ public:
         get_physx_ptr()->removeActor(*actor.get_physx_ptr());
     }
 
+    /** @brief Add articulation, its links are counted as actors of the aggregate. */
+    void add_articulation(Articulation articulation) {
+        get_physx_ptr()->addArticulation(*articulation.get_physx_ptr());
+    }
+
     auto get_actors() {
+        return from_vector_of_physx_ptr<RigidActor>(get_actors_ptrs());
+    }
+
+    /** @brief Get poses of all actors in aggregate as Nx7 float32 array [x,y,z,qw,qx,qy,qz] in the order given by
+     * get_actors. If out array is specified, poses are written into it without allocation. */
+    auto get_actors_poses(const pybind11::object &out) {
+        const auto actors = get_actors_ptrs();
+        auto poses = get_output_array(out, {actors.size(), 7});
+        fill_poses(actors, poses);
+        return poses;
+    }
+
+    /** @brief Set poses (Nx7) of the actors selected by indices into get_actors. */
+    void set_actors_poses(const input_index_array &indices, const input_float_array &poses) {
+        set_poses(get_actors_ptrs(), indices, poses);
+    }
+
+    /** @brief Set linear velocities (Nx3) of the actors selected by indices. All selected actors must be dynamic. */
+    void set_actors_linear_velocities(const input_index_array &indices, const input_float_array &velocities) {
+        set_linear_velocities(to_rigid_dynamic_ptrs(get_actors_ptrs()), indices, velocities);
+    }
+
+    /** @brief Set angular velocities (Nx3) of the actors selected by indices. All selected actors must be dynamic. */
+    void set_actors_angular_velocities(const input_index_array &indices, const input_float_array &velocities) {
+        set_angular_velocities(to_rigid_dynamic_ptrs(get_actors_ptrs()), indices, velocities);
+    }
+
+    /** @brief Add forces (Nx3) to the actors selected by indices. All selected actors must be dynamic. */
+    void add_actors_forces(const input_index_array &indices, const input_float_array &forces,
+                           physx::PxForceMode::Enum force_mode) {
+        add_forces(to_rigid_dynamic_ptrs(get_actors_ptrs()), indices, forces, force_mode);
+    }
+
+    /** @brief Add torques (Nx3) to the actors selected by indices. All selected actors must be dynamic. */
+    void add_actors_torques(const input_index_array &indices, const input_float_array &torques,
+                            physx::PxForceMode::Enum torque_mode) {
+        add_torques(to_rigid_dynamic_ptrs(get_actors_ptrs()), indices, torques, torque_mode);
+    }
+
+    /** @brief Get PhysX pointers to all actors in the order given by get_actors. */
+    std::vector<physx::PxRigidActor *> get_actors_ptrs() {
         auto n = get_physx_ptr()->getNbActors();
         std::vector<physx::PxRigidActor *> actors(n);
-        get_physx_ptr()->getActors(reinterpret_cast<physx::PxActor **>(&actors[0]), n);
-        return from_vector_of_physx_ptr<RigidActor>(actors);
+        get_physx_ptr()->getActors(reinterpret_cast<physx::PxActor **>(actors.data()), n);
+        return actors;
     }
 };
 
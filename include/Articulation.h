@@ -0,0 +1,504 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Reduced coordinate articulation, i.e. tree of links connected by fixed, revolute, or prismatic joints simulated
+ *     in joint space. Revolute joint rotates about x-axis (twist) and prismatic joint translates along x-axis of the
+ *     joint frame, as in TreeRobot. Movable joints are ordered in the order in which they were configured and their
+ *     positions, velocities, and drive targets are exchanged with numpy arrays of that order.
+ */
+
+#ifndef PYPHYSX_ARTICULATION_H
+#define PYPHYSX_ARTICULATION_H
+
+#include <Physics.h>
+#include <BasePhysxPointer.h>
+#include <RigidActor.h>
+#include <array_utils.h>
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+class ArticulationLink : public RigidActor {
+public:
+    explicit ArticulationLink(physx::PxArticulationLink *physxPtr) :
+            RigidActor(reinterpret_cast<RigidActor::type_physx *>(physxPtr)) {}
+
+    auto get_link_ptr() const {
+        return reinterpret_cast<physx::PxArticulationLink *>(get_physx_ptr());
+    }
+
+    void set_mass(float mass) {
+        physx::PxRigidBodyExt::setMassAndUpdateInertia(*get_link_ptr(), mass);
+    }
+
+    auto get_mass() {
+        return get_link_ptr()->getMass();
+    }
+
+    auto get_linear_velocity() {
+        return get_link_ptr()->getLinearVelocity();
+    }
+
+    auto get_angular_velocity() {
+        return get_link_ptr()->getAngularVelocity();
+    }
+};
+
+/** @brief Data attached to the articulation userData: ordering of movable joints, joint cache, and the state that is
+ * applied once the articulation is added into the scene. */
+struct ArticulationData {
+    std::vector<physx::PxArticulationLink *> joint_links;
+    std::vector<physx::PxArticulationAxis::Enum> joint_axes;
+    std::vector<size_t> cache_indices; // index of joint in the cache arrays, computed with the cache
+    physx::PxArticulationCache *cache = nullptr;
+    std::vector<float> pending_positions;
+    std::vector<float> pending_velocities;
+
+    /** @brief Owner of the data of all articulations, userData points into it. */
+    static auto &registry() {
+        static std::unordered_map<const physx::PxArticulationBase *, std::unique_ptr<ArticulationData>> data;
+        return data;
+    }
+};
+
+class Articulation : public BasePhysxPointer<physx::PxArticulationReducedCoordinate> {
+public:
+    explicit Articulation(bool fix_base) :
+            BasePhysxPointer(Physics::get_physics()->createArticulationReducedCoordinate()) {
+        get_physx_ptr()->setArticulationFlag(physx::PxArticulationFlag::eFIX_BASE, fix_base);
+    }
+
+    explicit Articulation(physx::PxArticulationReducedCoordinate *physxPtr) : BasePhysxPointer(physxPtr) {}
+
+    void set_fix_base(bool fix_base) {
+        get_physx_ptr()->setArticulationFlag(physx::PxArticulationFlag::eFIX_BASE, fix_base);
+    }
+
+    bool is_in_scene() const {
+        return get_physx_ptr()->getScene() != nullptr;
+    }
+
+    /** @brief Release the articulation together with its links and joints, it is removed from the scene. */
+    void release() {
+        auto art = get_physx_ptr();
+        if (art->userData != nullptr) {
+            release_cache(get_data());
+            ArticulationData::registry().erase(art);
+            art->userData = nullptr;
+        }
+        art->release();
+    }
+
+    /** @brief Create new link connected to the parent link. Root link is created if parent is None. Links have to be
+     * created before the articulation is added into the scene. */
+    ArticulationLink create_link(const ArticulationLink *parent, const physx::PxTransform &pose) {
+        auto link = get_physx_ptr()->createLink(parent != nullptr ? parent->get_link_ptr() : nullptr, pose);
+        if (link == nullptr) {
+            throw std::runtime_error("Articulation link cannot be created.");
+        }
+        return ArticulationLink(link);
+    }
+
+    /** @brief Get all links in the order of creation. */
+    auto get_links() {
+        return from_vector_of_physx_ptr<ArticulationLink>(get_links_ptrs());
+    }
+
+    /** @brief Configure joint that connects the link to its parent. Joint type is one of fixed, revolute, prismatic.
+     * Joint motion is free if both limits are infinite and limited if both are finite. Movable joints are appended
+     * to the joint ordering used by the array interface. */
+    void configure_joint(const ArticulationLink &link, const std::string &joint_type,
+                         const physx::PxTransform &parent_pose, const physx::PxTransform &child_pose,
+                         float lower_limit, float upper_limit) {
+        auto joint = get_joint_ptr(link);
+        if (is_in_scene()) {
+            throw std::runtime_error("Joints cannot be configured while the articulation is in the scene.");
+        }
+        is_limited(lower_limit, upper_limit);
+        auto &data = get_data();
+        const auto it = std::find(data.joint_links.begin(), data.joint_links.end(), link.get_link_ptr());
+        if (it != data.joint_links.end()) {
+            data.joint_axes.erase(data.joint_axes.begin() + (it - data.joint_links.begin()));
+            data.joint_links.erase(it);
+        }
+        joint->setParentPose(parent_pose);
+        joint->setChildPose(child_pose);
+        if (joint_type == "fixed") {
+            joint->setJointType(physx::PxArticulationJointType::eFIX);
+        } else if (joint_type == "revolute" || joint_type == "prismatic") {
+            const bool revolute = joint_type == "revolute";
+            joint->setJointType(revolute ? physx::PxArticulationJointType::eREVOLUTE
+                                         : physx::PxArticulationJointType::ePRISMATIC);
+            data.joint_links.push_back(link.get_link_ptr());
+            data.joint_axes.push_back(revolute ? physx::PxArticulationAxis::eTWIST : physx::PxArticulationAxis::eX);
+            set_joint_limits(link, lower_limit, upper_limit);
+        } else {
+            throw std::invalid_argument("Unknown joint type '" + joint_type + "', use fixed, revolute, or prismatic.");
+        }
+        release_cache(data);
+    }
+
+    /** @brief Get number of movable joints. */
+    size_t get_num_joints() {
+        return get_data().joint_links.size();
+    }
+
+    /** @brief Set limits of the movable joint. Motion is free if both limits are infinite, one sided limits are not
+     * supported by PhysX. */
+    void set_joint_limits(const ArticulationLink &link, float lower_limit, float upper_limit) {
+        const auto axis = get_joint_axis(link);
+        const bool limited = is_limited(lower_limit, upper_limit);
+        get_joint_ptr(link)->setMotion(axis, limited ? physx::PxArticulationMotion::eLIMITED
+                                                     : physx::PxArticulationMotion::eFREE);
+        if (limited) {
+            get_joint_ptr(link)->setLimit(axis, lower_limit, upper_limit);
+        }
+    }
+
+    /** @brief Get limits of the movable joint, (-inf, inf) is returned for free joint. */
+    std::pair<float, float> get_joint_limits(const ArticulationLink &link) {
+        const auto axis = get_joint_axis(link);
+        const auto joint = get_joint_ptr(link);
+        if (joint->getMotion(axis) != physx::PxArticulationMotion::eLIMITED) {
+            return {-std::numeric_limits<float>::infinity(), std::numeric_limits<float>::infinity()};
+        }
+        float lower, upper;
+        joint->getLimit(axis, lower, upper);
+        return {lower, upper};
+    }
+
+    /** @brief Configure PD drive of the movable joint. */
+    void set_joint_drive(const ArticulationLink &link, float stiffness, float damping, float force_limit,
+                         bool is_acceleration) {
+        get_joint_ptr(link)->setDrive(get_joint_axis(link), stiffness, damping, force_limit,
+                                      is_acceleration ? physx::PxArticulationDriveType::eACCELERATION
+                                                      : physx::PxArticulationDriveType::eFORCE);
+    }
+
+    void set_joint_drive_target(const ArticulationLink &link, float target) {
+        get_joint_ptr(link)->setDriveTarget(get_joint_axis(link), target);
+    }
+
+    void set_joint_drive_velocity(const ArticulationLink &link, float velocity) {
+        get_joint_ptr(link)->setDriveVelocity(get_joint_axis(link), velocity);
+    }
+
+    /** @brief Set pose of the root link. Articulation is teleported if it is in the scene. */
+    void set_root_pose(const physx::PxTransform &pose) {
+        if (is_in_scene()) {
+            get_physx_ptr()->teleportRootLink(pose, true);
+        } else {
+            const auto links = get_links_ptrs();
+            if (links.empty()) {
+                throw std::runtime_error("Articulation has no links.");
+            }
+            links[0]->setGlobalPose(pose);
+        }
+    }
+
+    /** @brief Get positions of all movable joints as float32 array. */
+    pybind11::array_t<float> get_joint_positions(const pybind11::object &out) {
+        return read_cache(out, physx::PxArticulationCache::ePOSITION);
+    }
+
+    /** @brief Get velocities of all movable joints as float32 array. */
+    pybind11::array_t<float> get_joint_velocities(const pybind11::object &out) {
+        return read_cache(out, physx::PxArticulationCache::eVELOCITY);
+    }
+
+    /** @brief Teleport joints into the given positions. If the articulation is not in the scene yet, positions are
+     * applied when it is added. */
+    void set_joint_positions(const input_float_array &positions) {
+        write_cache(positions, physx::PxArticulationCache::ePOSITION);
+    }
+
+    /** @brief Set velocities of the joints. If the articulation is not in the scene yet, velocities are applied when
+     * it is added. */
+    void set_joint_velocities(const input_float_array &velocities) {
+        write_cache(velocities, physx::PxArticulationCache::eVELOCITY);
+    }
+
+    /** @brief Get drive targets of all movable joints. */
+    pybind11::array_t<float> get_drive_targets(const pybind11::object &out) {
+        auto &data = get_data();
+        auto arr = get_output_array(out, {data.joint_links.size()});
+        auto d = arr.mutable_data();
+        pybind11::gil_scoped_release release;
+        for (size_t i = 0; i < data.joint_links.size(); ++i) {
+            d[i] = joint_of(data.joint_links[i])->getDriveTarget(data.joint_axes[i]);
+        }
+        return arr;
+    }
+
+    /** @brief Set drive targets of all movable joints. */
+    void set_drive_targets(const input_float_array &targets) {
+        const auto d = check_joints_array(targets, "Drive targets");
+        pybind11::gil_scoped_release release;
+        apply_drive_targets(d);
+    }
+
+    /** @brief Set drive velocities of all movable joints. */
+    void set_drive_velocities(const input_float_array &velocities) {
+        const auto d = check_joints_array(velocities, "Drive velocities");
+        pybind11::gil_scoped_release release;
+        apply_drive_velocities(d);
+    }
+
+    /** @brief Set drive targets from the buffer with value for each movable joint. GIL is not needed. */
+    void apply_drive_targets(const float *targets) {
+        const auto &data = get_data();
+        for (size_t i = 0; i < data.joint_links.size(); ++i) {
+            joint_of(data.joint_links[i])->setDriveTarget(data.joint_axes[i], targets[i]);
+        }
+    }
+
+    /** @brief Set drive velocities from the buffer with value for each movable joint. GIL is not needed. */
+    void apply_drive_velocities(const float *velocities) {
+        const auto &data = get_data();
+        for (size_t i = 0; i < data.joint_links.size(); ++i) {
+            joint_of(data.joint_links[i])->setDriveVelocity(data.joint_axes[i], velocities[i]);
+        }
+    }
+
+    /** @brief Create joint cache if it does not exist yet. Articulation has to be in the scene. */
+    void prepare_cache() {
+        get_cache(get_data());
+    }
+
+    /** @brief Copy joint positions (flag ePOSITION) or velocities (flag eVELOCITY) of all movable joints into the
+     * buffer. Cache has to be prepared. GIL is not needed. */
+    void copy_joint_values(physx::PxArticulationCache::Enum flag, float *out) {
+        const auto &data = get_data();
+        get_physx_ptr()->copyInternalStateToCache(*data.cache, flag);
+        const auto values = flag == physx::PxArticulationCache::ePOSITION ? data.cache->jointPosition
+                                                                          : data.cache->jointVelocity;
+        for (size_t i = 0; i < data.cache_indices.size(); ++i) {
+            out[i] = values[data.cache_indices[i]];
+        }
+    }
+
+    /** @brief Get number of floats stored by save_state: root pose (7), root linear and angular velocity (3 + 3), and
+     * position, velocity, drive target and drive velocity of each movable joint. */
+    size_t get_state_size() {
+        return 13 + 4 * get_num_joints();
+    }
+
+    /** @brief Write state of the articulation into the buffer of size get_state_size. Cache has to be prepared. GIL is
+     * not needed. */
+    void save_state(float *out) {
+        const auto &data = get_data();
+        const auto n = data.joint_links.size();
+        get_physx_ptr()->copyInternalStateToCache(*data.cache, physx::PxArticulationCache::eALL);
+        pose_to_buffer(data.cache->rootLinkData->transform, out);
+        vec3_to_buffer(data.cache->rootLinkData->worldLinVel, out + 7);
+        vec3_to_buffer(data.cache->rootLinkData->worldAngVel, out + 10);
+        out += 13;
+        for (size_t i = 0; i < n; ++i) {
+            const auto joint = joint_of(data.joint_links[i]);
+            out[i] = data.cache->jointPosition[data.cache_indices[i]];
+            out[n + i] = data.cache->jointVelocity[data.cache_indices[i]];
+            out[2 * n + i] = joint->getDriveTarget(data.joint_axes[i]);
+            out[3 * n + i] = joint->getDriveVelocity(data.joint_axes[i]);
+        }
+    }
+
+    /** @brief Apply state written by save_state. Cache has to be prepared. GIL is not needed. */
+    void restore_state(const float *in) {
+        const auto &data = get_data();
+        const auto n = data.joint_links.size();
+        get_physx_ptr()->copyInternalStateToCache(*data.cache, physx::PxArticulationCache::eALL);
+        data.cache->rootLinkData->transform = pose_from_buffer(in);
+        data.cache->rootLinkData->worldLinVel = physx::PxVec3(in[7], in[8], in[9]);
+        data.cache->rootLinkData->worldAngVel = physx::PxVec3(in[10], in[11], in[12]);
+        in += 13;
+        for (size_t i = 0; i < n; ++i) {
+            const auto joint = joint_of(data.joint_links[i]);
+            data.cache->jointPosition[data.cache_indices[i]] = in[i];
+            data.cache->jointVelocity[data.cache_indices[i]] = in[n + i];
+            joint->setDriveTarget(data.joint_axes[i], in[2 * n + i]);
+            joint->setDriveVelocity(data.joint_axes[i], in[3 * n + i]);
+        }
+        get_physx_ptr()->applyCache(*data.cache, physx::PxArticulationCache::eROOT |
+                                                 physx::PxArticulationCache::ePOSITION |
+                                                 physx::PxArticulationCache::eVELOCITY);
+    }
+
+    /** @brief Called by the scene after the articulation was added. The cache is recreated as the link indices are
+     * assigned by the scene and joint positions and velocities set before are applied. */
+    void apply_pending_state() {
+        auto &data = get_data();
+        release_cache(data);
+        if (!is_in_scene() || (data.pending_positions.empty() && data.pending_velocities.empty())) {
+            return;
+        }
+        auto cache = get_cache(data);
+        get_physx_ptr()->copyInternalStateToCache(*cache, physx::PxArticulationCache::eALL);
+        for (size_t i = 0; i < data.cache_indices.size(); ++i) {
+            if (!data.pending_positions.empty()) {
+                cache->jointPosition[data.cache_indices[i]] = data.pending_positions[i];
+            }
+            if (!data.pending_velocities.empty()) {
+                cache->jointVelocity[data.cache_indices[i]] = data.pending_velocities[i];
+            }
+        }
+        get_physx_ptr()->applyCache(*cache, physx::PxArticulationCache::ePOSITION |
+                                            physx::PxArticulationCache::eVELOCITY);
+        data.pending_positions.clear();
+        data.pending_velocities.clear();
+    }
+
+private:
+    /** @brief Get data stored in userData. Articulations created elsewhere (e.g. deserialized) get data with movable
+     * joints ordered by the creation of their links. */
+    ArticulationData &get_data() {
+        auto art = get_physx_ptr();
+        if (art->userData == nullptr) { // owned by the registry until the articulation is released
+            auto data = new ArticulationData();
+            ArticulationData::registry()[art] = std::unique_ptr<ArticulationData>(data);
+            for (const auto &link : get_links_ptrs()) {
+                const auto joint = link->getInboundJoint();
+                if (joint == nullptr) {
+                    continue;
+                }
+                const auto type = static_cast<physx::PxArticulationJointReducedCoordinate *>(joint)->getJointType();
+                if (type == physx::PxArticulationJointType::eREVOLUTE) {
+                    data->joint_links.push_back(link);
+                    data->joint_axes.push_back(physx::PxArticulationAxis::eTWIST);
+                } else if (type == physx::PxArticulationJointType::ePRISMATIC) {
+                    data->joint_links.push_back(link);
+                    data->joint_axes.push_back(physx::PxArticulationAxis::eX);
+                }
+            }
+            art->userData = data;
+        }
+        return *static_cast<ArticulationData *>(art->userData);
+    }
+
+    /** @brief Return true if both limits are finite and false if both are infinite, throw otherwise. */
+    static bool is_limited(float lower_limit, float upper_limit) {
+        const bool limited = std::isfinite(lower_limit) && std::isfinite(upper_limit);
+        if (!limited && (std::isfinite(lower_limit) || std::isfinite(upper_limit))) {
+            throw std::invalid_argument("Joint limits must be either both finite or both infinite.");
+        }
+        return limited;
+    }
+
+    std::vector<physx::PxArticulationLink *> get_links_ptrs() const {
+        const auto n = get_physx_ptr()->getNbLinks();
+        std::vector<physx::PxArticulationLink *> links(n);
+        get_physx_ptr()->getLinks(links.data(), n);
+        return links;
+    }
+
+    static physx::PxArticulationJointReducedCoordinate *joint_of(physx::PxArticulationLink *link) {
+        return static_cast<physx::PxArticulationJointReducedCoordinate *>(link->getInboundJoint());
+    }
+
+    physx::PxArticulationJointReducedCoordinate *get_joint_ptr(const ArticulationLink &link) const {
+        if (&link.get_link_ptr()->getArticulation() != get_physx_ptr()) {
+            throw std::invalid_argument("Link does not belong to the articulation.");
+        }
+        const auto joint = joint_of(link.get_link_ptr());
+        if (joint == nullptr) {
+            throw std::invalid_argument("Root link has no joint.");
+        }
+        return joint;
+    }
+
+    physx::PxArticulationAxis::Enum get_joint_axis(const ArticulationLink &link) {
+        const auto &data = get_data();
+        for (size_t i = 0; i < data.joint_links.size(); ++i) {
+            if (data.joint_links[i] == link.get_link_ptr()) {
+                return data.joint_axes[i];
+            }
+        }
+        throw std::invalid_argument("Joint of the link is not movable.");
+    }
+
+    /** @brief Check that array has a value for each movable joint and return its data. */
+    const float *check_joints_array(const input_float_array &arr, const std::string &name) {
+        const auto n = get_data().joint_links.size();
+        if (arr.ndim() != 1 || size_t(arr.shape(0)) != n) {
+            throw std::invalid_argument(name + " must have shape (" + std::to_string(n) + ",).");
+        }
+        return arr.data();
+    }
+
+    /** @brief Get joint cache, it is created together with the mapping of joints into cache arrays. Cache can be
+     * created only for articulation in the scene. */
+    physx::PxArticulationCache *get_cache(ArticulationData &data) {
+        if (data.cache != nullptr) {
+            return data.cache;
+        }
+        if (!is_in_scene()) {
+            throw std::runtime_error("Articulation is not in the scene.");
+        }
+        // cache stores joints dofs ordered by the link index assigned by the scene
+        const auto links = get_links_ptrs();
+        std::vector<size_t> dofs(links.size(), 0), offsets(links.size(), 0);
+        for (const auto &link : links) {
+            dofs[link->getLinkIndex()] = link->getInboundJointDof();
+        }
+        for (size_t i = 1; i < links.size(); ++i) {
+            offsets[i] = offsets[i - 1] + dofs[i - 1];
+        }
+        data.cache_indices.resize(data.joint_links.size());
+        for (size_t i = 0; i < data.joint_links.size(); ++i) {
+            data.cache_indices[i] = offsets[data.joint_links[i]->getLinkIndex()];
+        }
+        data.cache = get_physx_ptr()->createCache();
+        return data.cache;
+    }
+
+    void release_cache(ArticulationData &data) {
+        if (data.cache != nullptr) {
+            get_physx_ptr()->releaseCache(*data.cache);
+            data.cache = nullptr;
+        }
+    }
+
+    pybind11::array_t<float> read_cache(const pybind11::object &out, physx::PxArticulationCache::Enum flag) {
+        auto &data = get_data();
+        auto arr = get_output_array(out, {data.joint_links.size()});
+        auto d = arr.mutable_data();
+        if (!is_in_scene()) {
+            const auto &pending = flag == physx::PxArticulationCache::ePOSITION ? data.pending_positions
+                                                                                : data.pending_velocities;
+            for (size_t i = 0; i < data.joint_links.size(); ++i) {
+                d[i] = pending.empty() ? 0.f : pending[i];
+            }
+            return arr;
+        }
+        prepare_cache();
+        pybind11::gil_scoped_release release;
+        copy_joint_values(flag, d);
+        return arr;
+    }
+
+    void write_cache(const input_float_array &arr, physx::PxArticulationCache::Enum flag) {
+        auto &data = get_data();
+        const bool positions = flag == physx::PxArticulationCache::ePOSITION;
+        const auto d = check_joints_array(arr, positions ? "Joint positions" : "Joint velocities");
+        if (!is_in_scene()) {
+            (positions ? data.pending_positions : data.pending_velocities).assign(d, d + data.joint_links.size());
+            return;
+        }
+        auto cache = get_cache(data);
+        pybind11::gil_scoped_release release;
+        get_physx_ptr()->copyInternalStateToCache(*cache, flag);
+        auto values = positions ? cache->jointPosition : cache->jointVelocity;
+        for (size_t i = 0; i < data.cache_indices.size(); ++i) {
+            values[data.cache_indices[i]] = d[i];
+        }
+        get_physx_ptr()->applyCache(*cache, flag);
+    }
+};
+
+#endif //PYPHYSX_ARTICULATION_H
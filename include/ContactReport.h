@@ -0,0 +1,146 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Contact reporting for scenes. Contacts are collected by the simulation event callback during fetchResults into
+ *     a fixed size ring buffer and are converted into a single structured numpy array on request.
+ */
+
+#ifndef PYPHYSX_CONTACTREPORT_H
+#define PYPHYSX_CONTACTREPORT_H
+
+#include <PxPhysicsAPI.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <array_utils.h>
+#include <cstddef>
+#include <unordered_map>
+#include <vector>
+
+/** @brief Filter shader that behaves as the default one and additionally requests contact points reports for all
+ * touching pairs that are not triggers. */
+inline physx::PxFilterFlags contact_report_filter_shader(
+        physx::PxFilterObjectAttributes attributes0, physx::PxFilterData filter_data0,
+        physx::PxFilterObjectAttributes attributes1, physx::PxFilterData filter_data1,
+        physx::PxPairFlags &pair_flags, const void *constant_block, physx::PxU32 constant_block_size) {
+    using namespace physx;
+    const auto flags = PxDefaultSimulationFilterShader(attributes0, filter_data0, attributes1, filter_data1,
+                                                       pair_flags, constant_block, constant_block_size);
+    if (!PxFilterObjectIsTrigger(attributes0) && !PxFilterObjectIsTrigger(attributes1)) {
+        pair_flags |= PxPairFlag::eNOTIFY_TOUCH_FOUND | PxPairFlag::eNOTIFY_TOUCH_PERSISTS |
+                      PxPairFlag::eNOTIFY_CONTACT_POINTS;
+    }
+    return flags;
+}
+
+/** @brief Contact row of the array returned to python. Layout corresponds to the numpy dtype from get_dtype. */
+struct ContactData {
+    int64_t actor0;
+    int64_t actor1;
+    float position[3];
+    float normal[3];
+    float impulse[3];
+    float separation;
+};
+
+class ContactReport : public physx::PxSimulationEventCallback {
+public:
+    explicit ContactReport(size_t buffer_size) : buffer(buffer_size) {}
+
+    void onContact(const physx::PxContactPairHeader &pair_header, const physx::PxContactPair *pairs,
+                   physx::PxU32 nb_pairs) override {
+        using namespace physx;
+        if (pair_header.flags & (PxContactPairHeaderFlag::eREMOVED_ACTOR_0 |
+                                 PxContactPairHeaderFlag::eREMOVED_ACTOR_1)) {
+            return;
+        }
+        for (PxU32 i = 0; i < nb_pairs; ++i) {
+            const auto &pair = pairs[i];
+            if (pair.contactCount == 0) {
+                continue;
+            }
+            points.resize(pair.contactCount);
+            const auto n = pair.extractContacts(points.data(), PxU32(points.size()));
+            for (PxU32 j = 0; j < n; ++j) {
+                push(Contact{pair_header.actors[0], pair_header.actors[1], points[j]});
+            }
+        }
+    }
+
+    void onConstraintBreak(physx::PxConstraintInfo *, physx::PxU32) override {}
+
+    void onWake(physx::PxActor **, physx::PxU32) override {}
+
+    void onSleep(physx::PxActor **, physx::PxU32) override {}
+
+    void onTrigger(physx::PxTriggerPair *, physx::PxU32) override {}
+
+    void onAdvance(const physx::PxRigidBody *const *, const physx::PxTransform *, const physx::PxU32) override {}
+
+    /** @brief Convert collected contacts into structured array and clear the buffer. Actors are represented by their
+     * index in the given map, -2 is used for actors that are not in the map (e.g. static actors). */
+    pybind11::array get_contacts(const std::unordered_map<const physx::PxRigidActor *, int64_t> &indices) {
+        pybind11::array arr(get_dtype(), std::vector<size_t>{count});
+        auto data = static_cast<ContactData *>(arr.mutable_data());
+        for (size_t i = 0; i < count; ++i) {
+            const auto &c = buffer[(start + i) % buffer.size()];
+            auto &row = data[i];
+            const auto it0 = indices.find(c.actor0);
+            const auto it1 = indices.find(c.actor1);
+            row.actor0 = it0 == indices.end() ? -2 : it0->second;
+            row.actor1 = it1 == indices.end() ? -2 : it1->second;
+            vec3_to_buffer(c.point.position, row.position);
+            vec3_to_buffer(c.point.normal, row.normal);
+            vec3_to_buffer(c.point.impulse, row.impulse);
+            row.separation = c.point.separation;
+        }
+        start = 0;
+        count = 0;
+        num_dropped = 0;
+        return arr;
+    }
+
+    /** @brief Number of contacts overwritten since the last get_contacts because the buffer was full. */
+    size_t get_num_dropped() const {
+        return num_dropped;
+    }
+
+    static pybind11::dtype get_dtype() {
+        pybind11::dict d;
+        d["names"] = pybind11::make_tuple("actor0", "actor1", "position", "normal", "impulse", "separation");
+        d["formats"] = pybind11::make_tuple("<i8", "<i8", "(3,)<f4", "(3,)<f4", "(3,)<f4", "<f4");
+        d["offsets"] = pybind11::make_tuple(offsetof(ContactData, actor0), offsetof(ContactData, actor1),
+                                            offsetof(ContactData, position), offsetof(ContactData, normal),
+                                            offsetof(ContactData, impulse), offsetof(ContactData, separation));
+        d["itemsize"] = sizeof(ContactData);
+        return pybind11::dtype::from_args(d);
+    }
+
+private:
+    struct Contact {
+        const physx::PxRigidActor *actor0;
+        const physx::PxRigidActor *actor1;
+        physx::PxContactPairPoint point;
+    };
+
+    /** @brief Store contact into the ring buffer, the oldest contact is overwritten if the buffer is full. */
+    void push(const Contact &c) {
+        if (count < buffer.size()) {
+            buffer[(start + count) % buffer.size()] = c;
+            ++count;
+        } else {
+            buffer[start] = c;
+            start = (start + 1) % buffer.size();
+            ++num_dropped;
+        }
+    }
+
+    std::vector<Contact> buffer;
+    size_t start = 0;
+    size_t count = 0;
+    size_t num_dropped = 0;
+    std::vector<physx::PxContactPairPoint> points;
+};
+
+#endif //PYPHYSX_CONTACTREPORT_H
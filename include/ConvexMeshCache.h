@@ -0,0 +1,253 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     In-process cache of cooked convex meshes. Meshes are identified by the hash of the input points and cooking
+ *     parameters, so the identical hulls (e.g. links of the same robot loaded multiple times) are cooked only once and
+ *     share a single PxConvexMesh. The cache is bounded and the least recently used meshes are evicted first.
+ *     Optionally, cooked meshes are also stored in a content-addressed directory shared between processes, so that
+ *     other processes load them through memory mapped files instead of cooking.
+ *     Implements singleton pattern in the same way as Physics.
+ */
+
+#ifndef PYPHYSX_CONVEXMESHCACHE_H
+#define PYPHYSX_CONVEXMESHCACHE_H
+
+#include <PxPhysicsAPI.h>
+#include <Physics.h>
+#include <MappedFile.h>
+#include <pybind11/pybind11.h>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <fstream>
+#include <list>
+#include <random>
+#include <stdexcept>
+#include <string>
+#include <unordered_map>
+#include <vector>
+#include <sys/stat.h>
+
+class ConvexMeshCache {
+public:
+    static ConvexMeshCache &get() {
+        static ConvexMeshCache instance;
+        return instance;
+    }
+
+    ConvexMeshCache(ConvexMeshCache const &) = delete;
+
+    void operator=(ConvexMeshCache const &) = delete;
+
+    virtual ~ConvexMeshCache() {
+        clear();
+    }
+
+    /** @brief Return cached mesh for the given points and cooking parameters or nullptr if it is not cached. */
+    physx::PxConvexMesh *find(const std::vector<physx::PxVec3> &points, size_t quantized_count, size_t vertex_limit) {
+        const auto key = compute_hash(points, quantized_count, vertex_limit);
+        const auto it = index.find(key);
+        if (it == index.end() || !it->second->matches(points, quantized_count, vertex_limit)) {
+            ++num_misses;
+            return nullptr;
+        }
+        entries.splice(entries.begin(), entries, it->second); // mark as the most recently used
+        ++num_hits;
+        return it->second->mesh;
+    }
+
+    /** @brief Store mesh in the cache. Cache takes over the reference of the mesh and releases it on eviction. */
+    void insert(const std::vector<physx::PxVec3> &points, size_t quantized_count, size_t vertex_limit,
+                physx::PxConvexMesh *mesh) {
+        if (max_size == 0) {
+            mesh->release();
+            return;
+        }
+        const auto key = compute_hash(points, quantized_count, vertex_limit);
+        const auto it = index.find(key);
+        if (it != index.end()) { // hash collision, replace the old entry
+            it->second->mesh->release();
+            entries.erase(it->second);
+            index.erase(it);
+        }
+        entries.push_front(Entry{key, points, quantized_count, vertex_limit, mesh});
+        index[key] = entries.begin();
+        evict(max_size);
+    }
+
+    /** @brief Load cooked mesh from the cache directory. Return nullptr if directory is not set or the mesh is not
+     * stored there. File contains number of points, points, and the cooked data; points are compared to detect
+     * hash collisions. */
+    physx::PxConvexMesh *load_from_disk(const std::vector<physx::PxVec3> &points, size_t quantized_count,
+                                        size_t vertex_limit) {
+        if (cache_dir.empty()) {
+            return nullptr;
+        }
+        const MappedFile file(get_file_path(points, quantized_count, vertex_limit));
+        const auto header_size = sizeof(uint64_t) + points.size() * sizeof(physx::PxVec3);
+        if (file.data() == nullptr || file.size() <= header_size) {
+            return nullptr;
+        }
+        uint64_t n;
+        std::memcpy(&n, file.data(), sizeof(n));
+        if (n != points.size() ||
+            std::memcmp(file.data() + sizeof(n), points.data(), points.size() * sizeof(physx::PxVec3)) != 0) {
+            return nullptr;
+        }
+        physx::PxDefaultMemoryInputData input(const_cast<uint8_t *>(file.data() + header_size),
+                                              physx::PxU32(file.size() - header_size));
+        auto mesh = Physics::get_physics()->createConvexMesh(input);
+        if (mesh != nullptr) {
+            ++num_disk_hits;
+        }
+        return mesh;
+    }
+
+    /** @brief Store cooked data into the cache directory. File is written under temporary name and renamed
+     * afterwards, so concurrent processes never read partially written file. */
+    void save_to_disk(const std::vector<physx::PxVec3> &points, size_t quantized_count, size_t vertex_limit,
+                      const uint8_t *data, size_t size) {
+        if (cache_dir.empty()) {
+            return;
+        }
+        const auto path = get_file_path(points, quantized_count, vertex_limit);
+        const auto tmp_path = path + ".tmp" + std::to_string(std::random_device()());
+        {
+            std::ofstream f(tmp_path, std::ios::binary);
+            const uint64_t n = points.size();
+            f.write(reinterpret_cast<const char *>(&n), sizeof(n));
+            f.write(reinterpret_cast<const char *>(points.data()), points.size() * sizeof(physx::PxVec3));
+            f.write(reinterpret_cast<const char *>(data), size);
+            if (!f) {
+                f.close();
+                std::remove(tmp_path.c_str());
+                return;
+            }
+        }
+        if (std::rename(tmp_path.c_str(), path.c_str()) != 0) {
+            std::remove(tmp_path.c_str()); // file was stored by other process in the meantime
+        }
+    }
+
+    /** @brief Release all cached meshes. Meshes used by existing shapes stay valid. */
+    void clear() {
+        evict(0);
+    }
+
+    static void set_max_size(size_t max_size) {
+        ConvexMeshCache::get().max_size = max_size;
+        ConvexMeshCache::get().evict(max_size);
+    }
+
+    static size_t get_max_size() {
+        return ConvexMeshCache::get().max_size;
+    }
+
+    /** @brief Set existing directory used for persistent storage of cooked meshes. Empty string disables it. */
+    static void set_cache_dir(const std::string &path) {
+        struct stat st{};
+        if (!path.empty() && (stat(path.c_str(), &st) != 0 || (st.st_mode & S_IFDIR) == 0)) {
+            throw std::invalid_argument("Cache directory " + path + " does not exist.");
+        }
+        ConvexMeshCache::get().cache_dir = path;
+    }
+
+    static std::string get_cache_dir() {
+        return ConvexMeshCache::get().cache_dir;
+    }
+
+    static void clear_cache() {
+        ConvexMeshCache::get().clear();
+    }
+
+    static void reset_statistics() {
+        ConvexMeshCache::get().num_hits = 0;
+        ConvexMeshCache::get().num_misses = 0;
+        ConvexMeshCache::get().num_disk_hits = 0;
+    }
+
+    /** @brief Get dictionary with number of hits, misses, meshes loaded from disk, cached meshes and the maximum size
+     * of the cache. */
+    static pybind11::dict get_statistics() {
+        const auto &cache = ConvexMeshCache::get();
+        pybind11::dict stats;
+        stats["hits"] = cache.num_hits;
+        stats["misses"] = cache.num_misses;
+        stats["disk_hits"] = cache.num_disk_hits;
+        stats["size"] = cache.entries.size();
+        stats["max_size"] = cache.max_size;
+        return stats;
+    }
+
+private:
+    ConvexMeshCache() {
+        Physics::get(); // ensure physics outlives the cache, cached meshes are released in the destructor
+        const auto dir = std::getenv("PYPHYSX_CONVEX_MESH_CACHE_DIR");
+        if (dir != nullptr) {
+            cache_dir = dir;
+        }
+    }
+
+    struct Entry {
+        uint64_t key;
+        std::vector<physx::PxVec3> points;
+        size_t quantized_count;
+        size_t vertex_limit;
+        physx::PxConvexMesh *mesh;
+
+        bool matches(const std::vector<physx::PxVec3> &other_points, size_t other_quantized_count,
+                     size_t other_vertex_limit) const {
+            return quantized_count == other_quantized_count && vertex_limit == other_vertex_limit &&
+                   points.size() == other_points.size() &&
+                   std::memcmp(points.data(), other_points.data(), points.size() * sizeof(physx::PxVec3)) == 0;
+        }
+    };
+
+    /** @brief FNV-1a hash of the points data and cooking parameters. */
+    static uint64_t compute_hash(const std::vector<physx::PxVec3> &points, size_t quantized_count,
+                                 size_t vertex_limit) {
+        uint64_t hash = 14695981039346656037ULL;
+        const auto add_bytes = [&hash](const void *data, size_t size) {
+            const auto bytes = static_cast<const uint8_t *>(data);
+            for (size_t i = 0; i < size; ++i) {
+                hash = (hash ^ bytes[i]) * 1099511628211ULL;
+            }
+        };
+        add_bytes(points.data(), points.size() * sizeof(physx::PxVec3));
+        add_bytes(&quantized_count, sizeof(quantized_count));
+        add_bytes(&vertex_limit, sizeof(vertex_limit));
+        return hash;
+    }
+
+    /** @brief Path of the file in cache directory. File name contains PhysX version as cooked format depends on it. */
+    std::string get_file_path(const std::vector<physx::PxVec3> &points, size_t quantized_count,
+                              size_t vertex_limit) const {
+        char name[64];
+        std::snprintf(name, sizeof(name), "%016llx_%x.convex",
+                      static_cast<unsigned long long>(compute_hash(points, quantized_count, vertex_limit)),
+                      unsigned(PX_PHYSICS_VERSION));
+        return cache_dir + "/" + name;
+    }
+
+    /** @brief Release the least recently used meshes until at most n meshes remain in the cache. */
+    void evict(size_t n) {
+        while (entries.size() > n) {
+            entries.back().mesh->release();
+            index.erase(entries.back().key);
+            entries.pop_back();
+        }
+    }
+
+    std::list<Entry> entries;
+    std::unordered_map<uint64_t, std::list<Entry>::iterator> index;
+    size_t max_size = 1024;
+    size_t num_hits = 0;
+    size_t num_misses = 0;
+    size_t num_disk_hits = 0;
+    std::string cache_dir;
+};
+
+#endif //PYPHYSX_CONVEXMESHCACHE_H
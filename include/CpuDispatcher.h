@@ -0,0 +1,116 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     CPU dispatchers that run simulation tasks of scenes. Either PhysX default dispatcher with its own worker threads
+ *     (optionally bound to cores by affinity masks) or dispatcher that submits tasks to python executor, e.g.
+ *     concurrent.futures.ThreadPoolExecutor.
+ */
+
+#ifndef PYPHYSX_CPUDISPATCHER_H
+#define PYPHYSX_CPUDISPATCHER_H
+
+#include <PxPhysicsAPI.h>
+#include <Physics.h>
+#include <pybind11/pybind11.h>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+/** @brief Dispatcher that runs tasks by the python executor. Each task is submitted as a callable that releases GIL
+ * while the task is running. If the executor fails to accept the task (e.g. it was shut down), the task is run in the
+ * calling thread so that the simulation step finishes, and the error is reported by check_error. */
+class PythonExecutorDispatcher : public physx::PxCpuDispatcher {
+public:
+    PythonExecutorDispatcher(pybind11::object executor, size_t num_workers) : executor(std::move(executor)),
+                                                                              num_workers(num_workers) {}
+
+    ~PythonExecutorDispatcher() override {
+        if (Py_IsInitialized()) {
+            pybind11::gil_scoped_acquire acquire;
+            executor = pybind11::object();
+        } else {
+            executor.release();
+        }
+    }
+
+    void submitTask(physx::PxBaseTask &task) override {
+        {
+            pybind11::gil_scoped_acquire acquire;
+            try {
+                executor.attr("submit")(pybind11::cpp_function([&task]() {
+                    pybind11::gil_scoped_release release;
+                    task.run();
+                    task.release();
+                }));
+                return;
+            } catch (pybind11::error_already_set &e) { // exception cannot be propagated through PhysX task manager
+                error = e.what();
+            }
+        }
+        task.run();
+        task.release();
+    }
+
+    /** @brief Throw runtime error if the executor failed to accept some tasks since the last check. GIL is needed. */
+    void check_error() {
+        if (!error.empty()) {
+            const auto msg = error;
+            error.clear();
+            throw std::runtime_error("Executor failed to run simulation tasks, they were run in the simulating "
+                                     "thread instead: " + msg);
+        }
+    }
+
+    physx::PxU32 getWorkerCount() const override {
+        return physx::PxU32(num_workers);
+    }
+
+private:
+    pybind11::object executor;
+    size_t num_workers;
+    std::string error; // modified with GIL only
+};
+
+class CpuDispatcher {
+public:
+    CpuDispatcher(size_t num_threads, const std::vector<uint32_t> &affinity_masks) :
+            dispatcher(Physics::create_cpu_dispatcher(num_threads, affinity_masks)) {}
+
+    explicit CpuDispatcher(std::shared_ptr<physx::PxCpuDispatcher> dispatcher) : dispatcher(std::move(dispatcher)) {}
+
+    /** @brief Create dispatcher that runs tasks on the python executor (e.g. ThreadPoolExecutor). Number of workers
+     * of the executor is reported to PhysX to split the work, it has to be positive. */
+    static CpuDispatcher from_executor(const pybind11::object &executor, size_t num_workers) {
+        if (!pybind11::hasattr(executor, "submit")) {
+            throw std::invalid_argument("Executor must implement submit method.");
+        }
+        if (num_workers == 0) {
+            throw std::invalid_argument("Number of workers of the executor must be positive.");
+        }
+        return CpuDispatcher(std::make_shared<PythonExecutorDispatcher>(executor, num_workers));
+    }
+
+    size_t get_num_threads() const {
+        return dispatcher->getWorkerCount();
+    }
+
+    const std::shared_ptr<physx::PxCpuDispatcher> &get_dispatcher() const {
+        return dispatcher;
+    }
+
+    /** @brief Throw runtime error if the dispatcher is backed by python executor that failed to run some tasks. */
+    void check_error() const {
+        const auto executor_dispatcher = dynamic_cast<PythonExecutorDispatcher *>(dispatcher.get());
+        if (executor_dispatcher != nullptr) {
+            executor_dispatcher->check_error();
+        }
+    }
+
+private:
+    std::shared_ptr<physx::PxCpuDispatcher> dispatcher;
+};
+
+#endif //PYPHYSX_CPUDISPATCHER_H
@@ -0,0 +1,111 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Joint space controller that is stepped natively by the scene before every simulation substep. Commanded
+ *     positions are integrated from the commanded velocities, clamped to the joint limits, and written into the drive
+ *     targets of the joints, i.e. the same logic as in TreeRobot.update.
+ */
+
+#ifndef PYPHYSX_JOINTCONTROLLER_H
+#define PYPHYSX_JOINTCONTROLLER_H
+
+#include <JointGroup.h>
+#include <Articulation.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <algorithm>
+#include <cstring>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+class JointController {
+public:
+    /** @brief Create controller of D6 joints in the group. State is 4xN float64 array with commanded positions,
+     * commanded velocities, lower limits, and upper limits that is modified in place. */
+    JointController(const JointGroup &group, const pybind11::object &state) :
+            group(std::make_shared<JointGroup>(group)) {
+        set_state(state, group.get_num_joints());
+    }
+
+    /** @brief Create controller of movable joints of the articulation. */
+    JointController(const Articulation &articulation, const pybind11::object &state) :
+            articulation(std::make_shared<Articulation>(articulation)) {
+        set_state(state, this->articulation->get_num_joints());
+    }
+
+    size_t get_num_joints() const {
+        return targets.size();
+    }
+
+    /** @brief Integrate commanded positions for the time dt, clamp them to the limits, and set the drive targets.
+     * Unbounded limits are -inf and inf. GIL is not needed. */
+    void step(double dt) {
+        const auto n = targets.size();
+        double *q = static_cast<double *>(state.mutable_data());
+        const double *dq = q + n, *lower = q + 2 * n, *upper = q + 3 * n;
+        for (size_t i = 0; i < n; ++i) {
+            const auto v = std::min(std::max(q[i] + dq[i] * dt, lower[i]), upper[i]);
+            q[i] = v;
+            targets[i] = float(v);
+        }
+        apply_targets();
+    }
+
+    /** @brief Set commanded positions from the buffer and apply them as drive targets, commanded velocities and
+     * limits are not changed. GIL is not needed. */
+    void apply_commanded_positions(const float *positions) {
+        double *q = static_cast<double *>(state.mutable_data());
+        for (size_t i = 0; i < targets.size(); ++i) {
+            q[i] = positions[i];
+            targets[i] = positions[i];
+        }
+        apply_targets();
+    }
+
+    /** @brief Number of floats needed to store commanded positions and velocities, stored as float64 values. */
+    size_t get_state_size() const {
+        return 2 * targets.size() * sizeof(double) / sizeof(float);
+    }
+
+    /** @brief Store commanded positions and velocities into the buffer of get_state_size floats. GIL is not needed. */
+    void save_state(float *d) const {
+        std::memcpy(d, state.data(), 2 * targets.size() * sizeof(double));
+    }
+
+    /** @brief Restore commanded positions and velocities from the buffer filled by save_state. Drive targets and
+     * limits are not changed. GIL is not needed. */
+    void restore_state(const float *d) {
+        std::memcpy(state.mutable_data(), d, 2 * targets.size() * sizeof(double));
+    }
+
+private:
+    void apply_targets() {
+        if (group != nullptr) {
+            group->apply_drive_positions(targets.data());
+        } else {
+            articulation->apply_drive_targets(targets.data());
+        }
+    }
+
+    void set_state(const pybind11::object &s, size_t n) {
+        if (!pybind11::isinstance<pybind11::array_t<double, pybind11::array::c_style>>(s)) {
+            throw std::invalid_argument("State must be C-contiguous numpy array of type float64.");
+        }
+        state = pybind11::reinterpret_borrow<pybind11::array>(s);
+        if (!state.writeable() || state.ndim() != 2 || state.shape(0) != 4 || size_t(state.shape(1)) != n) {
+            throw std::invalid_argument("State must be writable array of shape (4, " + std::to_string(n) + ").");
+        }
+        targets.resize(n);
+    }
+
+    std::shared_ptr<JointGroup> group;
+    std::shared_ptr<Articulation> articulation;
+    pybind11::array state;
+    std::vector<float> targets;
+};
+
+#endif //PYPHYSX_JOINTCONTROLLER_H
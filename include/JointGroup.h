@@ -0,0 +1,154 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Group of D6 joints with a single degree of freedom, i.e. revolute joints rotating about x-axis (twist) or
+ *     prismatic joints translating along x-axis of the joint frame, as used by TreeRobot. Values of all joints are
+ *     exchanged with numpy arrays ordered as the joints of the group. Measured positions and velocities are projected
+ *     onto the joint axis, i.e. twist angle and angular velocity about x-axis for revolute and x-coordinate and linear
+ *     velocity along x-axis for prismatic joints.
+ */
+
+#ifndef PYPHYSX_JOINTGROUP_H
+#define PYPHYSX_JOINTGROUP_H
+
+#include <PxPhysicsAPI.h>
+#include <D6Joint.h>
+#include <array_utils.h>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+class JointGroup {
+public:
+    JointGroup(const std::vector<D6Joint> &joints, const std::vector<std::string> &joint_types) {
+        if (joints.size() != joint_types.size()) {
+            throw std::invalid_argument("Joint type has to be specified for each joint.");
+        }
+        for (size_t i = 0; i < joints.size(); ++i) {
+            if (joint_types[i] != "revolute" && joint_types[i] != "prismatic") {
+                throw std::invalid_argument("Unsupported joint type '" + joint_types[i] + "', use revolute or "
+                                                                                          "prismatic.");
+            }
+            this->joints.push_back(joints[i].get_physx_ptr());
+            revolute.push_back(joint_types[i] == "revolute");
+        }
+    }
+
+    size_t get_num_joints() const {
+        return joints.size();
+    }
+
+    /** @brief Set drive position of all joints from the joint values, i.e. rotation about x-axis for revolute and
+     * translation along x-axis for prismatic joints. */
+    void set_drive_positions(const input_float_array &positions) {
+        const auto d = check_joints_array(positions, "Drive positions");
+        pybind11::gil_scoped_release release;
+        apply_drive_positions(d);
+    }
+
+    /** @brief Set drive velocity of all joints, i.e. angular velocity about x-axis for revolute and linear velocity
+     * along x-axis for prismatic joints. */
+    void set_drive_velocities(const input_float_array &velocities) {
+        const auto d = check_joints_array(velocities, "Drive velocities");
+        pybind11::gil_scoped_release release;
+        apply_drive_velocities(d);
+    }
+
+    /** @brief Set drive positions from the buffer with value for each joint. GIL is not needed. */
+    void apply_drive_positions(const float *positions) const {
+        for (size_t i = 0; i < joints.size(); ++i) {
+            joints[i]->setDrivePosition(
+                    revolute[i] ? physx::PxTransform(physx::PxQuat(positions[i], physx::PxVec3(1, 0, 0)))
+                                : physx::PxTransform(physx::PxVec3(positions[i], 0, 0)));
+        }
+    }
+
+    /** @brief Set drive velocities from the buffer with value for each joint. GIL is not needed. */
+    void apply_drive_velocities(const float *velocities) const {
+        for (size_t i = 0; i < joints.size(); ++i) {
+            const physx::PxVec3 v(velocities[i], 0, 0);
+            joints[i]->setDriveVelocity(revolute[i] ? physx::PxVec3(0.f) : v, revolute[i] ? v : physx::PxVec3(0.f));
+        }
+    }
+
+    /** @brief Get measured positions of all joints. */
+    pybind11::array_t<float> get_positions(const pybind11::object &out) const {
+        auto arr = get_output_array(out, {joints.size()});
+        auto d = arr.mutable_data();
+        pybind11::gil_scoped_release release;
+        copy_positions(d);
+        return arr;
+    }
+
+    /** @brief Get measured velocities of all joints. */
+    pybind11::array_t<float> get_velocities(const pybind11::object &out) const {
+        auto arr = get_output_array(out, {joints.size()});
+        auto d = arr.mutable_data();
+        pybind11::gil_scoped_release release;
+        copy_velocities(d);
+        return arr;
+    }
+
+    /** @brief Get tuple (positions N, velocities N, forces Nx3, torques Nx3) of all joints. Forces and torques are
+     * the constraint forces most recently applied to maintain the joints, as in D6Joint.get_force_torque. */
+    pybind11::tuple get_state() const {
+        const auto n = joints.size();
+        pybind11::array_t<float> positions(n), velocities(n), forces(std::vector<size_t>{n, 3}),
+                torques(std::vector<size_t>{n, 3});
+        auto p = positions.mutable_data();
+        auto v = velocities.mutable_data();
+        auto f = forces.mutable_data();
+        auto t = torques.mutable_data();
+        {
+            pybind11::gil_scoped_release release;
+            for (size_t i = 0; i < n; ++i) {
+                p[i] = get_position(i);
+                v[i] = get_velocity(i);
+                physx::PxVec3 force, torque;
+                joints[i]->getConstraint()->getForce(force, torque);
+                vec3_to_buffer(force, f + 3 * i);
+                vec3_to_buffer(torque, t + 3 * i);
+            }
+        }
+        return pybind11::make_tuple(positions, velocities, forces, torques);
+    }
+
+    /** @brief Write measured positions of all joints into the buffer. GIL is not needed. */
+    void copy_positions(float *out) const {
+        for (size_t i = 0; i < joints.size(); ++i) {
+            out[i] = get_position(i);
+        }
+    }
+
+    /** @brief Write measured velocities of all joints into the buffer. GIL is not needed. */
+    void copy_velocities(float *out) const {
+        for (size_t i = 0; i < joints.size(); ++i) {
+            out[i] = get_velocity(i);
+        }
+    }
+
+private:
+    float get_position(size_t i) const {
+        return revolute[i] ? joints[i]->getTwistAngle() : joints[i]->getRelativeTransform().p.x;
+    }
+
+    /** @brief Relative velocity is expressed in the joint frame of the first actor. */
+    float get_velocity(size_t i) const {
+        return revolute[i] ? joints[i]->getRelativeAngularVelocity().x : joints[i]->getRelativeLinearVelocity().x;
+    }
+
+    /** @brief Check that array has a value for each joint and return its data. */
+    const float *check_joints_array(const input_float_array &arr, const std::string &name) const {
+        if (arr.ndim() != 1 || size_t(arr.shape(0)) != joints.size()) {
+            throw std::invalid_argument(name + " must have shape (" + std::to_string(joints.size()) + ",).");
+        }
+        return arr.data();
+    }
+
+    std::vector<physx::PxD6Joint *> joints;
+    std::vector<bool> revolute;
+};
+
+#endif //PYPHYSX_JOINTGROUP_H
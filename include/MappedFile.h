@@ -0,0 +1,93 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ */
+
+#ifndef PYPHYSX_MAPPEDFILE_H
+#define PYPHYSX_MAPPEDFILE_H
+
+#include <algorithm>
+#include <cstdint>
+#include <fstream>
+#include <string>
+#include <vector>
+#include <sys/stat.h>
+
+#if defined(_WIN64) || defined(_WIN32)
+#include <iterator>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <unistd.h>
+#endif
+
+/** @brief Memory mapped file. If copy_on_write is true, the mapped memory is writable and the modifications are
+ * private to the mapping, i.e. the file itself is never modified. Falls back to reading the whole file on Windows.
+ * Data are aligned to at least 128 bytes. */
+class MappedFile {
+public:
+    explicit MappedFile(const std::string &path, bool copy_on_write = false) {
+#if defined(_WIN64) || defined(_WIN32)
+        std::ifstream f(path, std::ios::binary);
+        if (f) {
+            const std::vector<char> content((std::istreambuf_iterator<char>(f)), std::istreambuf_iterator<char>());
+            buffer.resize(content.size() + alignment);
+            const auto offset = (alignment - reinterpret_cast<uintptr_t>(buffer.data()) % alignment) % alignment;
+            ptr = buffer.data() + offset;
+            std::copy(content.begin(), content.end(), ptr);
+            length = content.size();
+        }
+#else
+        const auto fd = open(path.c_str(), O_RDONLY);
+        if (fd < 0) {
+            return;
+        }
+        struct stat st{};
+        if (fstat(fd, &st) == 0 && st.st_size > 0) {
+            const auto prot = copy_on_write ? PROT_READ | PROT_WRITE : PROT_READ;
+            auto mapped = mmap(nullptr, size_t(st.st_size), prot, MAP_PRIVATE, fd, 0);
+            if (mapped != MAP_FAILED) {
+                ptr = static_cast<uint8_t *>(mapped);
+                length = size_t(st.st_size);
+            }
+        }
+        close(fd);
+#endif
+    }
+
+    MappedFile(MappedFile const &) = delete;
+
+    void operator=(MappedFile const &) = delete;
+
+    virtual ~MappedFile() {
+#if !defined(_WIN64) && !defined(_WIN32)
+        if (ptr != nullptr) {
+            munmap(ptr, length);
+        }
+#endif
+    }
+
+    const uint8_t *data() const {
+        return ptr;
+    }
+
+    /** @brief Writable data, valid only if the file was mapped with copy_on_write. */
+    uint8_t *mutable_data() {
+        return ptr;
+    }
+
+    size_t size() const {
+        return length;
+    }
+
+private:
+    static constexpr size_t alignment = 128;
+    uint8_t *ptr = nullptr;
+    size_t length = 0;
+#if defined(_WIN64) || defined(_WIN32)
+    std::vector<uint8_t> buffer;
+#endif
+};
+
+#endif //PYPHYSX_MAPPEDFILE_H
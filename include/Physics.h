@@ -11,6 +11,10 @@
 #define SIM_PHYSX_PHYSICS_H
 
 #include <PxPhysicsAPI.h>
+#include <cstdint>
+#include <memory>
+#include <stdexcept>
+#include <vector>
 
 class Physics {
 
@@ -38,9 +42,61 @@ public:
 #endif
     }
 
-    /** @brief Set number of CPU used for all scenes computation. */
-    static void set_num_cpu(int num_cpu) {
-        Physics::get().dispatcher = physx::PxDefaultCpuDispatcherCreate(num_cpu);
+    /** @brief Create CPU dispatcher with given number of worker threads. If affinity masks are not empty, i-th worker
+     * thread is bound to the cores given by i-th mask. The dispatcher is released when it is not referenced anymore. */
+    static std::shared_ptr<physx::PxCpuDispatcher> create_cpu_dispatcher(size_t num_threads,
+                                                                         const std::vector<uint32_t> &affinity_masks) {
+        if (!affinity_masks.empty() && affinity_masks.size() != num_threads) {
+            throw std::invalid_argument("Number of affinity masks must be equal to the number of threads.");
+        }
+        auto masks = affinity_masks;
+        const auto dispatcher = physx::PxDefaultCpuDispatcherCreate(num_threads, masks.empty() ? nullptr : masks.data());
+        return std::shared_ptr<physx::PxCpuDispatcher>(dispatcher, [](physx::PxCpuDispatcher *d) {
+            if (!is_released()) { // otherwise it was released together with foundation
+                static_cast<physx::PxDefaultCpuDispatcher *>(d)->release();
+            }
+        });
+    }
+
+    /** @brief Set number of CPU used for computation of scenes created afterwards. Superseded dispatcher is released
+     * as soon as it is not used by any scene. */
+    static void set_num_cpu(int num_cpu, const std::vector<uint32_t> &affinity_masks) {
+        set_dispatcher(create_cpu_dispatcher(num_cpu, affinity_masks));
+    }
+
+    /** @brief Set dispatcher used by scenes created afterwards unless they specify their own dispatcher. */
+    static void set_dispatcher(std::shared_ptr<physx::PxCpuDispatcher> dispatcher) {
+        Physics::get().dispatcher = std::move(dispatcher);
+    }
+
+    /** @brief Keep dispatcher alive as long as the scene that uses it exists, i.e. until the physics is released. */
+    static void register_scene_dispatcher(std::shared_ptr<physx::PxCpuDispatcher> dispatcher) {
+        auto &dispatchers = Physics::get().scene_dispatchers;
+        for (const auto &d : dispatchers) {
+            if (d == dispatcher) {
+                return;
+            }
+        }
+        dispatchers.push_back(std::move(dispatcher));
+    }
+
+    /** @brief Return true if the physics singleton was already destroyed, i.e. at the exit of the process. */
+    static bool is_released() {
+        return released_flag();
+    }
+
+    /** @brief Get serialization registry, created on the first use. */
+    static auto get_serialization_registry() {
+        auto &p = Physics::get();
+        if (p.serialization_registry == nullptr) {
+            p.serialization_registry = physx::PxSerialization::createSerializationRegistry(*p.physics);
+        }
+        return p.serialization_registry;
+    }
+
+    /** @brief Keep memory alive until the physics is released, e.g. memory of deserialized objects. */
+    static void keep_alive(std::shared_ptr<void> memory) {
+        Physics::get().persistent_memory.push_back(std::move(memory));
     }
 
     Physics(Physics const &) = delete;
@@ -50,13 +106,16 @@ public:
     virtual ~Physics() {
 #define SAFE_RELEASE(x)    if(x)    { x->release(); x = nullptr;    }
         release_all_scenes();
-        SAFE_RELEASE(dispatcher);
+        SAFE_RELEASE(serialization_registry);
+        scene_dispatchers.clear();
+        dispatcher.reset();
 #if !__APPLE__
         SAFE_RELEASE(cuda_context_manager);
 #endif
         SAFE_RELEASE(cooking);
         SAFE_RELEASE(physics);
         SAFE_RELEASE(foundation);
+        released_flag() = true;
     }
 
 private:
@@ -67,7 +126,12 @@ private:
         auto params = PxCookingParams(PxTolerancesScale());
         params.buildGPUData = true;
         cooking = PxCreateCooking(PX_PHYSICS_VERSION, *foundation, params);
-        dispatcher = physx::PxDefaultCpuDispatcherCreate(0);
+        dispatcher = create_cpu_dispatcher(0, {});
+    }
+
+    static bool &released_flag() {
+        static bool released = false;
+        return released;
     }
 
     void release_all_scenes() {
@@ -85,8 +149,16 @@ public:
     physx::PxPhysics *physics = nullptr;
     physx::PxCooking *cooking = nullptr;
 
-    physx::PxDefaultCpuDispatcher *dispatcher = nullptr;
+    std::shared_ptr<physx::PxCpuDispatcher> dispatcher;
     physx::PxCudaContextManager *cuda_context_manager = nullptr;
+    physx::PxSerializationRegistry *serialization_registry = nullptr;
+
+private:
+    /** @brief Dispatchers used by existing scenes. */
+    std::vector<std::shared_ptr<physx::PxCpuDispatcher>> scene_dispatchers;
+
+    /** @brief Released after the physics as it may contain memory of the physics objects. */
+    std::vector<std::shared_ptr<void>> persistent_memory;
 
 };
 
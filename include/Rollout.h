@@ -0,0 +1,251 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Native execution of the whole action sequence in the scene. Each row of TxA action array is split into blocks
+ *     (in the order in which they were added) that are mapped to joint drive targets or to forces and torques of
+ *     dynamic actors. Actions are applied before every simulation substep, after the joint controllers of the scene
+ *     were stepped, i.e. they override controller targets of the same joints. The selected quantities are recorded
+ *     after every step into Tx... arrays. Actors are referred by indices into get_dynamic_rigid_actors of the scene.
+ */
+
+#ifndef PYPHYSX_ROLLOUT_H
+#define PYPHYSX_ROLLOUT_H
+
+#include <Scene.h>
+#include <JointGroup.h>
+#include <Articulation.h>
+#include <JointController.h>
+#include <array_utils.h>
+#include <algorithm>
+#include <functional>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+class Rollout {
+public:
+    explicit Rollout(Scene &scene) : scene(&scene) {}
+
+    /** @brief Get number of columns of the action array. */
+    size_t get_action_size() const {
+        size_t n = 0;
+        for (const auto &a : actions) {
+            n += a.size;
+        }
+        return n;
+    }
+
+    /** @brief Map next N action columns to drive positions of the joints in the group. Commanded state of TreeRobot
+     * is not updated, use add_controller_targets if the robot is updated after the rollout. */
+    void add_joint_targets(const JointGroup &group) {
+        const auto g = std::make_shared<JointGroup>(group);
+        actions.push_back({g->get_num_joints(), [g](const actors_type &, const float *d) {
+            g->apply_drive_positions(d);
+        }});
+    }
+
+    /** @brief Map next N action columns to commanded positions of the controller, i.e. drive targets of its joints
+     * and the commanded state shared with the controller (e.g. the state of TreeRobot) are set. */
+    void add_controller_targets(const std::shared_ptr<JointController> &controller) {
+        actions.push_back({controller->get_num_joints(), [controller](const actors_type &, const float *d) {
+            controller->apply_commanded_positions(d);
+        }});
+    }
+
+    /** @brief Map next N action columns to drive targets of movable joints of the articulation. */
+    void add_articulation_targets(const Articulation &articulation) {
+        const auto art = std::make_shared<Articulation>(articulation);
+        actions.push_back({art->get_num_joints(), [art](const actors_type &, const float *d) {
+            art->apply_drive_targets(d);
+        }});
+    }
+
+    /** @brief Map next 3K action columns to forces applied to the K actors selected by indices. */
+    void add_actor_forces(const input_index_array &indices, physx::PxForceMode::Enum force_mode) {
+        const auto ind = to_indices(indices);
+        actions.push_back({3 * ind.size(), [ind, force_mode](const actors_type &actors, const float *d) {
+            for (size_t i = 0; i < ind.size(); ++i) {
+                actors[ind[i]]->addForce(physx::PxVec3(d[3 * i], d[3 * i + 1], d[3 * i + 2]), force_mode);
+            }
+        }});
+    }
+
+    /** @brief Map next 3K action columns to torques applied to the K actors selected by indices. */
+    void add_actor_torques(const input_index_array &indices, physx::PxForceMode::Enum torque_mode) {
+        const auto ind = to_indices(indices);
+        actions.push_back({3 * ind.size(), [ind, torque_mode](const actors_type &actors, const float *d) {
+            for (size_t i = 0; i < ind.size(); ++i) {
+                actors[ind[i]]->addTorque(physx::PxVec3(d[3 * i], d[3 * i + 1], d[3 * i + 2]), torque_mode);
+            }
+        }});
+    }
+
+    /** @brief Record poses of the K actors selected by indices, recorded array has shape TxKx7. */
+    void record_actor_poses(const input_index_array &indices) {
+        const auto ind = to_indices(indices);
+        records.push_back({{ind.size(), 7}, nullptr, [ind](const actors_type &actors, float *d) {
+            for (size_t i = 0; i < ind.size(); ++i) {
+                pose_to_buffer(actors[ind[i]]->getGlobalPose(), d + 7 * i);
+            }
+        }});
+    }
+
+    /** @brief Record linear velocities of the K actors selected by indices, recorded array has shape TxKx3. */
+    void record_actor_linear_velocities(const input_index_array &indices) {
+        const auto ind = to_indices(indices);
+        records.push_back({{ind.size(), 3}, nullptr, [ind](const actors_type &actors, float *d) {
+            for (size_t i = 0; i < ind.size(); ++i) {
+                vec3_to_buffer(actors[ind[i]]->getLinearVelocity(), d + 3 * i);
+            }
+        }});
+    }
+
+    /** @brief Record angular velocities of the K actors selected by indices, recorded array has shape TxKx3. */
+    void record_actor_angular_velocities(const input_index_array &indices) {
+        const auto ind = to_indices(indices);
+        records.push_back({{ind.size(), 3}, nullptr, [ind](const actors_type &actors, float *d) {
+            for (size_t i = 0; i < ind.size(); ++i) {
+                vec3_to_buffer(actors[ind[i]]->getAngularVelocity(), d + 3 * i);
+            }
+        }});
+    }
+
+    /** @brief Record measured positions of the joints in the group, recorded array has shape TxN. */
+    void record_joint_positions(const JointGroup &group) {
+        const auto g = std::make_shared<JointGroup>(group);
+        records.push_back({{g->get_num_joints()}, nullptr, [g](const actors_type &, float *d) {
+            g->copy_positions(d);
+        }});
+    }
+
+    /** @brief Record measured velocities of the joints in the group, recorded array has shape TxN. */
+    void record_joint_velocities(const JointGroup &group) {
+        const auto g = std::make_shared<JointGroup>(group);
+        records.push_back({{g->get_num_joints()}, nullptr, [g](const actors_type &, float *d) {
+            g->copy_velocities(d);
+        }});
+    }
+
+    /** @brief Record positions of movable joints of the articulation, recorded array has shape TxN. */
+    void record_articulation_joint_positions(const Articulation &articulation) {
+        const auto art = std::make_shared<Articulation>(articulation);
+        records.push_back({{art->get_num_joints()}, [art]() { art->prepare_cache(); },
+                           [art](const actors_type &, float *d) {
+                               art->copy_joint_values(physx::PxArticulationCache::ePOSITION, d);
+                           }});
+    }
+
+    /** @brief Record velocities of movable joints of the articulation, recorded array has shape TxN. */
+    void record_articulation_joint_velocities(const Articulation &articulation) {
+        const auto art = std::make_shared<Articulation>(articulation);
+        records.push_back({{art->get_num_joints()}, [art]() { art->prepare_cache(); },
+                           [art](const actors_type &, float *d) {
+                               art->copy_joint_values(physx::PxArticulationCache::eVELOCITY, d);
+                           }});
+    }
+
+    /** @brief Simulate T steps of length dt, each split into substeps, for the TxA actions. Return tuple of recorded
+     * arrays in the order in which the records were added. GIL is released for the whole rollout. */
+    pybind11::tuple run(const input_float_array &actions_array, float dt, size_t substeps) {
+        const auto action_size = get_action_size();
+        if (actions_array.ndim() != 2 || size_t(actions_array.shape(1)) != action_size) {
+            throw std::invalid_argument("Actions must have shape (T, " + std::to_string(action_size) + ").");
+        }
+        if (substeps == 0) {
+            throw std::invalid_argument("Number of substeps must be positive.");
+        }
+        scene->check_simulation_not_running();
+        const auto num_steps = size_t(actions_array.shape(0));
+        const auto &actors = scene->get_dynamic_rigid_actors_ptrs();
+        if (max_actor_index >= int64_t(actors.size())) {
+            throw std::out_of_range("Actor index " + std::to_string(max_actor_index) + " is out of range.");
+        }
+        std::vector<pybind11::array_t<float>> outputs;
+        std::vector<float *> outputs_data;
+        std::vector<size_t> record_sizes;
+        for (const auto &r : records) {
+            if (r.prepare) {
+                r.prepare();
+            }
+            std::vector<size_t> shape{num_steps};
+            shape.insert(shape.end(), r.shape.begin(), r.shape.end());
+            outputs.emplace_back(shape);
+            outputs_data.push_back(outputs.back().mutable_data());
+            size_t size = 1;
+            for (const auto &s : r.shape) {
+                size *= s;
+            }
+            record_sizes.push_back(size);
+        }
+
+        const auto a = actions_array.data();
+        {
+            pybind11::gil_scoped_release release;
+            const auto h = dt / float(substeps);
+            for (size_t t = 0; t < num_steps; ++t) {
+                for (size_t k = 0; k < substeps; ++k) { // forces are cleared by the simulation, hence applied again
+                    scene->step_joint_controllers(h);
+                    auto d = a + t * action_size;
+                    for (const auto &action : actions) {
+                        action.apply(actors, d);
+                        d += action.size;
+                    }
+                    scene->get_physx_ptr()->simulate(h);
+                    scene->get_physx_ptr()->fetchResults(true);
+                }
+                for (size_t i = 0; i < records.size(); ++i) {
+                    records[i].write(actors, outputs_data[i] + t * record_sizes[i]);
+                }
+            }
+            scene->refresh_state_buffer();
+        }
+        scene->simulation_time += double(dt) * num_steps;
+        scene->check_dispatcher_error();
+
+        pybind11::tuple result(outputs.size());
+        for (size_t i = 0; i < outputs.size(); ++i) {
+            result[i] = outputs[i];
+        }
+        return result;
+    }
+
+private:
+    using actors_type = std::vector<physx::PxRigidDynamic *>;
+
+    struct Action {
+        size_t size;
+        std::function<void(const actors_type &, const float *)> apply;
+    };
+
+    struct Record {
+        std::vector<size_t> shape; // shape of the data recorded in a single step
+        std::function<void()> prepare; // called with GIL before the rollout, optional
+        std::function<void(const actors_type &, float *)> write;
+    };
+
+    /** @brief Convert one dimensional array of actor indices into vector. Indices are checked against the number of
+     * actors when the rollout is run. */
+    std::vector<int64_t> to_indices(const input_index_array &indices) {
+        if (indices.ndim() != 1) {
+            throw std::invalid_argument("Indices must be one dimensional array.");
+        }
+        std::vector<int64_t> ind(indices.data(), indices.data() + indices.shape(0));
+        for (const auto &i : ind) {
+            if (i < 0) {
+                throw std::out_of_range("Actor index " + std::to_string(i) + " is out of range.");
+            }
+            max_actor_index = std::max(max_actor_index, i);
+        }
+        return ind;
+    }
+
+    Scene *scene;
+    std::vector<Action> actions;
+    std::vector<Record> records;
+    int64_t max_actor_index = -1;
+};
+
+#endif //PYPHYSX_ROLLOUT_H
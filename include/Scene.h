@@ -8,10 +8,24 @@
 #define SIM_PHYSX_SCENE_H
 
 #include <Physics.h>
+#include <CpuDispatcher.h>
 #include <BasePhysxPointer.h>
 #include <RigidDynamic.h>
 #include "RigidStatic.h"
 #include "Aggregate.h"
+#include <ContactReport.h>
+#include <JointController.h>
+#include <StateBuffer.h>
+#include <SceneState.h>
+#include <clone_utils.h>
+#include <scene_serialization.h>
+#include <collision_utils.h>
+#include <pybind11/stl.h>
+#include <array_utils.h>
+#include <algorithm>
+#include <memory>
+#include <stdexcept>
+#include <unordered_set>
 
 class Scene : public BasePhysxPointer<physx::PxScene> {
 public:
@@ -19,12 +33,24 @@ public:
           const physx::PxBroadPhaseType::Enum &broad_phase_type,
           const std::vector<physx::PxSceneFlag::Enum> &scene_flags,
           size_t gpu_max_num_partitions,
-          float gpu_dynamic_allocation_scale
-    ) : BasePhysxPointer() {
+          float gpu_dynamic_allocation_scale,
+          size_t contact_buffer_size = 0,
+          const CpuDispatcher *dispatcher = nullptr
+    ) : BasePhysxPointer(), friction_type(friction_type), broad_phase_type(broad_phase_type),
+        scene_flags(scene_flags), gpu_max_num_partitions(gpu_max_num_partitions),
+        gpu_dynamic_allocation_scale(gpu_dynamic_allocation_scale), contact_buffer_size(contact_buffer_size),
+        dispatcher(dispatcher != nullptr ? *dispatcher : CpuDispatcher(Physics::get().dispatcher)) {
         physx::PxSceneDesc sceneDesc(Physics::get().physics->getTolerancesScale());
-        sceneDesc.cpuDispatcher = Physics::get().dispatcher;
+        sceneDesc.cpuDispatcher = this->dispatcher.get_dispatcher().get();
+        Physics::register_scene_dispatcher(this->dispatcher.get_dispatcher());
         sceneDesc.cudaContextManager = Physics::get().cuda_context_manager;
         sceneDesc.filterShader = physx::PxDefaultSimulationFilterShader;
+        std::unique_ptr<ContactReport> report;
+        if (contact_buffer_size > 0) {
+            report = std::make_unique<ContactReport>(contact_buffer_size);
+            sceneDesc.filterShader = contact_report_filter_shader;
+            sceneDesc.simulationEventCallback = report.get();
+        }
         sceneDesc.gravity = physx::PxVec3(0.0f, 0.0f, -9.81f);
         for (const auto &flag : scene_flags) {
             sceneDesc.flags |= flag;
@@ -42,37 +68,489 @@ public:
         sceneDesc.gpuDynamicsConfig.tempBufferCapacity *= gpu_dynamic_allocation_scale;
 
         set_physx_ptr(Physics::get().physics->createScene(sceneDesc));
+        if (report != nullptr) { // callback is not owned by PhysX, it is detached when the last copy of the scene dies
+            const auto scene = get_physx_ptr();
+            contact_report = std::shared_ptr<ContactReport>(report.release(), [scene](ContactReport *r) {
+                if (!Physics::is_released()) {
+                    scene->setSimulationEventCallback(nullptr);
+                }
+                delete r;
+            });
+        }
     }
 
-    /** @brief Simulate scene for given amount of time dt and fetch results with blocking. */
-    void simulate(float dt) {
-        get_physx_ptr()->simulate(dt);
-        get_physx_ptr()->fetchResults(true);
+    /** @brief Simulate scene for given amount of time dt and fetch results with blocking. The time is split into
+     * substeps of equal length and joint controllers are stepped before each of them. GIL is released during the
+     * simulation so that other python threads can run in parallel. */
+    void simulate(float dt, size_t substeps) {
+        if (substeps == 0) {
+            throw std::invalid_argument("Number of substeps must be positive.");
+        }
+        check_simulation_not_running();
+        {
+            pybind11::gil_scoped_release release;
+            const auto h = dt / float(substeps);
+            for (size_t i = 0; i < substeps; ++i) {
+                step_joint_controllers(h);
+                get_physx_ptr()->simulate(h);
+                get_physx_ptr()->fetchResults(true);
+            }
+            refresh_state_buffer();
+        }
         simulation_time += dt;
+        check_dispatcher_error();
+    }
+
+    /** @brief Start simulation of the scene for given amount of time dt and return immediately. Results have to be
+     * obtained by fetch_results before the scene is modified or simulated again. */
+    void simulate_async(float dt) {
+        check_simulation_not_running();
+        step_joint_controllers(dt);
+        get_physx_ptr()->simulate(dt);
+        pending_dt = dt;
+        simulation_running = true;
+    }
+
+    /** @brief Throw runtime error if the python executor of the dispatcher failed to run some simulation tasks. The
+     * tasks were run in the simulating thread, i.e. the results of the simulation are valid. */
+    void check_dispatcher_error() const {
+        dispatcher.check_error();
+    }
+
+    /** @brief Return true if the simulation was started by simulate_async and its results were not fetched yet. */
+    bool is_simulation_running() const {
+        return simulation_running;
+    }
+
+    /** @brief Throw if the simulation started by simulate_async was not fetched yet, i.e. the scene cannot be
+     * simulated or modified. */
+    void check_simulation_not_running() const {
+        if (simulation_running) {
+            throw std::runtime_error("Simulation is already running, call fetch_results first.");
+        }
+    }
+
+    /** @brief Fetch results of the simulation started by simulate_async. If block is false and the simulation has
+     * not finished yet, false is returned and the results have to be fetched later. GIL is released while waiting. */
+    bool fetch_results(bool block) {
+        if (!simulation_running) {
+            return true;
+        }
+        bool fetched;
+        {
+            pybind11::gil_scoped_release release;
+            fetched = get_physx_ptr()->fetchResults(block);
+            if (fetched) {
+                refresh_state_buffer();
+            }
+        }
+        if (fetched) {
+            simulation_time += pending_dt;
+            pending_dt = 0.;
+            simulation_running = false;
+            check_dispatcher_error();
+        }
+        return fetched;
+    }
+
+    /** @brief Return true if the simulation started by simulate_async has finished or if no simulation is running. */
+    bool check_results() {
+        return !simulation_running || get_physx_ptr()->checkResults(false);
+    }
+
+    /** @brief Add joint controller that is stepped before every simulation (sub)step. */
+    void add_joint_controller(const std::shared_ptr<JointController> &controller) {
+        joint_controllers.push_back(controller);
+    }
+
+    void remove_joint_controller(const std::shared_ptr<JointController> &controller) {
+        const auto it = std::find(joint_controllers.begin(), joint_controllers.end(), controller);
+        if (it == joint_controllers.end()) {
+            throw std::invalid_argument("Joint controller is not in the scene.");
+        }
+        joint_controllers.erase(it);
+    }
+
+    const std::vector<std::shared_ptr<JointController>> &get_joint_controllers() const {
+        return joint_controllers;
+    }
+
+    /** @brief Step all joint controllers for the time dt. GIL is not needed. */
+    void step_joint_controllers(double dt) {
+        for (const auto &controller : joint_controllers) {
+            controller->step(dt);
+        }
+    }
+
+    /** @brief Enable or disable persistent buffer with state of dynamic actors. If enabled, the buffer is refreshed
+     * after each simulation step without any allocation as long as the number of dynamic actors does not change. */
+    void enable_state_buffer(bool enable) {
+        state_buffer.enable(enable);
+        refresh_state_buffer();
+    }
+
+    /** @brief Get tuple of read-only views (poses Nx7, linear velocities Nx3, angular velocities Nx3) into the state
+     * buffer in the order given by get_dynamic_rigid_actors. The views are updated in place by the simulation; they
+     * have to be obtained again if the number of dynamic actors changes. */
+    pybind11::tuple get_state_buffer() {
+        return state_buffer.get_views();
+    }
+
+    /** @brief Copy the current state of dynamic actors into the state buffer if it is enabled. GIL is not needed. */
+    void refresh_state_buffer() {
+        if (state_buffer.is_enabled()) {
+            state_buffer.refresh(get_dynamic_rigid_actors_ptrs());
+        }
+    }
+
+    /** @brief Save poses, velocities and kinematic targets of dynamic actors, drive targets of D6 joints, root and
+     * joint state of articulations, commanded state of joint controllers, and simulation time into a compact binary
+     * blob. */
+    pybind11::array_t<uint8_t> save_state() {
+        auto articulations = get_prepared_articulations();
+        return SceneState::save(get_dynamic_rigid_actors_ptrs(), get_scene_d6_joints(get_physx_ptr()), articulations,
+                                joint_controllers, simulation_time);
+    }
+
+    /** @brief Restore state saved by save_state. The scene must contain the same dynamic actors, joints,
+     * articulations and joint controllers, in the same order, as the scene from which the state was saved. */
+    void restore_state(const pybind11::array_t<uint8_t, pybind11::array::c_style | pybind11::array::forcecast> &blob) {
+        if (simulation_running) {
+            throw std::runtime_error("State cannot be restored while simulation is running, call fetch_results first.");
+        }
+        auto articulations = get_prepared_articulations();
+        simulation_time = SceneState::restore(blob, get_dynamic_rigid_actors_ptrs(),
+                                              get_scene_d6_joints(get_physx_ptr()), articulations,
+                                              joint_controllers);
+        refresh_state_buffer();
+    }
+
+    /** @brief Create n new scenes with the same parameters and content as this scene. Actors, aggregates and D6
+     * joints are cloned natively together with their state; materials, cooked meshes and shared shapes are shared with
+     * this scene. Scenes with articulations cannot be cloned. */
+    std::vector<Scene> clone(size_t n) {
+        if (simulation_running) {
+            throw std::runtime_error("Scene cannot be cloned while simulation is running, call fetch_results first.");
+        }
+        if (get_physx_ptr()->getNbArticulations() > 0) {
+            throw std::invalid_argument("Scene with articulations cannot be cloned, use save_state and restore_state "
+                                        "to reset the scene instead.");
+        }
+        std::vector<Scene> scenes;
+        scenes.reserve(n);
+        for (size_t i = 0; i < n; ++i) {
+            scenes.emplace_back(friction_type, broad_phase_type, scene_flags, gpu_max_num_partitions,
+                                gpu_dynamic_allocation_scale, contact_buffer_size, &dispatcher);
+            auto &scene = scenes.back();
+            clone_scene_content(*get_physx_ptr(), *scene.get_physx_ptr());
+            scene.simulation_time = simulation_time;
+            scene.enable_state_buffer(state_buffer.is_enabled());
+        }
+        return scenes;
+    }
+
+    /** @brief Export all actors, aggregates and joints of the scene together with their shapes, materials and meshes
+     * into the file in the given format ("binary" or "xml"). */
+    void export_to_file(const std::string &path, const std::string &format) {
+        if (simulation_running) {
+            throw std::runtime_error("Scene cannot be exported while simulation is running, call fetch_results first.");
+        }
+        export_scene(*get_physx_ptr(), path, format);
+    }
+
+    /** @brief Add content of the file created by export into the scene. Binary files are memory mapped. */
+    void load(const std::string &path, const std::string &format) {
+        if (simulation_running) {
+            throw std::runtime_error("Scene cannot be loaded while simulation is running, call fetch_results first.");
+        }
+        load_scene(*get_physx_ptr(), path, format);
     }
 
     void add_actor(RigidActor actor) {
         get_physx_ptr()->addActor(*actor.get_physx_ptr());
+        assign_actor_id(actor.get_physx_ptr());
+    }
+
+    /** @brief Remove actor from the scene. Indices of the remaining actors in get_dynamic_rigid_actors may change,
+     * their ids given by get_actor_id do not. */
+    void remove_actor(RigidActor actor) {
+        if (actor.get_physx_ptr()->getScene() != get_physx_ptr()) {
+            throw std::invalid_argument("Actor is not in the scene.");
+        }
+        if (simulation_running) {
+            throw std::runtime_error("Actors cannot be removed while simulation is running, call fetch_results first.");
+        }
+        get_physx_ptr()->removeActor(*actor.get_physx_ptr());
+        actor_ids.erase(actor.get_physx_ptr());
+    }
+
+    /** @brief Get stable id of the actor within the scene. Id is assigned when the actor is added to the scene and it
+     * does not change if other actors are added or removed. Ids are not reused. */
+    int64_t get_actor_id(const RigidActor &actor) {
+        update_actors_cache();
+        const auto it = actor_ids.find(actor.get_physx_ptr());
+        if (it == actor_ids.end()) {
+            throw std::invalid_argument("Actor is not in the scene.");
+        }
+        return it->second;
+    }
+
+    /** @brief Get ids of dynamic actors in the order given by get_dynamic_rigid_actors. */
+    pybind11::array_t<int64_t> get_dynamic_rigid_actors_ids() {
+        update_actors_cache();
+        pybind11::array_t<int64_t> ids(dynamic_actors.size());
+        auto d = ids.mutable_data();
+        for (size_t i = 0; i < dynamic_actors.size(); ++i) {
+            d[i] = actor_ids.at(dynamic_actors[i]);
+        }
+        return ids;
+    }
+
+    /** @brief Get list of static actors. The wrappers are cached, i.e. the same python objects are returned until
+     * the actors of the scene change. */
+    pybind11::object get_static_rigid_actors() {
+        update_actors_cache();
+        if (static_actors_list_version != actors_cache_version) {
+            static_actors_list = pybind11::cast(from_vector_of_physx_ptr<RigidActor>(static_actors));
+            static_actors_list_version = actors_cache_version;
+        }
+        return static_actors_list.attr("copy")();
+    }
+
+    /** @brief Get list of dynamic actors. The wrappers are cached, i.e. the same python objects are returned until
+     * the actors of the scene change. */
+    pybind11::object get_dynamic_rigid_actors() {
+        update_actors_cache();
+        if (dynamic_actors_list_version != actors_cache_version) {
+            dynamic_actors_list = pybind11::cast(
+                    from_vector_of_physx_ptr<RigidDynamic, physx::PxRigidDynamic>(dynamic_actors));
+            dynamic_actors_list_version = actors_cache_version;
+        }
+        return dynamic_actors_list.attr("copy")();
+    }
+
+    /** @brief Get poses of all dynamic actors as Nx7 float32 array [x,y,z,qw,qx,qy,qz] in the order given by
+     * get_dynamic_rigid_actors. If out array is specified, poses are written into it without allocation. */
+    auto get_dynamic_rigid_actors_poses(const pybind11::object &out) {
+        const auto &actors = get_dynamic_rigid_actors_ptrs();
+        auto poses = get_output_array(out, {actors.size(), 7});
+        fill_poses(actors, poses);
+        return poses;
     }
 
-    auto get_static_rigid_actors() {
-        const auto n = get_physx_ptr()->getNbActors(physx::PxActorTypeFlag::eRIGID_STATIC);
-        std::vector<physx::PxRigidActor *> actors(n);
-        get_physx_ptr()->getActors(physx::PxActorTypeFlag::eRIGID_STATIC,
-                                   reinterpret_cast<physx::PxActor **>(&actors[0]), n);
-        return from_vector_of_physx_ptr<RigidActor>(actors);
+    /** @brief Set poses (Nx7) of the dynamic actors selected by indices into get_dynamic_rigid_actors. */
+    void set_dynamic_rigid_actors_poses(const input_index_array &indices, const input_float_array &poses) {
+        set_poses(get_dynamic_rigid_actors_ptrs(), indices, poses);
     }
 
-    auto get_dynamic_rigid_actors() {
-        const auto n = get_physx_ptr()->getNbActors(physx::PxActorTypeFlag::eRIGID_DYNAMIC);
-        std::vector<physx::PxRigidDynamic *> actors(n);
-        get_physx_ptr()->getActors(physx::PxActorTypeFlag::eRIGID_DYNAMIC,
-                                   reinterpret_cast<physx::PxActor **>(&actors[0]), n);
-        return from_vector_of_physx_ptr<RigidDynamic, physx::PxRigidDynamic>(actors);
+    /** @brief Set linear velocities (Nx3) of the dynamic actors selected by indices. */
+    void set_dynamic_rigid_actors_linear_velocities(const input_index_array &indices,
+                                                    const input_float_array &velocities) {
+        set_linear_velocities(get_dynamic_rigid_actors_ptrs(), indices, velocities);
+    }
+
+    /** @brief Set angular velocities (Nx3) of the dynamic actors selected by indices. */
+    void set_dynamic_rigid_actors_angular_velocities(const input_index_array &indices,
+                                                     const input_float_array &velocities) {
+        set_angular_velocities(get_dynamic_rigid_actors_ptrs(), indices, velocities);
+    }
+
+    /** @brief Add forces (Nx3) to the dynamic actors selected by indices. */
+    void add_dynamic_rigid_actors_forces(const input_index_array &indices, const input_float_array &forces,
+                                         physx::PxForceMode::Enum force_mode) {
+        add_forces(get_dynamic_rigid_actors_ptrs(), indices, forces, force_mode);
+    }
+
+    /** @brief Add torques (Nx3) to the dynamic actors selected by indices. */
+    void add_dynamic_rigid_actors_torques(const input_index_array &indices, const input_float_array &torques,
+                                          physx::PxForceMode::Enum torque_mode) {
+        add_torques(get_dynamic_rigid_actors_ptrs(), indices, torques, torque_mode);
+    }
+
+    /** @brief Cast N rays given by origins (Nx3) and directions (Nx3) up to max_dist and return tuple of arrays
+     * (distances, positions, normals, actor_indices) of the closest hits. Actor index refers to
+     * get_dynamic_rigid_actors, it is -2 for static actors and -1 if there is no hit. Only shapes with SCENE_QUERY_SHAPE
+     * flag are considered. */
+    pybind11::tuple raycast_batch(const input_float_array &origins, const input_float_array &directions,
+                                  float max_dist) {
+        const auto n = check_rows(origins, 3, "Origins");
+        check_rows(directions, 3, "Directions", n);
+        const auto &indices = get_dynamic_rigid_actors_indices();
+        QueryHitArrays res(n);
+        const auto o = origins.data();
+        const auto dir = directions.data();
+        {
+            pybind11::gil_scoped_release release;
+            for (size_t i = 0; i < n; ++i) {
+                const physx::PxVec3 unit_dir = physx::PxVec3(dir[3 * i], dir[3 * i + 1], dir[3 * i + 2]).getNormalized();
+                physx::PxRaycastBuffer hit;
+                if (!unit_dir.isZero() &&
+                    get_physx_ptr()->raycast(physx::PxVec3(o[3 * i], o[3 * i + 1], o[3 * i + 2]), unit_dir, max_dist,
+                                             hit) && hit.hasBlock) {
+                    res.write_hit(i, hit.block, indices);
+                } else {
+                    res.write_no_hit(i);
+                }
+            }
+        }
+        return res.to_tuple();
+    }
+
+    /** @brief Sweep geometry of the given shape from N poses (Nx7) along directions (Nx3) up to max_dist and return
+     * tuple of arrays (distances, positions, normals, actor_indices) of the first hits as in raycast_batch. Local pose of the shape is
+     * applied on top of the given poses. */
+    pybind11::tuple sweep_batch(const Shape &shape, const input_float_array &poses, const input_float_array &directions,
+                                float max_dist) {
+        const auto n = check_rows(poses, 7, "Poses");
+        check_rows(directions, 3, "Directions", n);
+        const auto &indices = get_dynamic_rigid_actors_indices();
+        QueryHitArrays res(n);
+        const auto geometry = shape.get_physx_ptr()->getGeometry();
+        const auto local_pose = shape.get_physx_ptr()->getLocalPose();
+        const auto pose_data = poses.data();
+        const auto dir = directions.data();
+        {
+            pybind11::gil_scoped_release release;
+            for (size_t i = 0; i < n; ++i) {
+                const physx::PxVec3 unit_dir = physx::PxVec3(dir[3 * i], dir[3 * i + 1], dir[3 * i + 2]).getNormalized();
+                physx::PxSweepBuffer hit;
+                if (!unit_dir.isZero() &&
+                    get_physx_ptr()->sweep(geometry.any(), pose_from_buffer(pose_data + 7 * i) * local_pose, unit_dir,
+                                           max_dist, hit) && hit.hasBlock) {
+                    res.write_hit(i, hit.block, indices);
+                } else {
+                    res.write_no_hit(i);
+                }
+            }
+        }
+        return res.to_tuple();
+    }
+
+    /** @brief Test if geometry of the given shape placed at N poses (Nx7) overlaps with any actor of the scene.
+     * Return array of indices of an overlapping actor (refers to get_dynamic_rigid_actors), -1 if there is no overlap
+     * and -2 if it overlaps with static actor. */
+    pybind11::array_t<int64_t> overlap_batch(const Shape &shape, const input_float_array &poses) {
+        const auto n = check_rows(poses, 7, "Poses");
+        const auto &indices = get_dynamic_rigid_actors_indices();
+        pybind11::array_t<int64_t> res(n);
+        auto a = res.mutable_data();
+        const auto geometry = shape.get_physx_ptr()->getGeometry();
+        const auto local_pose = shape.get_physx_ptr()->getLocalPose();
+        const auto pose_data = poses.data();
+        const physx::PxQueryFilterData filter(
+                physx::PxQueryFlag::eSTATIC | physx::PxQueryFlag::eDYNAMIC | physx::PxQueryFlag::eANY_HIT);
+        {
+            pybind11::gil_scoped_release release;
+            for (size_t i = 0; i < n; ++i) {
+                physx::PxOverlapBuffer hit;
+                if (get_physx_ptr()->overlap(geometry.any(), pose_from_buffer(pose_data + 7 * i) * local_pose, hit,
+                                             filter) && hit.hasBlock) {
+                    const auto it = indices.find(hit.block.actor);
+                    a[i] = it == indices.end() ? -2 : it->second;
+                } else {
+                    a[i] = -1;
+                }
+            }
+        }
+        return res;
+    }
+
+    /** @brief Find all pairs of overlapping actors and return them as Kx2 array of indices (i < j) into the given list
+     * of actors. If actors are None, dynamic actors of the scene are used, i.e. indices refer to
+     * get_dynamic_rigid_actors. Candidate pairs are pruned by actors bounds and only the candidates are checked by
+     * exact shape overlap queries. */
+    pybind11::array_t<int64_t> find_overlapping_pairs(const pybind11::object &actors) {
+        std::vector<physx::PxRigidActor *> ptrs;
+        if (actors.is_none()) {
+            for (const auto &a : get_dynamic_rigid_actors_ptrs()) {
+                ptrs.push_back(a);
+            }
+        } else {
+            for (const auto &a : actors.cast<std::vector<RigidActor>>()) {
+                ptrs.push_back(a.get_physx_ptr());
+            }
+        }
+        std::vector<std::pair<size_t, size_t>> pairs;
+        {
+            pybind11::gil_scoped_release release;
+            std::vector<ActorGeometries> geometries;
+            geometries.reserve(ptrs.size());
+            for (const auto &a : ptrs) {
+                geometries.push_back(ActorGeometries::from_actor(a, a->getGlobalPose()));
+            }
+            pairs = ::find_overlapping_pairs(geometries);
+        }
+        pybind11::array_t<int64_t> res(std::vector<size_t>{pairs.size(), 2});
+        auto data = res.mutable_data();
+        for (size_t i = 0; i < pairs.size(); ++i) {
+            data[2 * i] = int64_t(pairs[i].first);
+            data[2 * i + 1] = int64_t(pairs[i].second);
+        }
+        return res;
+    }
+
+    /** @brief Get contacts collected since the last call as structured array with fields actor0, actor1, position,
+     * normal, impulse, and separation. Actors are indices into get_dynamic_rigid_actors, static actors are -2. */
+    pybind11::array get_contacts() {
+        return get_contact_report()->get_contacts(get_dynamic_rigid_actors_indices());
+    }
+
+    /** @brief Get number of contacts dropped since the last get_contacts call because the buffer was full. */
+    size_t get_num_dropped_contacts() {
+        return get_contact_report()->get_num_dropped();
     }
 
     void add_aggregate(Aggregate agg) {
         get_physx_ptr()->addAggregate(*agg.get_physx_ptr());
+        std::unordered_set<physx::PxArticulationBase *> articulations;
+        for (const auto &a : agg.get_actors_ptrs()) {
+            assign_actor_id(a);
+            if (auto link = a->is<physx::PxArticulationLink>()) {
+                articulations.insert(&link->getArticulation());
+            }
+        }
+        for (const auto &art : articulations) {
+            if (auto rc = art->is<physx::PxArticulationReducedCoordinate>()) {
+                Articulation(rc).apply_pending_state();
+            }
+        }
+    }
+
+    /** @brief Remove aggregate together with its actors from the scene. */
+    void remove_aggregate(Aggregate agg) {
+        if (agg.get_physx_ptr()->getScene() != get_physx_ptr()) {
+            throw std::invalid_argument("Aggregate is not in the scene.");
+        }
+        if (simulation_running) {
+            throw std::runtime_error("Aggregates cannot be removed while simulation is running, call fetch_results "
+                                     "first.");
+        }
+        for (const auto &a : agg.get_actors_ptrs()) {
+            actor_ids.erase(a);
+        }
+        get_physx_ptr()->removeAggregate(*agg.get_physx_ptr());
+    }
+
+    /** @brief Add articulation into the scene. Joint positions and velocities set before are applied. */
+    void add_articulation(Articulation articulation) {
+        get_physx_ptr()->addArticulation(*articulation.get_physx_ptr());
+        articulation.apply_pending_state();
+    }
+
+    void remove_articulation(Articulation articulation) {
+        if (articulation.get_physx_ptr()->getScene() != get_physx_ptr()) {
+            throw std::invalid_argument("Articulation is not in the scene.");
+        }
+        if (simulation_running) {
+            throw std::runtime_error("Articulations cannot be removed while simulation is running, call fetch_results "
+                                     "first.");
+        }
+        get_physx_ptr()->removeArticulation(*articulation.get_physx_ptr());
+    }
+
+    /** @brief Get all reduced coordinate articulations of the scene including those added as part of aggregates. */
+    auto get_articulations() {
+        return from_vector_of_physx_ptr<Articulation>(get_articulations_ptrs());
     }
 
     auto get_aggregates() {
@@ -82,8 +560,140 @@ public:
         return from_vector_of_physx_ptr<Aggregate>(aggs);
     }
 
+    /** @brief Get PhysX pointers to all dynamic actors in the order given by get_dynamic_rigid_actors. The vector is
+     * cached and it is valid until actors of the scene change. GIL is not needed. */
+    const std::vector<physx::PxRigidDynamic *> &get_dynamic_rigid_actors_ptrs() {
+        update_actors_cache();
+        return dynamic_actors;
+    }
+
+    /** @brief Get cached map from PhysX pointers of dynamic actors to their index in get_dynamic_rigid_actors. */
+    const std::unordered_map<const physx::PxRigidActor *, int64_t> &get_dynamic_rigid_actors_indices() {
+        update_actors_cache();
+        return dynamic_actors_indices;
+    }
+
 public:
     double simulation_time = 0.;
+
+private:
+    std::vector<physx::PxArticulationReducedCoordinate *> get_articulations_ptrs() {
+        const auto n = get_physx_ptr()->getNbArticulations();
+        std::vector<physx::PxArticulationBase *> arts(n);
+        get_physx_ptr()->getArticulations(arts.data(), n);
+        std::vector<physx::PxArticulationReducedCoordinate *> rc_arts;
+        for (const auto &art : arts) {
+            if (auto rc = art->is<physx::PxArticulationReducedCoordinate>()) {
+                rc_arts.push_back(rc);
+            }
+        }
+        return rc_arts;
+    }
+
+    /** @brief Get articulations of the scene with prepared joint caches. */
+    std::vector<Articulation> get_prepared_articulations() {
+        std::vector<Articulation> articulations;
+        for (const auto &art : get_articulations_ptrs()) {
+            articulations.emplace_back(art);
+            articulations.back().prepare_cache();
+        }
+        return articulations;
+    }
+
+    ContactReport *get_contact_report() {
+        if (contact_report == nullptr) {
+            throw std::runtime_error("Contact reporting is disabled, create scene with contact_buffer_size > 0.");
+        }
+        return contact_report.get();
+    }
+
+    /** @brief Parameters of the scene used to create clones. */
+    physx::PxFrictionType::Enum friction_type;
+    physx::PxBroadPhaseType::Enum broad_phase_type;
+    std::vector<physx::PxSceneFlag::Enum> scene_flags;
+    size_t gpu_max_num_partitions;
+    float gpu_dynamic_allocation_scale;
+    size_t contact_buffer_size;
+    CpuDispatcher dispatcher;
+
+    /** @brief Time step of the simulation started by simulate_async that was not fetched yet. */
+    double pending_dt = 0.;
+    bool simulation_running = false;
+
+    StateBuffer state_buffer;
+
+    /** @brief Simulation event callback of the scene, shared by the copies of this wrapper. */
+    std::shared_ptr<ContactReport> contact_report;
+
+    std::vector<std::shared_ptr<JointController>> joint_controllers;
+
+    /** @brief Read actors of the scene and rebuild cached indices and python lists if they differ from the cached
+     * vectors element-wise (e.g. actor was removed from and another added into an aggregate that is in the scene).
+     * Ids of actors that are no longer in the scene are dropped. */
+    void update_actors_cache() {
+        const auto dynamic_changed = read_scene_actors(physx::PxActorTypeFlag::eRIGID_DYNAMIC, dynamic_actors,
+                                                       previous_dynamic_actors);
+        const auto static_changed = read_scene_actors(physx::PxActorTypeFlag::eRIGID_STATIC, static_actors,
+                                                      previous_static_actors);
+        if (!dynamic_changed && !static_changed) {
+            return;
+        }
+        std::unordered_set<const physx::PxRigidActor *> current(dynamic_actors.begin(), dynamic_actors.end());
+        current.insert(static_actors.begin(), static_actors.end());
+        for (const auto &a : previous_dynamic_actors) {
+            if (current.count(a) == 0) {
+                actor_ids.erase(a);
+            }
+        }
+        for (const auto &a : previous_static_actors) {
+            if (current.count(a) == 0) {
+                actor_ids.erase(a);
+            }
+        }
+        dynamic_actors_indices = get_actors_indices(dynamic_actors);
+        for (const auto &a : dynamic_actors) {
+            assign_actor_id(a);
+        }
+        for (const auto &a : static_actors) {
+            assign_actor_id(a);
+        }
+        ++actors_cache_version;
+    }
+
+    /** @brief Read actors of the given type into the cache. If they differ from the cache, the previous content is
+     * moved into previous and true is returned. */
+    template<typename T>
+    bool read_scene_actors(physx::PxActorTypeFlag::Enum type, std::vector<T *> &cache, std::vector<T *> &previous) {
+        const auto n = get_physx_ptr()->getNbActors(type);
+        previous.resize(n);
+        get_physx_ptr()->getActors(type, reinterpret_cast<physx::PxActor **>(previous.data()), n);
+        if (previous == cache) {
+            return false;
+        }
+        cache.swap(previous);
+        return true;
+    }
+
+    void assign_actor_id(const physx::PxRigidActor *actor) {
+        if (actor_ids.emplace(actor, next_actor_id).second) {
+            ++next_actor_id;
+        }
+    }
+
+    size_t actors_cache_version = 1; // python lists are created by the first call even if the scene is empty
+    std::vector<physx::PxRigidDynamic *> dynamic_actors;
+    std::vector<physx::PxRigidActor *> static_actors;
+    std::vector<physx::PxRigidDynamic *> previous_dynamic_actors;
+    std::vector<physx::PxRigidActor *> previous_static_actors;
+    std::unordered_map<const physx::PxRigidActor *, int64_t> dynamic_actors_indices;
+    std::unordered_map<const physx::PxRigidActor *, int64_t> actor_ids;
+    int64_t next_actor_id = 0;
+
+    /** @brief Python lists of actor wrappers, valid if their version equals actors_cache_version. */
+    pybind11::object dynamic_actors_list;
+    pybind11::object static_actors_list;
+    size_t dynamic_actors_list_version = 0;
+    size_t static_actors_list_version = 0;
 };
 
 #endif //SIM_PHYSX_SCENE_H
@@ -0,0 +1,141 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Batch of independent scenes that are simulated together. All scenes share the CPU dispatcher (the default one
+ *     of the Physics singleton if not specified), i.e. the simulation of all scenes runs concurrently on its workers.
+ *     Scenes are owned by the batch; joint controllers, state buffers, etc. have to be configured on the scenes
+ *     obtained by get_scene.
+ */
+
+#ifndef PYPHYSX_SCENEBATCH_H
+#define PYPHYSX_SCENEBATCH_H
+
+#include <Scene.h>
+#include <array_utils.h>
+#include <stdexcept>
+#include <string>
+
+class SceneBatch {
+public:
+    SceneBatch(size_t num_scenes,
+               const physx::PxFrictionType::Enum &friction_type,
+               const physx::PxBroadPhaseType::Enum &broad_phase_type,
+               const std::vector<physx::PxSceneFlag::Enum> &scene_flags,
+               size_t gpu_max_num_partitions,
+               float gpu_dynamic_allocation_scale,
+               const CpuDispatcher *dispatcher) {
+        scenes.reserve(num_scenes);
+        for (size_t i = 0; i < num_scenes; ++i) {
+            scenes.emplace_back(friction_type, broad_phase_type, scene_flags, gpu_max_num_partitions,
+                                gpu_dynamic_allocation_scale, 0, dispatcher);
+        }
+    }
+
+    /** @brief Create batch of num_scenes clones of the given scene. */
+    static SceneBatch from_scene(Scene &scene, size_t num_scenes) {
+        return SceneBatch(scene.clone(num_scenes));
+    }
+
+    size_t get_num_scenes() const {
+        return scenes.size();
+    }
+
+    Scene &get_scene(size_t i) {
+        if (i >= scenes.size()) {
+            throw std::out_of_range("Scene index " + std::to_string(i) + " is out of range.");
+        }
+        return scenes[i];
+    }
+
+    /** @brief Simulate all scenes for given amount of time dt split into substeps of equal length, as in
+     * Scene.simulate. In each substep, simulation of all scenes is started first and the results are fetched
+     * afterwards, so the scenes are computed concurrently. GIL is released for the whole step. */
+    void simulate(float dt, size_t substeps) {
+        if (substeps == 0) {
+            throw std::invalid_argument("Number of substeps must be positive.");
+        }
+        for (const auto &scene : scenes) {
+            scene.check_simulation_not_running();
+        }
+        {
+            pybind11::gil_scoped_release release;
+            const auto h = dt / float(substeps);
+            for (size_t i = 0; i < substeps; ++i) {
+                for (auto &scene : scenes) {
+                    scene.step_joint_controllers(h);
+                    scene.get_physx_ptr()->simulate(h);
+                }
+                for (auto &scene : scenes) {
+                    scene.get_physx_ptr()->fetchResults(true);
+                }
+            }
+            for (auto &scene : scenes) {
+                scene.refresh_state_buffer();
+            }
+        }
+        for (auto &scene : scenes) {
+            scene.simulation_time += dt;
+        }
+        for (const auto &scene : scenes) {
+            scene.check_dispatcher_error();
+        }
+    }
+
+    /** @brief Get poses of dynamic actors of all scenes as N_scenes x N_actors x 7 float32 array. */
+    auto get_dynamic_rigid_actors_poses(const pybind11::object &out) {
+        return stacked_actors_data(out, 7, [](physx::PxRigidDynamic *a, float *d) {
+            pose_to_buffer(a->getGlobalPose(), d);
+        });
+    }
+
+    /** @brief Get linear velocities of dynamic actors of all scenes as N_scenes x N_actors x 3 float32 array. */
+    auto get_dynamic_rigid_actors_linear_velocities(const pybind11::object &out) {
+        return stacked_actors_data(out, 3, [](physx::PxRigidDynamic *a, float *d) {
+            vec3_to_buffer(a->getLinearVelocity(), d);
+        });
+    }
+
+    /** @brief Get angular velocities of dynamic actors of all scenes as N_scenes x N_actors x 3 float32 array. */
+    auto get_dynamic_rigid_actors_angular_velocities(const pybind11::object &out) {
+        return stacked_actors_data(out, 3, [](physx::PxRigidDynamic *a, float *d) {
+            vec3_to_buffer(a->getAngularVelocity(), d);
+        });
+    }
+
+private:
+    explicit SceneBatch(std::vector<Scene> scenes) : scenes(std::move(scenes)) {}
+
+    /** @brief Fill N_scenes x N_actors x cols array by calling f(actor, row) for each dynamic actor of each scene.
+     * All scenes must contain the same number of dynamic actors. */
+    template<class TFunction>
+    pybind11::array_t<float> stacked_actors_data(const pybind11::object &out, size_t cols, TFunction f) {
+        std::vector<std::vector<physx::PxRigidDynamic *>> actors;
+        actors.reserve(scenes.size());
+        for (auto &scene : scenes) {
+            actors.push_back(scene.get_dynamic_rigid_actors_ptrs());
+        }
+        const auto n = actors.empty() ? 0 : actors[0].size();
+        for (const auto &scene_actors : actors) {
+            if (scene_actors.size() != n) {
+                throw std::invalid_argument("All scenes must have the same number of dynamic actors.");
+            }
+        }
+        auto arr = get_output_array(out, {actors.size(), n, cols});
+        auto data = arr.mutable_data();
+        {
+            pybind11::gil_scoped_release release;
+            for (size_t i = 0; i < actors.size(); ++i) {
+                for (size_t j = 0; j < n; ++j) {
+                    f(actors[i][j], data + (i * n + j) * cols);
+                }
+            }
+        }
+        return arr;
+    }
+
+    std::vector<Scene> scenes;
+};
+
+#endif //PYPHYSX_SCENEBATCH_H
@@ -0,0 +1,189 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Snapshot of the scene state stored in a compact binary blob (numpy uint8 array). The blob consists of header
+ *     followed by float32 rows of dynamic actors, D6 joints, articulations, and joint controllers:
+ *       - actor: pose [x,y,z,qw,qx,qy,qz], linear velocity, angular velocity, kinematic target pose, has target flag
+ *       - joint: drive position [x,y,z,qw,qx,qy,qz], drive linear velocity, drive angular velocity
+ *       - articulation: root pose, root velocities, and joint positions, velocities, drive targets and drive
+ *         velocities of the movable joints (see Articulation::save_state)
+ *       - joint controller: commanded positions and velocities stored as float64 values (see
+ *         JointController::save_state), i.e. commands shared with TreeRobot are restored too
+ */
+
+#ifndef PYPHYSX_SCENESTATE_H
+#define PYPHYSX_SCENESTATE_H
+
+#include <PxPhysicsAPI.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <array_utils.h>
+#include <Articulation.h>
+#include <JointController.h>
+#include <cstring>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+/** @brief Get all D6 joints that are in the scene in the order given by the scene constraints. */
+inline std::vector<physx::PxD6Joint *> get_scene_d6_joints(physx::PxScene *scene) {
+    const auto n = scene->getNbConstraints();
+    std::vector<physx::PxConstraint *> constraints(n);
+    scene->getConstraints(constraints.data(), n);
+    std::vector<physx::PxD6Joint *> joints;
+    for (const auto &c : constraints) {
+        physx::PxU32 type_id;
+        const auto ref = c->getExternalReference(type_id);
+        if (type_id != physx::PxConstraintExtIDs::eJOINT) {
+            continue;
+        }
+        const auto joint = static_cast<physx::PxJoint *>(ref)->is<physx::PxD6Joint>();
+        if (joint != nullptr) {
+            joints.push_back(joint);
+        }
+    }
+    return joints;
+}
+
+class SceneState {
+public:
+    static constexpr size_t actor_row_size = 21;
+    static constexpr size_t joint_row_size = 13;
+
+    struct Header {
+        uint64_t num_actors;
+        uint64_t num_joints;
+        uint64_t num_articulations;
+        uint64_t articulations_size; // number of floats stored for all articulations
+        uint64_t num_controllers;
+        uint64_t controllers_size; // number of floats stored for all joint controllers
+        double simulation_time;
+    };
+
+    /** @brief Store state of the given actors, joints, articulations and joint controllers into the new blob. Caches
+     * of articulations have to be prepared. */
+    static pybind11::array_t<uint8_t> save(const std::vector<physx::PxRigidDynamic *> &actors,
+                                           const std::vector<physx::PxD6Joint *> &joints,
+                                           std::vector<Articulation> &articulations,
+                                           const std::vector<std::shared_ptr<JointController>> &controllers,
+                                           double simulation_time) {
+        const auto art_size = articulations_size(articulations);
+        const auto ctrl_size = controllers_size(controllers);
+        pybind11::array_t<uint8_t> blob(blob_size(actors.size(), joints.size(), art_size + ctrl_size));
+        const Header header{actors.size(), joints.size(), articulations.size(), art_size, controllers.size(),
+                            ctrl_size, simulation_time};
+        std::memcpy(blob.mutable_data(), &header, sizeof(Header));
+        auto d = reinterpret_cast<float *>(blob.mutable_data() + sizeof(Header));
+        pybind11::gil_scoped_release release;
+        for (const auto &a : actors) {
+            pose_to_buffer(a->getGlobalPose(), d);
+            vec3_to_buffer(a->getLinearVelocity(), d + 7);
+            vec3_to_buffer(a->getAngularVelocity(), d + 10);
+            physx::PxTransform target(physx::PxIdentity);
+            const bool has_target = a->getKinematicTarget(target);
+            pose_to_buffer(target, d + 13);
+            d[20] = has_target ? 1.f : 0.f;
+            d += actor_row_size;
+        }
+        for (const auto &j : joints) {
+            pose_to_buffer(j->getDrivePosition(), d);
+            physx::PxVec3 lin, ang;
+            j->getDriveVelocity(lin, ang);
+            vec3_to_buffer(lin, d + 7);
+            vec3_to_buffer(ang, d + 10);
+            d += joint_row_size;
+        }
+        for (auto &art : articulations) {
+            art.save_state(d);
+            d += art.get_state_size();
+        }
+        for (const auto &c : controllers) {
+            c->save_state(d);
+            d += c->get_state_size();
+        }
+        return blob;
+    }
+
+    /** @brief Apply state stored in the blob to the given actors, joints, articulations and joint controllers and
+     * return the stored simulation time. Blob has to be created from the scene with the same number of dynamic actors,
+     * joints, articulations and joint controllers. Caches of articulations have to be prepared. */
+    static double restore(const pybind11::array_t<uint8_t, pybind11::array::c_style | pybind11::array::forcecast> &blob,
+                          const std::vector<physx::PxRigidDynamic *> &actors,
+                          const std::vector<physx::PxD6Joint *> &joints, std::vector<Articulation> &articulations,
+                          const std::vector<std::shared_ptr<JointController>> &controllers) {
+        if (size_t(blob.size()) < sizeof(Header)) {
+            throw std::invalid_argument("Invalid scene state blob.");
+        }
+        Header header{};
+        std::memcpy(&header, blob.data(), sizeof(Header));
+        const auto art_size = articulations_size(articulations);
+        const auto ctrl_size = controllers_size(controllers);
+        if (header.num_actors != actors.size() || header.num_joints != joints.size() ||
+            header.num_articulations != articulations.size() || header.articulations_size != art_size ||
+            header.num_controllers != controllers.size() || header.controllers_size != ctrl_size ||
+            size_t(blob.size()) != blob_size(actors.size(), joints.size(), art_size + ctrl_size)) {
+            throw std::invalid_argument("Scene state blob does not match the scene: it stores " +
+                                        std::to_string(header.num_actors) + " dynamic actors, " +
+                                        std::to_string(header.num_joints) + " joints, " +
+                                        std::to_string(header.num_articulations) + " articulations, and " +
+                                        std::to_string(header.num_controllers) + " joint controllers.");
+        }
+        std::vector<float> rows((blob.size() - sizeof(Header)) / sizeof(float)); // blob data might be unaligned
+        std::memcpy(rows.data(), blob.data() + sizeof(Header), rows.size() * sizeof(float));
+        pybind11::gil_scoped_release release;
+        const float *d = rows.data();
+        for (const auto &a : actors) {
+            const bool kinematic = a->getRigidBodyFlags().isSet(physx::PxRigidBodyFlag::eKINEMATIC);
+            a->setGlobalPose(pose_from_buffer(d));
+            if (!kinematic) {
+                a->setLinearVelocity(physx::PxVec3(d[7], d[8], d[9]));
+                a->setAngularVelocity(physx::PxVec3(d[10], d[11], d[12]));
+            } else if (d[20] > 0.5f) {
+                a->setKinematicTarget(pose_from_buffer(d + 13));
+            }
+            d += actor_row_size;
+        }
+        for (const auto &j : joints) {
+            j->setDrivePosition(pose_from_buffer(d));
+            j->setDriveVelocity(physx::PxVec3(d[7], d[8], d[9]), physx::PxVec3(d[10], d[11], d[12]));
+            d += joint_row_size;
+        }
+        for (auto &art : articulations) {
+            art.restore_state(d);
+            d += art.get_state_size();
+        }
+        for (const auto &c : controllers) {
+            c->restore_state(d);
+            d += c->get_state_size();
+        }
+        return header.simulation_time;
+    }
+
+private:
+    static size_t articulations_size(std::vector<Articulation> &articulations) {
+        size_t size = 0;
+        for (auto &art : articulations) {
+            size += art.get_state_size();
+        }
+        return size;
+    }
+
+    static size_t controllers_size(const std::vector<std::shared_ptr<JointController>> &controllers) {
+        size_t size = 0;
+        for (const auto &c : controllers) {
+            size += c->get_state_size();
+        }
+        return size;
+    }
+
+    /** @brief Size of the blob in bytes, extra_size is number of floats stored for articulations and controllers. */
+    static size_t blob_size(size_t num_actors, size_t num_joints, size_t extra_size) {
+        return sizeof(Header) +
+               sizeof(float) * (actor_row_size * num_actors + joint_row_size * num_joints + extra_size);
+    }
+};
+
+#endif //PYPHYSX_SCENESTATE_H
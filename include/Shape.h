@@ -12,6 +12,7 @@
 #include <BasePhysxPointer.h>
 #include <Material.h>
 #include <Physics.h>
+#include <ConvexMeshCache.h>
 #include <transformation_utils.h>
 #include <array>
 #include <iostream>
@@ -114,7 +115,9 @@ public:
         return Shape::from_geometry(physx::PxSphereGeometry(radius), mat, is_exclusive);
     }
 
-    /** @brief Given sequence of points (nx3 matrix), cook convex mesh and create shape from it. */
+    /** @brief Given sequence of points (nx3 matrix), cook convex mesh and create shape from it. Cooked meshes are
+     * cached, i.e. the same points with the same cooking parameters share the PxConvexMesh and only scale differs.
+     * If cache directory is set, cooked data are loaded from/stored to it. */
     static Shape create_convex_mesh_from_points(const Eigen::MatrixXf &points, Material mat, bool is_exclusive,
                                                 float scale, size_t quantized_count, size_t vertex_limit) {
         using namespace physx;
@@ -123,6 +126,18 @@ public:
             vertices[i] = PxVec3(points(i, 0), points(i, 1), points(i, 2));
         }
 
+        auto &cache = ConvexMeshCache::get();
+        auto mesh = cache.find(vertices, quantized_count, vertex_limit);
+        if (mesh != nullptr) {
+            return Shape::from_geometry(PxConvexMeshGeometry(mesh, PxMeshScale(scale)), mat, is_exclusive);
+        }
+        mesh = cache.load_from_disk(vertices, quantized_count, vertex_limit);
+        if (mesh != nullptr) {
+            auto shape = Shape::from_geometry(PxConvexMeshGeometry(mesh, PxMeshScale(scale)), mat, is_exclusive);
+            cache.insert(vertices, quantized_count, vertex_limit, mesh);
+            return shape;
+        }
+
         PxConvexMeshDesc convexDesc;
         convexDesc.points.count = vertices.size();
         convexDesc.points.stride = sizeof(PxVec3);
@@ -138,9 +153,12 @@ public:
             std::cout << "Cannot cook convex mesh from points. Returning unit sphere instead. " << std::endl;
             return Shape::from_geometry(PxSphereGeometry(1.), mat, is_exclusive);
         }
+        cache.save_to_disk(vertices, quantized_count, vertex_limit, buf.getData(), buf.getSize());
         PxDefaultMemoryInputData input(buf.getData(), buf.getSize());
-        auto geom = PxConvexMeshGeometry(Physics::get_physics()->createConvexMesh(input), PxMeshScale(scale));
-        return Shape::from_geometry(geom, mat, is_exclusive);
+        mesh = Physics::get_physics()->createConvexMesh(input);
+        auto shape = Shape::from_geometry(PxConvexMeshGeometry(mesh, PxMeshScale(scale)), mat, is_exclusive);
+        cache.insert(vertices, quantized_count, vertex_limit, mesh);
+        return shape;
     }
 
 private:
@@ -0,0 +1,83 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Persistent buffer with state of dynamic actors that is refreshed natively after each simulation step and
+ *     exposed to python as read-only numpy views without copying.
+ */
+
+#ifndef PYPHYSX_STATEBUFFER_H
+#define PYPHYSX_STATEBUFFER_H
+
+#include <PxPhysicsAPI.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <array_utils.h>
+#include <memory>
+#include <stdexcept>
+#include <vector>
+
+class StateBuffer {
+public:
+    /** @brief Number of floats per actor: pose [x,y,z,qw,qx,qy,qz], linear velocity, and angular velocity. */
+    static constexpr size_t row_size = 13;
+
+    bool is_enabled() const {
+        return data != nullptr;
+    }
+
+    /** @brief Enable or disable the buffer. Enabling already enabled buffer does nothing, i.e. views obtained before
+     * stay valid. */
+    void enable(bool enabled) {
+        if (!enabled) {
+            data = nullptr;
+        } else if (!is_enabled()) {
+            data = std::make_shared<std::vector<float>>();
+        }
+    }
+
+    /** @brief Copy state of the given actors into the buffer. The memory is reused if the number of actors has not
+     * changed, otherwise new memory is allocated and views obtained before keep the old state. GIL is not needed. */
+    void refresh(const std::vector<physx::PxRigidDynamic *> &actors) {
+        if (!is_enabled()) {
+            return;
+        }
+        if (data->size() != row_size * actors.size()) {
+            data = std::make_shared<std::vector<float>>(row_size * actors.size());
+        }
+        auto d = data->data();
+        for (size_t i = 0; i < actors.size(); ++i) {
+            pose_to_buffer(actors[i]->getGlobalPose(), d + row_size * i);
+            vec3_to_buffer(actors[i]->getLinearVelocity(), d + row_size * i + 7);
+            vec3_to_buffer(actors[i]->getAngularVelocity(), d + row_size * i + 10);
+        }
+    }
+
+    /** @brief Return tuple of read-only views (poses Nx7, linear velocities Nx3, angular velocities Nx3) into the
+     * buffer. The views keep the buffer memory alive. */
+    pybind11::tuple get_views() const {
+        if (!is_enabled()) {
+            throw std::runtime_error("State buffer is disabled, call enable_state_buffer first.");
+        }
+        auto holder = new std::shared_ptr<std::vector<float>>(data);
+        pybind11::capsule base(holder, [](void *p) {
+            delete reinterpret_cast<std::shared_ptr<std::vector<float>> *>(p);
+        });
+        const size_t n = data->size() / row_size;
+        const auto view = [&](size_t offset, size_t cols) {
+            // empty buffer has no memory to point into, hence empty arrays are created instead of the views
+            pybind11::array_t<float> arr = n == 0 ? pybind11::array_t<float>(std::vector<size_t>{0, cols}) :
+                                           pybind11::array_t<float>({n, cols}, {row_size * sizeof(float), sizeof(float)},
+                                                                    data->data() + offset, base);
+            arr.attr("setflags")(pybind11::arg("write") = false);
+            return arr;
+        };
+        return pybind11::make_tuple(view(0, 7), view(7, 3), view(10, 3));
+    }
+
+private:
+    std::shared_ptr<std::vector<float>> data;
+};
+
+#endif //PYPHYSX_STATEBUFFER_H
@@ -0,0 +1,223 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Utilities for batched exchange of actors data with numpy arrays.
+ *     Poses are stored in rows as [x, y, z, qw, qx, qy, qz], i.e. in the same order as the 7D array pose accepted by
+ *     the PxTransform caster.
+ */
+
+#ifndef PYPHYSX_ARRAY_UTILS_H
+#define PYPHYSX_ARRAY_UTILS_H
+
+#include <PxPhysicsAPI.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+#include <limits>
+#include <stdexcept>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+using input_float_array = pybind11::array_t<float, pybind11::array::c_style | pybind11::array::forcecast>;
+using input_index_array = pybind11::array_t<int64_t, pybind11::array::c_style | pybind11::array::forcecast>;
+
+/** @brief Return given output array if it is writable, C-contiguous float32 array of the given shape. If out is None
+ * new array of that shape is allocated. Exception is thrown otherwise, the data are never copied silently. */
+inline pybind11::array_t<float> get_output_array(const pybind11::object &out, const std::vector<size_t> &shape) {
+    if (out.is_none()) {
+        return pybind11::array_t<float>(shape);
+    }
+    if (!pybind11::isinstance<pybind11::array_t<float, pybind11::array::c_style>>(out)) {
+        throw std::invalid_argument("Output buffer must be C-contiguous numpy array of type float32.");
+    }
+    auto arr = pybind11::reinterpret_borrow<pybind11::array_t<float>>(out);
+    if (!arr.writeable()) {
+        throw std::invalid_argument("Output buffer must be writable.");
+    }
+    bool same_shape = size_t(arr.ndim()) == shape.size();
+    for (size_t i = 0; same_shape && i < shape.size(); ++i) {
+        same_shape = size_t(arr.shape(i)) == shape[i];
+    }
+    if (!same_shape) {
+        std::string expected;
+        for (const auto &s : shape) {
+            expected += (expected.empty() ? "" : ", ") + std::to_string(s);
+        }
+        throw std::invalid_argument("Output buffer must have shape (" + expected + ").");
+    }
+    return arr;
+}
+
+/** @brief Check that array is two dimensional with given number of columns and return its number of rows. If rows
+ * is specified, the number of rows is checked too. */
+inline size_t check_rows(const input_float_array &arr, size_t cols, const std::string &name, int64_t rows = -1) {
+    if (arr.ndim() != 2 || size_t(arr.shape(1)) != cols || (rows >= 0 && arr.shape(0) != rows)) {
+        throw std::invalid_argument(name + " must have shape (" + (rows >= 0 ? std::to_string(rows) : "N") + ", " +
+                                    std::to_string(cols) + ").");
+    }
+    return size_t(arr.shape(0));
+}
+
+/** @brief Write pose into the buffer of 7 floats. */
+inline void pose_to_buffer(const physx::PxTransform &pose, float *data) {
+    data[0] = pose.p.x;
+    data[1] = pose.p.y;
+    data[2] = pose.p.z;
+    data[3] = pose.q.w;
+    data[4] = pose.q.x;
+    data[5] = pose.q.y;
+    data[6] = pose.q.z;
+}
+
+/** @brief Write vector into the buffer of 3 floats. */
+inline void vec3_to_buffer(const physx::PxVec3 &v, float *data) {
+    data[0] = v.x;
+    data[1] = v.y;
+    data[2] = v.z;
+}
+
+/** @brief Read pose from the buffer of 7 floats. Quaternion is normalized. */
+inline physx::PxTransform pose_from_buffer(const float *data) {
+    return physx::PxTransform(physx::PxVec3(data[0], data[1], data[2]),
+                              physx::PxQuat(data[4], data[5], data[6], data[3]).getNormalized());
+}
+
+/** @brief Write poses of all actors into the Nx7 buffer. GIL is released during the copy. */
+template<class TActor>
+void fill_poses(const std::vector<TActor *> &actors, pybind11::array_t<float> &out) {
+    auto data = out.mutable_data();
+    pybind11::gil_scoped_release release;
+    for (size_t i = 0; i < actors.size(); ++i) {
+        pose_to_buffer(actors[i]->getGlobalPose(), data + 7 * i);
+    }
+}
+
+/** @brief Map actors to their index in the given vector. */
+template<class TActor>
+std::unordered_map<const physx::PxRigidActor *, int64_t> get_actors_indices(const std::vector<TActor *> &actors) {
+    std::unordered_map<const physx::PxRigidActor *, int64_t> indices;
+    for (size_t i = 0; i < actors.size(); ++i) {
+        indices[actors[i]] = int64_t(i);
+    }
+    return indices;
+}
+
+/** @brief Arrays of scene query results: distances (N), positions (Nx3), normals (Nx3), and actor indices (N).
+ * Queries without hit have infinite distance and actor index -1. Hit actors that are not indexed (e.g. static actors)
+ * have index -2. Arrays are allocated in constructor, hence the
+ * results can be written with released GIL. */
+class QueryHitArrays {
+public:
+    explicit QueryHitArrays(size_t n) : distances(n), positions(std::vector<size_t>{n, 3}),
+                                        normals(std::vector<size_t>{n, 3}), actor_indices(n),
+                                        d(distances.mutable_data()), p(positions.mutable_data()),
+                                        nr(normals.mutable_data()), a(actor_indices.mutable_data()) {}
+
+    /** @brief Store hit of i-th query. Actor index is looked up in the given map. */
+    template<class THit>
+    void write_hit(size_t i, const THit &hit, const std::unordered_map<const physx::PxRigidActor *, int64_t> &ind) {
+        d[i] = hit.distance;
+        vec3_to_buffer(hit.position, p + 3 * i);
+        vec3_to_buffer(hit.normal, nr + 3 * i);
+        const auto it = ind.find(hit.actor);
+        a[i] = it == ind.end() ? -2 : it->second;
+    }
+
+    void write_no_hit(size_t i) {
+        d[i] = std::numeric_limits<float>::infinity();
+        vec3_to_buffer(physx::PxVec3(0.f), p + 3 * i);
+        vec3_to_buffer(physx::PxVec3(0.f), nr + 3 * i);
+        a[i] = -1;
+    }
+
+    /** @brief Return results as tuple (distances, positions, normals, actor_indices). */
+    pybind11::tuple to_tuple() const {
+        return pybind11::make_tuple(distances, positions, normals, actor_indices);
+    }
+
+private:
+    pybind11::array_t<float> distances;
+    pybind11::array_t<float> positions;
+    pybind11::array_t<float> normals;
+    pybind11::array_t<int64_t> actor_indices;
+    float *d;
+    float *p;
+    float *nr;
+    int64_t *a;
+};
+
+/** @brief Cast rigid actors into rigid dynamics. Actors that are not dynamic are represented by nullptr. */
+inline std::vector<physx::PxRigidDynamic *> to_rigid_dynamic_ptrs(const std::vector<physx::PxRigidActor *> &actors) {
+    std::vector<physx::PxRigidDynamic *> dynamic_actors(actors.size());
+    for (size_t i = 0; i < actors.size(); ++i) {
+        dynamic_actors[i] = actors[i]->is<physx::PxRigidDynamic>();
+    }
+    return dynamic_actors;
+}
+
+/** @brief Call function f(actor, row) for each index and the corresponding row of Nxcols data array.
+ * Inputs are validated first and GIL is released for the loop itself. */
+template<class TActor, class TFunction>
+void apply_to_actors(const std::vector<TActor *> &actors, const input_index_array &indices,
+                     const input_float_array &data, size_t cols, TFunction f) {
+    if (indices.ndim() != 1) {
+        throw std::invalid_argument("Indices must be one dimensional array.");
+    }
+    const auto n = size_t(indices.shape(0));
+    if (data.ndim() != 2 || size_t(data.shape(0)) != n || size_t(data.shape(1)) != cols) {
+        throw std::invalid_argument("Data must have shape (" + std::to_string(n) + ", " + std::to_string(cols) + ").");
+    }
+    const auto ind = indices.data();
+    for (size_t i = 0; i < n; ++i) {
+        if (ind[i] < 0 || size_t(ind[i]) >= actors.size()) {
+            throw std::out_of_range("Actor index " + std::to_string(ind[i]) + " is out of range.");
+        }
+        if (actors[ind[i]] == nullptr) {
+            throw std::invalid_argument("Actor at index " + std::to_string(ind[i]) + " is not a rigid dynamic.");
+        }
+    }
+    const auto values = data.data();
+    pybind11::gil_scoped_release release;
+    for (size_t i = 0; i < n; ++i) {
+        f(actors[ind[i]], values + cols * i);
+    }
+}
+
+template<class TActor>
+void set_poses(const std::vector<TActor *> &actors, const input_index_array &indices, const input_float_array &poses) {
+    apply_to_actors(actors, indices, poses, 7, [](TActor *a, const float *d) {
+        a->setGlobalPose(pose_from_buffer(d));
+    });
+}
+
+inline void set_linear_velocities(const std::vector<physx::PxRigidDynamic *> &actors,
+                                  const input_index_array &indices, const input_float_array &velocities) {
+    apply_to_actors(actors, indices, velocities, 3, [](physx::PxRigidDynamic *a, const float *d) {
+        a->setLinearVelocity(physx::PxVec3(d[0], d[1], d[2]));
+    });
+}
+
+inline void set_angular_velocities(const std::vector<physx::PxRigidDynamic *> &actors,
+                                   const input_index_array &indices, const input_float_array &velocities) {
+    apply_to_actors(actors, indices, velocities, 3, [](physx::PxRigidDynamic *a, const float *d) {
+        a->setAngularVelocity(physx::PxVec3(d[0], d[1], d[2]));
+    });
+}
+
+inline void add_forces(const std::vector<physx::PxRigidDynamic *> &actors, const input_index_array &indices,
+                       const input_float_array &forces, physx::PxForceMode::Enum force_mode) {
+    apply_to_actors(actors, indices, forces, 3, [force_mode](physx::PxRigidDynamic *a, const float *d) {
+        a->addForce(physx::PxVec3(d[0], d[1], d[2]), force_mode);
+    });
+}
+
+inline void add_torques(const std::vector<physx::PxRigidDynamic *> &actors, const input_index_array &indices,
+                        const input_float_array &torques, physx::PxForceMode::Enum torque_mode) {
+    apply_to_actors(actors, indices, torques, 3, [torque_mode](physx::PxRigidDynamic *a, const float *d) {
+        a->addTorque(physx::PxVec3(d[0], d[1], d[2]), torque_mode);
+    });
+}
+
+#endif //PYPHYSX_ARRAY_UTILS_H
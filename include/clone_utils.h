@@ -0,0 +1,141 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Utilities for cloning content of the scene into another scene. Exclusive shapes are cloned, shared shapes,
+ *     materials and cooked meshes are shared between the original and the clone.
+ */
+
+#ifndef PYPHYSX_CLONE_UTILS_H
+#define PYPHYSX_CLONE_UTILS_H
+
+#include <PxPhysicsAPI.h>
+#include <Physics.h>
+#include <pybind11/pybind11.h>
+#include <SceneState.h>
+#include <unordered_map>
+#include <vector>
+
+/** @brief Copy python user data pointer. Reference count is increased as in set_user_data. GIL is required. */
+inline void copy_user_data(const void *from, void *&to) {
+    if (from != nullptr) {
+        pybind11::handle(static_cast<PyObject *>(const_cast<void *>(from))).inc_ref();
+    }
+    to = const_cast<void *>(from);
+}
+
+/** @brief Clone rigid actor including its shapes, flags, mass properties, velocities and user data. The clone is not
+ * added into any scene. */
+inline physx::PxRigidActor *clone_rigid_actor(const physx::PxRigidActor &from) {
+    physx::PxRigidActor *to;
+    if (from.is<physx::PxRigidDynamic>() != nullptr) {
+        const auto &dyn = *from.is<physx::PxRigidDynamic>();
+        auto to_dyn = physx::PxCloneDynamic(*Physics::get_physics(), from.getGlobalPose(), dyn);
+        if (!dyn.getRigidBodyFlags().isSet(physx::PxRigidBodyFlag::eKINEMATIC)) {
+            to_dyn->setLinearVelocity(dyn.getLinearVelocity());
+            to_dyn->setAngularVelocity(dyn.getAngularVelocity());
+        }
+        to = to_dyn;
+    } else {
+        to = physx::PxCloneStatic(*Physics::get_physics(), from.getGlobalPose(), from);
+    }
+    copy_user_data(from.userData, to->userData);
+    const auto n = from.getNbShapes();
+    std::vector<physx::PxShape *> from_shapes(n), to_shapes(n);
+    from.getShapes(from_shapes.data(), n);
+    to->getShapes(to_shapes.data(), n);
+    for (size_t i = 0; i < n; ++i) {
+        if (from_shapes[i] != to_shapes[i]) { // shared shapes keep their user data
+            copy_user_data(from_shapes[i]->userData, to_shapes[i]->userData);
+        }
+    }
+    return to;
+}
+
+/** @brief Clone D6 joint between the given actors, all joint parameters, limits, drives and targets are copied. */
+inline physx::PxD6Joint *clone_d6_joint(const physx::PxD6Joint &from, physx::PxRigidActor *actor0,
+                                        physx::PxRigidActor *actor1) {
+    auto to = physx::PxD6JointCreate(*Physics::get_physics(),
+                                     actor0, from.getLocalPose(physx::PxJointActorIndex::eACTOR0),
+                                     actor1, from.getLocalPose(physx::PxJointActorIndex::eACTOR1));
+    for (size_t i = 0; i < physx::PxD6Axis::eCOUNT; ++i) {
+        const auto axis = static_cast<physx::PxD6Axis::Enum>(i);
+        to->setMotion(axis, from.getMotion(axis));
+    }
+    for (const auto &axis : {physx::PxD6Axis::eX, physx::PxD6Axis::eY, physx::PxD6Axis::eZ}) {
+        to->setLinearLimit(axis, from.getLinearLimit(axis));
+    }
+    to->setTwistLimit(from.getTwistLimit());
+    to->setSwingLimit(from.getSwingLimit());
+    to->setPyramidSwingLimit(from.getPyramidSwingLimit());
+    to->setDistanceLimit(from.getDistanceLimit());
+    for (size_t i = 0; i < physx::PxD6Drive::eCOUNT; ++i) {
+        const auto drive = static_cast<physx::PxD6Drive::Enum>(i);
+        to->setDrive(drive, from.getDrive(drive));
+    }
+    to->setDrivePosition(from.getDrivePosition());
+    physx::PxVec3 lin, ang;
+    from.getDriveVelocity(lin, ang);
+    to->setDriveVelocity(lin, ang);
+    physx::PxReal force, torque;
+    from.getBreakForce(force, torque);
+    to->setBreakForce(force, torque);
+    to->setConstraintFlags(from.getConstraintFlags() & ~physx::PxConstraintFlags(physx::PxConstraintFlag::eBROKEN));
+    to->setProjectionLinearTolerance(from.getProjectionLinearTolerance());
+    to->setProjectionAngularTolerance(from.getProjectionAngularTolerance());
+    to->setInvMassScale0(from.getInvMassScale0());
+    to->setInvMassScale1(from.getInvMassScale1());
+    to->setInvInertiaScale0(from.getInvInertiaScale0());
+    to->setInvInertiaScale1(from.getInvInertiaScale1());
+    return to;
+}
+
+/** @brief Clone all rigid actors, aggregates and D6 joints of the scene from into the scene to. Actors are added in
+ * the order of the original scene, i.e. get_dynamic_rigid_actors of both scenes match as long as aggregates were
+ * populated before they were added into the scene. GIL is required for user data. */
+inline void clone_scene_content(physx::PxScene &from, physx::PxScene &to) {
+    to.setGravity(from.getGravity());
+    const auto types = physx::PxActorTypeFlag::eRIGID_DYNAMIC | physx::PxActorTypeFlag::eRIGID_STATIC;
+    const auto n = from.getNbActors(types);
+    std::vector<physx::PxRigidActor *> actors(n);
+    from.getActors(types, reinterpret_cast<physx::PxActor **>(actors.data()), n);
+
+    std::unordered_map<const physx::PxRigidActor *, physx::PxRigidActor *> clones;
+    for (const auto &a : actors) {
+        if (clones.count(a) > 0) { // already cloned as part of an aggregate
+            continue;
+        }
+        const auto agg = a->getAggregate();
+        if (agg == nullptr) {
+            clones[a] = clone_rigid_actor(*a);
+            to.addActor(*clones[a]);
+            continue;
+        }
+        auto to_agg = Physics::get_physics()->createAggregate(agg->getMaxNbActors(), agg->getSelfCollision());
+        const auto m = agg->getNbActors();
+        std::vector<physx::PxRigidActor *> agg_actors(m);
+        agg->getActors(reinterpret_cast<physx::PxActor **>(agg_actors.data()), m);
+        for (const auto &aa : agg_actors) {
+            clones[aa] = clone_rigid_actor(*aa);
+            to_agg->addActor(*clones[aa]);
+        }
+        to.addAggregate(*to_agg);
+    }
+
+    for (const auto &a : actors) { // kinematic targets can be set only for actors in the scene
+        const auto dyn = a->is<physx::PxRigidDynamic>();
+        physx::PxTransform target;
+        if (dyn != nullptr && dyn->getKinematicTarget(target)) {
+            clones[a]->is<physx::PxRigidDynamic>()->setKinematicTarget(target);
+        }
+    }
+
+    for (const auto &j : get_scene_d6_joints(&from)) {
+        physx::PxRigidActor *a0, *a1;
+        j->getActors(a0, a1);
+        clone_d6_joint(*j, a0 == nullptr ? nullptr : clones.at(a0), a1 == nullptr ? nullptr : clones.at(a1));
+    }
+}
+
+#endif //PYPHYSX_CLONE_UTILS_H
@@ -0,0 +1,149 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Utilities for finding overlapping actors. Candidate pairs are pruned by sort and sweep of the actors world AABBs
+ *     and only the candidates are tested by exact geometry queries of their shapes. Only simulation shapes are
+ *     considered, i.e. visual only shapes never collide.
+ */
+
+#ifndef PYPHYSX_COLLISION_UTILS_H
+#define PYPHYSX_COLLISION_UTILS_H
+
+#include <PxPhysicsAPI.h>
+#include <RigidActor.h>
+#include <array_utils.h>
+#include <algorithm>
+#include <utility>
+#include <vector>
+
+/** @brief Shapes geometries of a single actor with their global poses and the actor world bounds. */
+struct ActorGeometries {
+    std::vector<physx::PxGeometryHolder> geometries;
+    std::vector<physx::PxTransform> poses;
+    physx::PxBounds3 bounds = physx::PxBounds3::empty();
+
+    /** @brief Collect shapes of the actor placed at the given global pose of the actor. */
+    static ActorGeometries from_actor(const physx::PxRigidActor *actor, const physx::PxTransform &actor_pose) {
+        ActorGeometries g;
+        std::vector<physx::PxShape *> shapes(actor->getNbShapes());
+        actor->getShapes(shapes.data(), physx::PxU32(shapes.size()));
+        for (const auto &shape : shapes) {
+            if (!shape->getFlags().isSet(physx::PxShapeFlag::eSIMULATION_SHAPE)) {
+                continue;
+            }
+            g.geometries.push_back(shape->getGeometry());
+            g.poses.push_back(actor_pose * shape->getLocalPose());
+            g.bounds.include(physx::PxGeometryQuery::getWorldBounds(g.geometries.back().any(), g.poses.back()));
+        }
+        return g;
+    }
+
+    /** @brief Exact test if any shape of this actor overlaps with any shape of the other actor. */
+    bool overlaps(const ActorGeometries &other) const {
+        for (size_t i = 0; i < geometries.size(); ++i) {
+            for (size_t j = 0; j < other.geometries.size(); ++j) {
+                if (physx::PxGeometryQuery::overlap(geometries[i].any(), poses[i], other.geometries[j].any(),
+                                                    other.poses[j])) {
+                    return true;
+                }
+            }
+        }
+        return false;
+    }
+};
+
+/** @brief Call f(i, j) for all pairs i < j of actors whose AABBs overlap. Sort and sweep along x axis is used.
+ * Iteration is stopped if f returns true. */
+template<class TFunction>
+void for_each_bounds_overlapping_pair(const std::vector<ActorGeometries> &actors, TFunction f) {
+    std::vector<size_t> order;
+    for (size_t i = 0; i < actors.size(); ++i) {
+        if (!actors[i].bounds.isEmpty()) {
+            order.push_back(i);
+        }
+    }
+    std::sort(order.begin(), order.end(), [&actors](size_t a, size_t b) {
+        return actors[a].bounds.minimum.x < actors[b].bounds.minimum.x;
+    });
+    std::vector<size_t> active;
+    for (const auto &i : order) {
+        const auto &bi = actors[i].bounds;
+        active.erase(std::remove_if(active.begin(), active.end(), [&actors, &bi](size_t j) {
+            return actors[j].bounds.maximum.x < bi.minimum.x;
+        }), active.end());
+        for (const auto &j : active) {
+            if (bi.intersects(actors[j].bounds) && f(std::min(i, j), std::max(i, j))) {
+                return;
+            }
+        }
+        active.push_back(i);
+    }
+}
+
+/** @brief Find all pairs (i, j), i < j, of overlapping actors. Pairs are sorted. */
+inline std::vector<std::pair<size_t, size_t>> find_overlapping_pairs(const std::vector<ActorGeometries> &actors) {
+    std::vector<std::pair<size_t, size_t>> pairs;
+    for_each_bounds_overlapping_pair(actors, [&actors, &pairs](size_t i, size_t j) {
+        if (actors[i].overlaps(actors[j])) {
+            pairs.emplace_back(i, j);
+        }
+        return false;
+    });
+    std::sort(pairs.begin(), pairs.end());
+    return pairs;
+}
+
+/** @brief Check collisions of the links placed at M configurations given by link poses (M x L x 7). Link pairs given
+ * by self_collision_pairs (K x 2) are checked against each other and all links are checked against environment actors
+ * at their current poses. Return boolean array of size M, true if the configuration is in collision. Simulation state
+ * is not modified. */
+inline pybind11::array_t<bool> check_collisions_batch(const std::vector<RigidActor> &links, const input_float_array &poses,
+                                                      const input_index_array &self_collision_pairs,
+                                                      const std::vector<RigidActor> &environment) {
+    const auto l = links.size();
+    if (poses.ndim() != 3 || size_t(poses.shape(1)) != l || poses.shape(2) != 7) {
+        throw std::invalid_argument("Poses must have shape (M, " + std::to_string(l) + ", 7).");
+    }
+    if (self_collision_pairs.ndim() != 2 || self_collision_pairs.shape(1) != 2) {
+        throw std::invalid_argument("Self collision pairs must have shape (K, 2).");
+    }
+    std::vector<bool> allowed(l * l, false);
+    const auto pairs = self_collision_pairs.data();
+    for (size_t k = 0; k < size_t(self_collision_pairs.shape(0)); ++k) {
+        const auto i = pairs[2 * k];
+        const auto j = pairs[2 * k + 1];
+        if (i < 0 || j < 0 || size_t(i) >= l || size_t(j) >= l) {
+            throw std::out_of_range("Self collision pair index is out of range.");
+        }
+        allowed[i * l + j] = true;
+        allowed[j * l + i] = true;
+    }
+    const auto m = size_t(poses.shape(0));
+    pybind11::array_t<bool> res(m);
+    auto collides = res.mutable_data();
+    const auto pose_data = poses.data();
+    {
+        pybind11::gil_scoped_release release;
+        std::vector<ActorGeometries> geometries(l);
+        for (const auto &a : environment) {
+            geometries.push_back(ActorGeometries::from_actor(a.get_physx_ptr(), a.get_physx_ptr()->getGlobalPose()));
+        }
+        for (size_t c = 0; c < m; ++c) {
+            for (size_t i = 0; i < l; ++i) {
+                geometries[i] = ActorGeometries::from_actor(links[i].get_physx_ptr(),
+                                                            pose_from_buffer(pose_data + 7 * (c * l + i)));
+            }
+            collides[c] = false;
+            for_each_bounds_overlapping_pair(geometries, [&](size_t i, size_t j) {
+                const auto checked = i < l && (j >= l || allowed[i * l + j]); // i < j, environment is at the end
+                collides[c] = checked && geometries[i].overlaps(geometries[j]);
+                return collides[c];
+            });
+        }
+    }
+    return res;
+}
+
+#endif //PYPHYSX_COLLISION_UTILS_H
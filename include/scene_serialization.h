@@ -0,0 +1,94 @@
+/**
+ * Copyright (c) CTU  - All Rights Reserved
+ * Created on: 10/17/26
+ *     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+ *
+ *     Export and load content of the scene (actors, shapes, materials, meshes, aggregates, and joints) through PhysX
+ *     serialization. Binary collections are loaded from memory mapped files, i.e. the deserialized objects live
+ *     directly in the copy-on-write mapping of the file. Python user data are not exported.
+ */
+
+#ifndef PYPHYSX_SCENE_SERIALIZATION_H
+#define PYPHYSX_SCENE_SERIALIZATION_H
+
+#include <PxPhysicsAPI.h>
+#include <Physics.h>
+#include <MappedFile.h>
+#include <SceneState.h>
+#include <memory>
+#include <stdexcept>
+#include <string>
+
+inline void check_serialization_format(const std::string &format) {
+    if (format != "binary" && format != "xml") {
+        throw std::invalid_argument("Unknown serialization format '" + format + "', use 'binary' or 'xml'.");
+    }
+}
+
+/** @brief Serialize all objects of the scene into the file in the given format ("binary" or "xml"). */
+inline void export_scene(physx::PxScene &scene, const std::string &path, const std::string &format) {
+    check_serialization_format(format);
+    const auto registry = Physics::get_serialization_registry();
+    auto collection = PxCreateCollection();
+    physx::PxCollectionExt::collectObjects(*collection, scene);
+    for (const auto &j : get_scene_d6_joints(&scene)) {
+        if (!collection->contains(*j)) {
+            collection->add(*j);
+        }
+    }
+    physx::PxSerialization::complete(*collection, *registry);
+    physx::PxSerialization::createSerialObjectIds(*collection, physx::PxSerialObjectId(1));
+    physx::PxDefaultFileOutputStream out(path.c_str());
+    if (!out.isValid()) {
+        collection->release();
+        throw std::invalid_argument("Cannot open file '" + path + "' for writing.");
+    }
+    const bool success = format == "binary"
+                         ? physx::PxSerialization::serializeCollectionToBinary(out, *collection, *registry)
+                         : physx::PxSerialization::serializeCollectionToXml(out, *collection, *registry,
+                                                                            Physics::get().cooking);
+    collection->release();
+    if (!success) {
+        throw std::runtime_error("Serialization of the scene into '" + path + "' failed.");
+    }
+}
+
+/** @brief Deserialize objects from the file created by export_scene and add them into the scene. */
+inline void load_scene(physx::PxScene &scene, const std::string &path, const std::string &format) {
+    check_serialization_format(format);
+    const auto registry = Physics::get_serialization_registry();
+    physx::PxCollection *collection = nullptr;
+    if (format == "binary") {
+        auto file = std::make_shared<MappedFile>(path, true);
+        if (file->data() == nullptr) {
+            throw std::invalid_argument("Cannot read file '" + path + "'.");
+        }
+        collection = physx::PxSerialization::createCollectionFromBinary(file->mutable_data(), *registry);
+        if (collection != nullptr) { // objects are stored in the mapped memory
+            Physics::keep_alive(file);
+        }
+    } else {
+        physx::PxDefaultFileInputData data(path.c_str());
+        if (!data.isValid()) {
+            throw std::invalid_argument("Cannot read file '" + path + "'.");
+        }
+        collection = physx::PxSerialization::createCollectionFromXml(data, *Physics::get().cooking, *registry);
+    }
+    if (collection == nullptr) {
+        throw std::runtime_error("Deserialization of the scene from '" + path + "' failed.");
+    }
+    for (size_t i = 0; i < collection->getNbObjects(); ++i) { // user data are not valid in this process
+        auto &object = collection->getObject(i);
+        if (auto actor = object.is<physx::PxRigidActor>()) {
+            actor->userData = nullptr;
+        } else if (auto shape = object.is<physx::PxShape>()) {
+            shape->userData = nullptr;
+        } else if (auto articulation = object.is<physx::PxArticulationReducedCoordinate>()) {
+            articulation->userData = nullptr;
+        }
+    }
+    scene.addCollection(*collection);
+    collection->release();
+}
+
+#endif //PYPHYSX_SCENE_SERIALIZATION_H
@@ -11,6 +11,18 @@
 #include <foundation/PxTransform.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/eigen.h>
+#include <pybind11/numpy.h>
+#include <stdexcept>
+#include <string>
+
+/**
+ * @brief Python type of numpy quaternion. Imported once, the handle is intentionally never released as it has to
+ * stay valid for the lifetime of the interpreter.
+ */
+inline pybind11::handle quaternion_type() {
+    static const pybind11::handle type = pybind11::module::import("quaternion").attr("quaternion").release();
+    return type;
+}
 
 namespace pybind11 {
     namespace detail {
@@ -24,6 +36,13 @@ namespace pybind11 {
 
             bool load(handle src, bool) {
                 if (!src) { return false; }
+                if (isinstance(src, quaternion_type())) { // components is float64 view, read without conversion
+                    const auto arr = src.attr("components").cast<pybind11::array_t<double, 0>>();
+                    const auto c = arr.data();
+                    value = physx::PxQuat(float(c[1]), float(c[2]), float(c[3]), float(c[0]));
+                    value.normalize();
+                    return true;
+                }
                 if (pybind11::hasattr(src, "x") && pybind11::hasattr(src, "y") && pybind11::hasattr(src, "z") &&
                     pybind11::hasattr(src, "w")) {
                     value.x = src.attr("x").cast<float>();
@@ -46,12 +65,7 @@ namespace pybind11 {
             }
 
             static handle cast(const physx::PxQuat &q, return_value_policy /* policy */, handle /* parent */) {
-                pybind11::object pyquat = pybind11::module::import("quaternion").attr("quaternion")();
-                pyquat.attr("x") = pybind11::cast(q.x);
-                pyquat.attr("y") = pybind11::cast(q.y);
-                pyquat.attr("z") = pybind11::cast(q.z);
-                pyquat.attr("w") = pybind11::cast(q.w);
-                return pyquat.release();
+                return quaternion_type()(q.w, q.x, q.y, q.z).release();
             }
         };
 
@@ -140,6 +154,29 @@ auto cast_transformation(const physx::PxTransform &transform) {
     return transform;
 }
 
+/**
+ * @brief Convert transformation into python object given by pose_format, either "tuple" for (pos, quat) or "array"
+ * for float32 array [x,y,z,qw,qx,qy,qz] that skips creation of the quaternion object.
+ */
+inline pybind11::object pose_to_python(const physx::PxTransform &pose, const std::string &pose_format) {
+    if (pose_format == "tuple") {
+        return pybind11::cast(pose);
+    }
+    if (pose_format == "array") {
+        pybind11::array_t<float> arr(7);
+        auto d = arr.mutable_data();
+        d[0] = pose.p.x;
+        d[1] = pose.p.y;
+        d[2] = pose.p.z;
+        d[3] = pose.q.w;
+        d[4] = pose.q.x;
+        d[5] = pose.q.y;
+        d[6] = pose.q.z;
+        return std::move(arr);
+    }
+    throw std::invalid_argument("Unknown pose format '" + pose_format + "', use 'tuple' or 'array'.");
+}
+
 template<class T>
 auto from_vector_of_physx_ptr(const std::vector<typename T::type_physx *> &ptrs) {
     std::vector<T> vec;
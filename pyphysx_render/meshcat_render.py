@@ -12,7 +12,8 @@ import trimesh.exchange.obj
 
 from pyphysx import ShapeFlag, GeometryType
 from pyphysx_render.render_base import ViewerBase
-from pyphysx_utils.transformations import multiply_transformations, pose_to_transformation_matrix
+from pyphysx_utils.transformations import pose_to_transformation_matrix, pose_to_array, multiply_pose_arrays, \
+    pose_arrays_to_transformation_matrices
 
 
 class MeshcatViewer(ViewerBase):
@@ -61,6 +62,7 @@ class MeshcatViewer(ViewerBase):
 
     def add_physx_scene(self, scene, render_shapes_with_one_of_flags=(ShapeFlag.VISUALIZATION,), offset=None):
         actors = scene.get_dynamic_rigid_actors() + scene.get_static_rigid_actors()
+        actors += [link for articulation in scene.get_articulations() for link in articulation.get_links()]
         start_index = self.get_start_index_for_next_scene()
         for i, actor in enumerate(actors, start=start_index):
             for j, shape in enumerate(actor.get_atached_shapes()):
@@ -72,17 +74,18 @@ class MeshcatViewer(ViewerBase):
                 self.vis_shape(i, j).set_transform(pose_to_transformation_matrix(shape.get_local_pose()))
             if self.show_frames:
                 self.vis_frame(i).set_object(g.triad(self.frame_scale))
-        self.actors_and_offsets.append((actors, offset, start_index))
+        self.actors_and_offsets.append((actors, pose_to_array(offset) if offset is not None else None, start_index))
 
     def _update_actors(self):
         for actors, offset, start_index in self.actors_and_offsets:
             for i, actor in enumerate(actors, start=start_index):
-                pose = actor.get_global_pose()
+                pose = actor.get_global_pose(pose_format="array")
                 if offset is not None:
-                    pose = multiply_transformations(offset, pose)
-                self.vis_actor(i).set_transform(pose_to_transformation_matrix(pose))
+                    pose = multiply_pose_arrays(offset, pose)
+                matrix = pose_arrays_to_transformation_matrices(pose)
+                self.vis_actor(i).set_transform(matrix)
                 if self.show_frames:
-                    self.vis_frame(i).set_transform(pose_to_transformation_matrix(pose))
+                    self.vis_frame(i).set_transform(matrix)
 
     def update(self, blocking=False):
         if self.animation is not None:
@@ -19,7 +19,7 @@ from pyphysx_render.render_base import ViewerBase
 from pyphysx import ShapeFlag, Shape, RigidActor, GeometryType
 
 from pyphysx_render.utils import gl_color_from_matplotlib
-from pyphysx_utils.transformations import multiply_transformations, pose_to_transformation_matrix
+from pyphysx_utils.transformations import pose_to_array, multiply_pose_arrays, pose_arrays_to_transformation_matrices
 
 
 class PyRenderBase(ViewerBase):
@@ -55,15 +55,17 @@ class PyRenderBase(ViewerBase):
 
     @staticmethod
     def _get_actor_pose_matrix(actor, offset):
-        """ Get actor transformation matrix with applied offset if not none. """
-        pose = actor.get_global_pose()
+        """ Get actor transformation matrix with applied offset (pose array) if not none. """
+        pose = actor.get_global_pose(pose_format="array")
         if offset is not None:
-            pose = multiply_transformations(offset, pose)
-        return pose_to_transformation_matrix(pose)
+            pose = multiply_pose_arrays(offset, pose)
+        return pose_arrays_to_transformation_matrices(pose)
 
     def add_physx_scene(self, scene, render_shapes_with_one_of_flags=(ShapeFlag.VISUALIZATION,), offset=None):
         """ Call this function to create a renderer scene from physx scene. """
+        offset = pose_to_array(offset) if offset is not None else None
         actors = scene.get_dynamic_rigid_actors() + scene.get_static_rigid_actors()
+        actors += [link for articulation in scene.get_articulations() for link in articulation.get_links()]
         for i, actor in enumerate(actors):
             n = self.actor_to_node(actor, render_shapes_with_one_of_flags)
             if n is not None:
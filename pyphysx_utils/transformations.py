@@ -11,16 +11,12 @@ import numpy as np
 
 def multiply_transformations(pose1, pose2):
     """ Given two poses T_1 and T_2, represented by position and quaternion, compute T_1 * T_2. """
-    pose1 = pose_ensure_complete(pose1)
-    pose2 = pose_ensure_complete(pose2)
-    return npq.rotate_vectors(pose1[1], pose2[0]) + pose1[0], pose1[1] * pose2[1]
+    return array_to_pose(multiply_pose_arrays(pose_to_array(pose1), pose_to_array(pose2)))
 
 
 def inverse_transform(pose):
     """ Inverse transformation. """
-    pose = pose_ensure_complete(pose)
-    qinv: npq.quaternion = pose[1].inverse()
-    return -npq.rotate_vectors(qinv, pose[0]), qinv
+    return array_to_pose(inverse_pose_arrays(pose_to_array(pose)))
 
 
 def pose_ensure_complete(pose):
@@ -34,11 +30,7 @@ def pose_ensure_complete(pose):
 
 def pose_to_transformation_matrix(pose):
     """ Convert given pose to 4x4 transformation matrix. """
-    pose = pose_ensure_complete(pose)
-    transformation = np.eye(4)
-    transformation[:3, :3] = npq.as_rotation_matrix(pose[1])
-    transformation[:3, 3] = pose[0]
-    return transformation
+    return pose_arrays_to_transformation_matrices(pose_to_array(pose))
 
 
 def unit_pose():
@@ -48,19 +40,7 @@ def unit_pose():
 
 def quat_from_euler(seq='xyz', angles=None):
     """ Compute quaternion from intrinsic (e.g. 'XYZ') or extrinsic (fixed axis, e.g. 'xyz') euler angles. """
-    angles = np.atleast_1d(angles)
-    q = npq.one
-    for s, a in zip(seq, angles):
-        axis = np.array([
-            1 if s.capitalize() == 'X' else 0,
-            1 if s.capitalize() == 'Y' else 0,
-            1 if s.capitalize() == 'Z' else 0,
-        ])
-        if s.isupper():
-            q = q * npq.from_rotation_vector(axis * a)
-        else:
-            q = npq.from_rotation_vector(axis * a) * q
-    return q
+    return npq.from_float_array(quat_arrays_from_euler(seq, np.atleast_1d(angles)))
 
 
 def quat_between_two_vectors(v, u) -> npq.quaternion:
@@ -74,3 +54,123 @@ def quat_between_two_vectors(v, u) -> npq.quaternion:
     ang_cosine = np.dot(v, u)
     ang = np.arctan2(ang_sine, ang_cosine)
     return npq.from_rotation_vector(vec / ang_sine * ang)
+
+
+# Batched pose API: poses are stored in the last axis of an array as [x,y,z,qw,qx,qy,qz] and unit quaternions as
+# [w,x,y,z]. Arrays are broadcast against each other, i.e. a batch of poses can be combined with a single pose.
+
+
+def pose_to_array(pose):
+    """ Convert given pose to array [x,y,z,qw,qx,qy,qz]. Complete poses (pos, quat) and 7D arrays are converted
+        directly, other representations are cast by cast_transformation. Quaternion is assumed to be unit. """
+    if isinstance(pose, tuple) and len(pose) == 2 and isinstance(pose[1], npq.quaternion) and len(pose[0]) == 3:
+        return np.concatenate([np.asarray(pose[0], dtype=float), npq.as_float_array(pose[1])])
+    if isinstance(pose, np.ndarray) and pose.shape == (7,):
+        return pose.astype(float)
+    pose = cast_transformation(pose)
+    return np.concatenate([pose[0], npq.as_float_array(pose[1])])
+
+
+def array_to_pose(arr):
+    """ Convert array [x,y,z,qw,qx,qy,qz] to pose represented by position and quaternion. """
+    arr = np.asarray(arr)
+    return arr[:3].copy(), npq.from_float_array(arr[3:])
+
+
+def multiply_quaternion_arrays(q1, q2):
+    """ Multiply quaternions stored in the last axis as [w,x,y,z]. Arrays are broadcast against each other. """
+    w1, x1, y1, z1 = np.moveaxis(np.asarray(q1), -1, 0)
+    w2, x2, y2, z2 = np.moveaxis(np.asarray(q2), -1, 0)
+    return np.stack([
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+    ], axis=-1)
+
+
+def rotate_vector_arrays(q, v):
+    """ Rotate vectors stored in the last axis of v by unit quaternions [w,x,y,z] stored in the last axis of q. """
+    q = np.asarray(q)
+    u = q[..., 1:]
+    t = 2 * np.cross(u, v)
+    return v + q[..., :1] * t + np.cross(u, t)
+
+
+def multiply_pose_arrays(pose1, pose2):
+    """ Compute T_1 * T_2 for poses stored in the last axis as [x,y,z,qw,qx,qy,qz]. Arrays are broadcast against each
+        other, i.e. one can multiply batch of poses by a single pose. """
+    pose1 = np.asarray(pose1)
+    pose2 = np.asarray(pose2)
+    return np.concatenate([
+        rotate_vector_arrays(pose1[..., 3:], pose2[..., :3]) + pose1[..., :3],
+        multiply_quaternion_arrays(pose1[..., 3:], pose2[..., 3:]),
+    ], axis=-1)
+
+
+def inverse_pose_arrays(pose):
+    """ Compute inverse of poses stored in arrays. """
+    pose = np.asarray(pose)
+    q_inv = pose[..., 3:] * [1., -1., -1., -1.]
+    return np.concatenate([-rotate_vector_arrays(q_inv, pose[..., :3]), q_inv], axis=-1)
+
+
+def pose_arrays_to_transformation_matrices(pose):
+    """ Convert poses stored in arrays (...x7) to transformation matrices (...x4x4). """
+    pose = np.asarray(pose)
+    w, x, y, z = np.moveaxis(pose[..., 3:], -1, 0)
+    t = np.zeros(pose.shape[:-1] + (4, 4))
+    t[..., 0, 0] = 1 - 2 * (y * y + z * z)
+    t[..., 0, 1] = 2 * (x * y - z * w)
+    t[..., 0, 2] = 2 * (x * z + y * w)
+    t[..., 1, 0] = 2 * (x * y + z * w)
+    t[..., 1, 1] = 1 - 2 * (x * x + z * z)
+    t[..., 1, 2] = 2 * (y * z - x * w)
+    t[..., 2, 0] = 2 * (x * z - y * w)
+    t[..., 2, 1] = 2 * (y * z + x * w)
+    t[..., 2, 2] = 1 - 2 * (x * x + y * y)
+    t[..., :3, 3] = pose[..., :3]
+    t[..., 3, 3] = 1.
+    return t
+
+
+def quat_arrays_from_euler(seq='xyz', angles=None):
+    """ Compute quaternions from euler angles stored in the last axis of angles, see quat_from_euler for the sequence
+        specification. Returns array of quaternions (...x4). """
+    angles = np.asarray(angles, dtype=float)
+    q = np.zeros(angles.shape[:-1] + (4,))
+    q[..., 0] = 1.
+    for i, s in enumerate(seq[:angles.shape[-1]]):
+        r = np.zeros_like(q)
+        r[..., 0] = np.cos(angles[..., i] / 2)
+        r[..., 1 + 'xyz'.index(s.lower())] = np.sin(angles[..., i] / 2)
+        q = multiply_quaternion_arrays(q, r) if s.isupper() else multiply_quaternion_arrays(r, q)
+    return q
+
+
+def slerp_quaternion_arrays(q1, q2, t):
+    """ Spherical linear interpolation between quaternions q1 (for t=0) and q2 (for t=1). Shortest path is used. """
+    q1 = np.asarray(q1, dtype=float)
+    q2 = np.asarray(q2, dtype=float)
+    t = np.asarray(t, dtype=float)[..., None]
+    dot = np.sum(q1 * q2, axis=-1, keepdims=True)
+    q2 = np.where(dot < 0, -q2, q2)
+    theta = np.arccos(np.clip(np.abs(dot), 0., 1.))
+    sin_theta = np.sin(theta)
+    small = sin_theta < 1e-6  # linear interpolation for close quaternions
+    sin_theta = np.where(small, 1., sin_theta)
+    w1 = np.where(small, 1. - t, np.sin((1. - t) * theta) / sin_theta)
+    w2 = np.where(small, t, np.sin(t * theta) / sin_theta)
+    q = w1 * q1 + w2 * q2
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def slerp_pose_arrays(pose1, pose2, t):
+    """ Interpolate poses: linear interpolation of positions and spherical interpolation of quaternions. """
+    pose1 = np.asarray(pose1, dtype=float)
+    pose2 = np.asarray(pose2, dtype=float)
+    tp = np.asarray(t, dtype=float)[..., None]
+    return np.concatenate([
+        (1. - tp) * pose1[..., :3] + tp * pose2[..., :3],
+        slerp_quaternion_arrays(pose1[..., 3:], pose2[..., 3:], t),
+    ], axis=-1)
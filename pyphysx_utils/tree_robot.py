@@ -14,6 +14,9 @@
 #
 # Root link can be optionally attached to an existing actor or to a static world pose.
 #
+# Robot is simulated either by dynamic actors connected by D6 joints or by reduced coordinate articulation, selected
+# at construction.
+#
 
 from typing import Dict, Optional
 
@@ -21,7 +24,8 @@ import numpy as np
 import quaternion as npq
 import anytree
 
-from pyphysx_utils.transformations import multiply_transformations, inverse_transform, unit_pose, quat_from_euler
+from pyphysx_utils.transformations import multiply_transformations, inverse_transform, unit_pose, quat_from_euler, \
+    pose_to_array, array_to_pose, multiply_pose_arrays
 from pyphysx import *
 
 
@@ -35,6 +39,7 @@ class KinematicPhysXJoint:
         self.local_pose0 = cast_transformation(local_pose0) if local_pose0 is not None else unit_pose()
         self.local_pose1 = cast_transformation(local_pose1) if local_pose1 is not None else unit_pose()
         self.motion = D6Motion.LOCKED
+        self.drive = None  # configuration of drive, transferred to the articulation joint if created
 
     def get_local_pose(self, actor_id):
         return self.local_pose0 if actor_id == 0 else self.local_pose1
@@ -66,7 +71,59 @@ class KinematicPhysXJoint:
         pass
 
     def set_drive(self, axis, stiffness=0, damping=0, force_limit=0, is_acceleration=False):
-        pass
+        self.drive = dict(stiffness=stiffness, damping=damping, force_limit=force_limit,
+                          is_acceleration=is_acceleration)
+
+
+class ArticulationPhysXJoint:
+    """ Class that provides same functions as D6Joint but for movable joint of the articulation. The joint connects
+        given articulation link to its parent. """
+
+    def __init__(self, articulation, link, joint_type, local_pose0=None, local_pose1=None) -> None:
+        super().__init__()
+        self.articulation = articulation
+        self.link = link
+        self.joint_type = joint_type
+        self.local_pose0 = cast_transformation(local_pose0) if local_pose0 is not None else unit_pose()
+        self.local_pose1 = cast_transformation(local_pose1) if local_pose1 is not None else unit_pose()
+
+    def get_local_pose(self, actor_id):
+        return self.local_pose0 if actor_id == 0 else self.local_pose1
+
+    def set_motion(self, axis, motion):
+        if motion == D6Motion.FREE:
+            self.articulation.set_joint_limits(self.link)
+
+    def get_motion(self, axis):
+        lower, upper = self.articulation.get_joint_limits(self.link)
+        return D6Motion.FREE if np.isinf(lower) and np.isinf(upper) else D6Motion.LIMITED
+
+    def set_linear_limit(self, axis, lower_limit, upper_limit):
+        self.articulation.set_joint_limits(self.link, lower_limit, upper_limit)
+
+    def get_linear_limit(self, axis):
+        return self.articulation.get_joint_limits(self.link)
+
+    def set_twist_limit(self, lower_limit, upper_limit):
+        self.articulation.set_joint_limits(self.link, lower_limit, upper_limit)
+
+    def get_twist_limit(self):
+        return self.articulation.get_joint_limits(self.link)
+
+    def set_drive_position(self, pose):
+        """ Set drive target from the pose, i.e. x-coordinate for prismatic and rotation about x-axis for revolute. """
+        pos, quat = cast_transformation(pose)
+        target = pos[0] if self.joint_type == 'prismatic' else 2 * np.arctan2(quat.x, quat.w)
+        self.articulation.set_joint_drive_target(self.link, target)
+
+    def set_drive_velocity(self, linear=None, angular=None):
+        velocity = linear if self.joint_type == 'prismatic' else angular
+        if velocity is not None:
+            self.articulation.set_joint_drive_velocity(self.link, velocity[0])
+
+    def set_drive(self, axis, stiffness=0, damping=0, force_limit=0, is_acceleration=False):
+        self.articulation.set_joint_drive(self.link, stiffness=stiffness, damping=damping, force_limit=force_limit,
+                                          is_acceleration=is_acceleration)
 
 
 class Joint:
@@ -80,9 +137,35 @@ class Joint:
         self.name = name
         self.joint_type: str = joint_type
         self.null_value: float = null_value
-        self.commanded_joint_position = null_value
-        self.commanded_joint_velocity = 0.
+        # column of 4xN array with commanded position, commanded velocity, and lower and upper limit (-inf, inf if
+        # not limited); the array is shared by all movable joints of the robot and by the native joint controller
+        self._state = np.array([[null_value], [0.], [-np.inf], [np.inf]])
+        self._state_index = 0
         self.physx_joint: Optional[D6Joint] = None
+        self._local_poses = None  # cached (local_pose0, local_pose1, inverse of local_pose1) of the physx joint
+        self._limits = None  # cached tuple of lower and upper limit
+
+    @property
+    def commanded_joint_position(self):
+        return self._state[0, self._state_index]
+
+    @commanded_joint_position.setter
+    def commanded_joint_position(self, value):
+        self._state[0, self._state_index] = value
+
+    @property
+    def commanded_joint_velocity(self):
+        return self._state[1, self._state_index]
+
+    @commanded_joint_velocity.setter
+    def commanded_joint_velocity(self, value):
+        self._state[1, self._state_index] = value
+
+    def bind_state(self, state, index):
+        """ Store commanded values and cached limits in the given column of 4xN array shared with other joints. """
+        state[:, index] = self._state[:, self._state_index]
+        self._state = state
+        self._state_index = index
 
     def joint_transformation(self, joint_position=None):
         """ Get transformation of joint. For prismatic, this is defined as translation in x-axis.
@@ -98,13 +181,29 @@ class Joint:
         else:
             raise NotImplementedError('Only fixed, prismatic and revolute joints are supported.')
 
+    def invalidate_cache(self):
+        """ Invalidate cached local poses and limits. Call it if physx joint is modified directly. Limits are read
+            again immediately as they are used by the native joint controller. """
+        self._local_poses = None
+        self._limits = None
+        if self.physx_joint is not None:
+            self.get_limits()
+
+    @property
+    def local_poses(self):
+        """ Get tuple (local_pose0, local_pose1, inverse of local_pose1) of the physx joint. Value is cached. """
+        if self._local_poses is None:
+            t0 = self.physx_joint.get_local_pose(0)
+            t1 = self.physx_joint.get_local_pose(1)
+            self._local_poses = t0, t1, inverse_transform(t1)
+        return self._local_poses
+
     def transformation_from_parent_to_child_link(self, joint_position=None):
         """ Return transformation from parent to the child either for the null position or for the specified
             position of the joint. """
-        t0 = self.physx_joint.get_local_pose(0)
+        t0, _, t1_inv = self.local_poses
         tj = self.joint_transformation(joint_position)
-        t1 = inverse_transform(self.physx_joint.get_local_pose(1))
-        return multiply_transformations(multiply_transformations(t0, tj), t1)
+        return multiply_transformations(multiply_transformations(t0, tj), t1_inv)
 
     @property
     def is_revolute(self):
@@ -128,15 +227,8 @@ class Joint:
             local_pose1 = unit_pose()
         jcls = KinematicPhysXJoint if kinematic else D6Joint
         self.physx_joint = jcls(actor0, actor1, local_pose0, local_pose1)
-        is_limited = lower_limit is not None and upper_limit is not None
-        if self.is_revolute:
-            self.physx_joint.set_motion(D6Axis.TWIST, D6Motion.LIMITED if is_limited else D6Motion.FREE)
-            if is_limited:
-                self.physx_joint.set_twist_limit(lower_limit=lower_limit, upper_limit=upper_limit)
-        elif self.is_prismatic:
-            self.physx_joint.set_motion(D6Axis.X, D6Motion.LIMITED if is_limited else D6Motion.FREE)
-            if is_limited:
-                self.physx_joint.set_linear_limit(D6Axis.X, lower_limit=lower_limit, upper_limit=upper_limit)
+        self.invalidate_cache()
+        self.set_limits(lower_limit, upper_limit)
 
     def set_joint_position(self, value):
         """ Set desired position of the joint. """
@@ -164,9 +256,30 @@ class Joint:
             self.physx_joint.set_drive(D6Drive.X, stiffness=stiffness, damping=damping, force_limit=force_limit,
                                        is_acceleration=is_acceleration)
 
+    def set_limits(self, lower_limit=None, upper_limit=None):
+        """ Set limits of the joint. Joint motion is free if limits are not specified. """
+        is_limited = lower_limit is not None and upper_limit is not None
+        if self.is_revolute:
+            self.physx_joint.set_motion(D6Axis.TWIST, D6Motion.LIMITED if is_limited else D6Motion.FREE)
+            if is_limited:
+                self.physx_joint.set_twist_limit(lower_limit=lower_limit, upper_limit=upper_limit)
+        elif self.is_prismatic:
+            self.physx_joint.set_motion(D6Axis.X, D6Motion.LIMITED if is_limited else D6Motion.FREE)
+            if is_limited:
+                self.physx_joint.set_linear_limit(D6Axis.X, lower_limit=lower_limit, upper_limit=upper_limit)
+        self._limits = None
+        if self.physx_joint is not None:
+            self.get_limits()  # limits are read by the native joint controller
+
     def get_limits(self):
         """ Get limits of the joint, return tuple consisting of lower and upper limit.
-            If joint is not not limited returns -inf, inf. """
+            If joint is not not limited returns -inf, inf. Value is cached. """
+        if self._limits is None:
+            self._limits = self._get_physx_limits()
+            self._state[2:, self._state_index] = self._limits
+        return self._limits
+
+    def _get_physx_limits(self):
         if self.is_prismatic:
             if self.physx_joint.get_motion(D6Axis.X) == D6Motion.FREE:
                 return -np.inf, np.inf
@@ -191,16 +304,101 @@ class Link(anytree.Node):
         self.joint_from_parent: Optional[Joint] = None
 
 
+class KinematicChain:
+    """
+    Precompiled forward kinematics of the tree robot. Links are stored in topological order together with the fixed
+    local poses of their joints (as arrays), so poses of all links are computed for a batch of configurations by
+    vectorized operations. Chain has to be recompiled if the structure of the robot changes.
+    """
+
+    def __init__(self, robot) -> None:
+        super().__init__()
+        self.link_names = list(robot.links.keys())
+        self.joint_names = robot.get_joint_names()
+        link_index = {name: i for i, name in enumerate(self.link_names)}
+        joint_index = {name: i for i, name in enumerate(self.joint_names)}
+        self.null_values = np.array([robot.movable_joints[name].null_value for name in self.joint_names], dtype=float)
+        self.root_index = link_index[robot.root_node.name]
+        self.links = []  # tuples (link index, parent index, joint column or -1, is revolute, pose0, inverse pose1)
+        for link in anytree.LevelOrderIter(robot.root_node):  # type: Link
+            if link.is_root:
+                continue
+            joint = link.joint_from_parent
+            if joint is None:  # link without joint is placed at its parent
+                self.links.append((link_index[link.name], link_index[link.parent.name], -1, False,
+                                   pose_to_array(unit_pose()), None))
+                continue
+            pose0, _, pose1_inv = joint.local_poses
+            pose0, pose1_inv = pose_to_array(pose0), pose_to_array(pose1_inv)
+            column = joint_index.get(joint.name, -1) if not joint.is_fixed else -1
+            if column < 0:  # fixed transformation can be precomputed
+                pose0, pose1_inv = multiply_pose_arrays(pose0, pose1_inv), None
+            self.links.append((link_index[link.name], link_index[link.parent.name], column, joint.is_revolute,
+                               pose0, pose1_inv))
+
+    def joint_values_to_array(self, joint_values: Optional[Dict[str, float]] = None):
+        """ Convert dictionary of joint values into the array ordered by joint names. Null values are used for missing
+            joints. """
+        q = self.null_values.copy()
+        if joint_values is not None:
+            for i, name in enumerate(self.joint_names):
+                value = joint_values.get(name, None)
+                if value is not None:
+                    q[i] = value
+        return q
+
+    @staticmethod
+    def joint_pose_arrays(q, revolute):
+        """ Transformations of joints for given joint values, rotation about x-axis for revolute and translation along
+            x-axis for prismatic joint. """
+        poses = np.zeros(q.shape + (7,))
+        if revolute:
+            poses[..., 3] = np.cos(q / 2)
+            poses[..., 4] = np.sin(q / 2)
+        else:
+            poses[..., 0] = q
+            poses[..., 3] = 1.
+        return poses
+
+    def compute_link_poses(self, q, root_pose=None):
+        """ Compute poses of all links for a configuration q (DOF) or for a batch of configurations (MxDOF). Joints are
+            ordered as in joint_names. Returns array of poses [x,y,z,qw,qx,qy,qz] of shape Lx7 or MxLx7, where links
+            are ordered as in link_names. """
+        q = np.asarray(q, dtype=float)
+        single = q.ndim == 1
+        q = np.atleast_2d(q)
+        poses = np.zeros((q.shape[0], len(self.link_names), 7))
+        poses[..., 3] = 1.
+        if root_pose is not None:
+            poses[:, self.root_index] = pose_to_array(root_pose)
+        for link, parent, column, revolute, pose0, pose1_inv in self.links:
+            pose = multiply_pose_arrays(poses[:, parent], pose0)
+            if column >= 0:
+                pose = multiply_pose_arrays(pose, self.joint_pose_arrays(q[:, column], revolute))
+                pose = multiply_pose_arrays(pose, pose1_inv)
+            poses[:, link] = pose
+        return poses[0] if single else poses
+
+
 class TreeRobot:
 
-    def __init__(self, kinematic=False) -> None:
+    def __init__(self, kinematic=False, articulation=False) -> None:
         """ If robot is kinematic, then all actors are set to be kinematic. Actors poses are set from forward kinematic
-            automatically. """
+            automatically. If articulation is true, robot is simulated by reduced coordinate articulation instead of
+            actors connected by D6 joints. The articulation is created from links and joints by get_articulation. """
         super().__init__()
+        if kinematic and articulation:
+            raise ValueError('Kinematic robot cannot be simulated by articulation.')
         self.kinematic = kinematic
+        self.use_articulation = articulation
+        self._articulation = None  # type: Optional[Articulation]
         self.links = {}  # type: Dict[str, Link]
         self.movable_joints = {}  # type: Dict[str, Joint]
+        self._joints_state = np.zeros((4, 0))  # commanded positions, velocities, and limits of movable joints
+        self._joint_group = None  # type: Optional[JointGroup]
+        self._joint_controller = None  # type: Optional[JointController]
         self._root_node = None  # type: Optional[Link]
+        self._kinematic_chain = None  # type: Optional[KinematicChain]
         self.world_attachment_actor = None
 
     @property
@@ -214,24 +412,55 @@ class TreeRobot:
 
     def add_link(self, link: Link):
         """ Add new link to the structure. This invalidates previously computed root node. """
+        self._check_articulation_not_created()
         self.links[link.name] = link
         if self.kinematic:
             link.actor.set_rigid_body_flag(RigidBodyFlag.KINEMATIC, True)
         self._root_node = None
+        self._kinematic_chain = None
 
     def add_joint(self, parent_name: str, child_name: str, joint: Joint = None, local_pose0=None, local_pose1=None,
                   lower_limit=None, upper_limit=None):
         """ Add new joint to the structure. This invalidates previously computed root node. """
+        self._check_articulation_not_created()
         self.links[child_name].parent = self.links[parent_name]
         self.links[child_name].joint_from_parent = joint
         if joint is not None:
             self.links[child_name].joint_from_parent.create_physx_joint(
                 self.links[parent_name].actor, self.links[child_name].actor,
-                local_pose0, local_pose1, lower_limit, upper_limit, self.kinematic
+                local_pose0, local_pose1, lower_limit, upper_limit, self.kinematic or self.use_articulation
             )
             if not joint.is_fixed:
                 self.movable_joints[joint.name] = joint
+                self._bind_joints_state()
         self._root_node = None
+        self._kinematic_chain = None
+
+    def _bind_joints_state(self):
+        """ Allocate array for commanded values and limits of all movable joints, ordered as in get_joint_names. """
+        self._joints_state = np.zeros((4, len(self.movable_joints)))
+        for i, joint in enumerate(self.movable_joints.values()):
+            joint.bind_state(self._joints_state, i)
+        self._joint_group = None
+        self._joint_controller = None
+
+    @property
+    def joint_group(self) -> Optional[JointGroup]:
+        """ Get native group of D6 joints of movable joints ordered as in get_joint_names. None is returned for
+            kinematic robot and for articulation. Value is cached. """
+        if self.kinematic or self.use_articulation:
+            return None
+        if self._joint_group is None:
+            joints = list(self.movable_joints.values())
+            self._joint_group = JointGroup([j.physx_joint for j in joints], [j.joint_type for j in joints])
+        return self._joint_group
+
+    @property
+    def kinematic_chain(self) -> KinematicChain:
+        """ Get precompiled kinematic chain used to compute forward kinematics. Chain is cached. """
+        if self._kinematic_chain is None:
+            self._kinematic_chain = KinematicChain(self)
+        return self._kinematic_chain
 
     def print_structure(self, from_link: Link = None):
         """ Print structure of the robot into the terminal. Useful only for debugging. """
@@ -246,58 +475,206 @@ class TreeRobot:
     def compute_link_transformations(self, joint_values: Optional[Dict[str, float]] = None) -> Dict[str, tuple]:
         """ Compute transformations of all links for given joint values and return them in a dictionary in which link
         name serves as a key and link pose is a value. """
-        if joint_values is None:
-            joint_values = {}
-        link_transforms = {}
-        for link in anytree.LevelOrderIter(self.root_node):  # type: Link
-            if link.is_root:
-                link_transforms[link.name] = self.root_pose
-                continue
-            parent_transform = link_transforms[link.parent.name]
-            joint_value = joint_values.get(link.joint_from_parent.name, None)
-            relative_pose = link.joint_from_parent.transformation_from_parent_to_child_link(joint_value)
-            link_transforms[link.name] = multiply_transformations(parent_transform, relative_pose)
-        return link_transforms
+        chain = self.kinematic_chain
+        poses = chain.compute_link_poses(chain.joint_values_to_array(joint_values), self.root_pose)
+        return {name: array_to_pose(pose) for name, pose in zip(chain.link_names, poses)}
 
     def get_joint_names(self):
         """ Get joint names for all movable joints, i.e. for prismatic and revolute joints. """
         return list(self.movable_joints.keys())
 
     def attach_root_node_to_pose(self, pose):
-        """ Create attachment joint that connects root link to given world coordinates. """
+        """ Create attachment joint that connects root link to given world coordinates. For articulation, the root
+            link is fixed at the pose instead and None is returned. """
         self.world_attachment_actor = RigidStatic()
         self.world_attachment_actor.set_global_pose(pose)
+        if self.use_articulation:
+            if self._articulation is not None:
+                self._articulation.set_fix_base(True)
+                self._articulation.set_root_pose(pose)
+            return None
         return D6Joint(self.world_attachment_actor, self.root_node.actor)
 
     def attach_root_node_to_actor(self, actor, **kwargs):
         """ Create attachment joint that connects root link to the given actor. """
+        if self.use_articulation:
+            raise ValueError('Articulation cannot be attached to an actor, use attach_root_node_to_pose instead.')
         self.world_attachment_actor = actor
         return D6Joint(self.world_attachment_actor, self.root_node.actor, **kwargs)
 
+    def _check_articulation_not_created(self):
+        if self._articulation is not None:
+            raise RuntimeError('Structure of the robot cannot be modified after the articulation was created.')
+
+    def get_articulation(self) -> Articulation:
+        """ Get articulation that simulates the robot. It is created at the first call from links and joints, link
+            actors are replaced by articulation links that take over their shapes and mass. Movable joints of the
+            articulation are ordered as in get_joint_names. """
+        if not self.use_articulation:
+            raise ValueError('Robot is not simulated by articulation, create it with articulation=True.')
+        if self._articulation is None:
+            self._articulation = self._create_articulation()
+        return self._articulation
+
+    def _create_articulation(self):
+        art = Articulation(fix_base=self.world_attachment_actor is not None)
+        transformations = self.compute_link_transformations()
+        joint_links = {}
+        for link in anytree.LevelOrderIter(self.root_node):  # type: Link
+            actor = art.create_link(None if link.is_root else link.parent.actor, transformations[link.name])
+            if link.actor is not None:
+                for shape in link.actor.get_atached_shapes():
+                    link.actor.detach_shape(shape)
+                    actor.attach_shape(shape)
+                actor.set_mass(link.actor.get_mass())
+                if link.actor.get_user_data() is not None:
+                    actor.set_user_data(link.actor.get_user_data())
+            link.actor = actor
+            joint = link.joint_from_parent
+            if joint is not None and not joint.is_fixed:
+                joint_links[joint.name] = link
+            elif joint is not None:
+                art.configure_joint(actor, 'fixed', *joint.local_poses[:2])
+            elif not link.is_root:  # link without joint is placed at its parent
+                art.configure_joint(actor, 'fixed')
+
+        for name, joint in self.movable_joints.items():  # configured in this order to define order of joints
+            actor = joint_links[name].actor
+            t0, t1, _ = joint.local_poses
+            drive = joint.physx_joint.drive
+            art.configure_joint(actor, joint.joint_type, t0, t1, *joint.get_limits())
+            joint.physx_joint = ArticulationPhysXJoint(art, actor, joint.joint_type, t0, t1)
+            joint.invalidate_cache()
+            if drive is not None:
+                joint.physx_joint.set_drive(None, **drive)
+            joint.set_joint_position(joint.commanded_joint_position)
+            joint.set_joint_velocity(joint.commanded_joint_velocity)
+        return art
+
     def reset_pose(self, joint_values: Optional[Dict[str, float]] = None):
         """ Reset pose of every actor in the tree. The poses are computed for a given joint values. The commanded joint
             values are set to given values too."""
         if joint_values is None:
             joint_values = {}
-        transformations = self.compute_link_transformations(joint_values)
-        for link in self.links.values():
-            link.actor.set_global_pose(transformations[link.name])
-        for joint in self.movable_joints.values():
-            joint.set_joint_position(joint_values.get(joint.name, None))
+        if self.use_articulation:
+            art = self.get_articulation()
+            q = self.kinematic_chain.joint_values_to_array(joint_values)
+            art.set_root_pose(self.root_pose)
+            art.set_joint_positions(q)
+            art.set_joint_velocities(np.zeros_like(q))
+        else:
+            transformations = self.compute_link_transformations(joint_values)
+            for link in self.links.values():
+                link.actor.set_global_pose(transformations[link.name])
+        self.set_joint_positions(self.kinematic_chain.joint_values_to_array(joint_values))
 
     def set_joints_position(self, joint_values: Dict[str, float]):
         """ Set desired position of every joint in a tree. """
-        for joint in self.movable_joints.values():
-            joint.set_joint_position(joint_values[joint.name])
+        self.set_joint_positions([joint_values[name] for name in self.movable_joints.keys()])
 
     def set_joints_velocities(self, joint_values: Dict[str, float]):
         """ Set desired velocity of every joint in a tree. """
-        for joint in self.movable_joints.values():
-            joint.set_joint_velocity(joint_values[joint.name])
+        self.set_joint_velocities([joint_values[name] for name in self.movable_joints.keys()])
+
+    def set_joint_positions(self, q):
+        """ Set desired positions of all movable joints from the array ordered as in get_joint_names. Drive targets of
+            all joints are set in one native call. """
+        self._joints_state[0] = q
+        if self.use_articulation:
+            if self._articulation is not None:  # commands are applied when articulation is created otherwise
+                self._articulation.set_drive_targets(self._joints_state[0])
+        elif not self.kinematic:
+            self.joint_group.set_drive_positions(self._joints_state[0])
+
+    def set_joint_velocities(self, dq):
+        """ Set desired velocities of all movable joints from the array ordered as in get_joint_names. """
+        self._joints_state[1] = dq
+        if self.use_articulation:
+            if self._articulation is not None:
+                self._articulation.set_drive_velocities(self._joints_state[1])
+        elif not self.kinematic:
+            self.joint_group.set_drive_velocities(self._joints_state[1])
+
+    def get_commanded_joint_positions(self):
+        """ Get desired positions of all movable joints as array ordered as in get_joint_names. """
+        return self._joints_state[0].copy()
+
+    def get_commanded_joint_velocities(self):
+        """ Get desired velocities of all movable joints as array ordered as in get_joint_names. """
+        return self._joints_state[1].copy()
+
+    def get_joint_controller(self) -> JointController:
+        """ Get native joint controller that shares commanded values and limits with the robot. Add it into the scene
+            by scene.add_joint_controller to integrate commands, clamp them to limits, and set drive targets before
+            every simulation substep instead of calling update. Value is cached. """
+        if self.kinematic:
+            raise ValueError('Joint controller is not available for kinematic robot.')
+        if self._joint_controller is None:
+            joints = self.get_articulation() if self.use_articulation else self.joint_group
+            self._joint_controller = JointController(joints, self._joints_state)
+        return self._joint_controller
+
+    def get_joint_positions(self):
+        """ Get measured positions of all movable joints as array ordered as in get_joint_names. Commanded positions
+            are returned for kinematic robot. """
+        if self.use_articulation:
+            return self.get_articulation().get_joint_positions()
+        if self.kinematic:
+            return self.get_commanded_joint_positions()
+        return self.joint_group.get_positions()
+
+    def get_joint_velocities(self):
+        """ Get measured velocities of all movable joints as array ordered as in get_joint_names. Commanded velocities
+            are returned for kinematic robot. """
+        if self.use_articulation:
+            return self.get_articulation().get_joint_velocities()
+        if self.kinematic:
+            return self.get_commanded_joint_velocities()
+        return self.joint_group.get_velocities()
+
+    def get_joint_state(self):
+        """ Get measured state of all movable joints in one native call as tuple (positions, velocities, forces,
+            torques) of arrays with shapes DOF, DOF, DOFx3, and DOFx3. Available for robot simulated by D6 joints. """
+        if self.kinematic or self.use_articulation:
+            raise ValueError('Joint state is available only for dynamic robot simulated by D6 joints.')
+        return self.joint_group.get_state()
+
+    def get_joint_limits(self):
+        """ Get 2xDOF array of lower and upper limits of movable joints ordered as in get_joint_names. Limits are
+            cached by joints. """
+        return self._joints_state[2:].copy()
+
+    def get_self_collision_pairs(self):
+        """ Get Kx2 array of indices (into links) of the link pairs that are checked for self collisions. All pairs of
+            links except the links connected by a joint are checked. """
+        links = list(self.links.values())
+        pairs = [(i, j) for i in range(len(links)) for j in range(i + 1, len(links))
+                 if links[i].parent is not links[j] and links[j].parent is not links[i]]
+        return np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
+    def compute_link_poses_batch(self, q_batch):
+        """ Compute poses of all links (in the order of links) for M configurations given as MxDOF array, where joints
+            are ordered as in get_joint_names. Returns MxLx7 array of poses [x,y,z,qw,qx,qy,qz]. """
+        return self.kinematic_chain.compute_link_poses(np.atleast_2d(q_batch), self.root_pose)
+
+    def check_collisions(self, q_batch, environment_actors=None, self_collisions=True):
+        """ Check collisions for M configurations given as MxDOF array, where joints are ordered as in get_joint_names.
+            Links are checked for self collisions (except links connected by a joint) and against given environment
+            actors at their current poses. Return boolean mask of size M that is true for configurations in collision.
+            Simulation state is not modified. Environment must not contain links of this robot. """
+        pairs = self.get_self_collision_pairs() if self_collisions else np.zeros((0, 2), dtype=np.int64)
+        return check_collisions_batch(
+            [link.actor for link in self.links.values()], self.compute_link_poses_batch(q_batch), pairs,
+            [] if environment_actors is None else list(environment_actors)
+        )
 
     def get_aggregate(self, enable_self_collision=False):
-        """ Get aggregate of actors that can be included into the scene. """
+        """ Get aggregate of actors that can be included into the scene. For articulation, the aggregate contains the
+            articulation. """
         agg = Aggregate(enable_self_collision=enable_self_collision)
+        if self.use_articulation:
+            agg.add_articulation(self.get_articulation())
+            return agg
         if self.world_attachment_actor is not None:
             agg.add_actor(self.world_attachment_actor)
         for link in self.links.values():
@@ -312,18 +689,14 @@ class TreeRobot:
     def update(self, dt):
         """
             Method should be call before each simulate command.
-            It updates the commanded joint position based on the current commanded position and velocity.
+            It updates the commanded joint position based on the current commanded position and velocity for all
+            joints at once.
             For kinematic robots, it computes and set kinematic target for each link.
         """
-        for joint_name, joint in self.movable_joints.items():
-            joint.set_joint_position(
-                np.clip(joint.commanded_joint_position + joint.commanded_joint_velocity * dt, *joint.get_limits())
-            )
+        lower, upper = self.get_joint_limits()
+        self.set_joint_positions(np.clip(self._joints_state[0] + self._joints_state[1] * dt, lower, upper))
 
         if self.kinematic:
-            joint_values = dict()
-            for joint_name, joint in self.movable_joints.items():
-                joint_values[joint_name] = joint.commanded_joint_position
-            link_poses = self.compute_link_transformations(joint_values)
-            for link_name, link in self.links.items():
-                link.actor.set_kinematic_target(link_poses[link_name])
+            link_poses = self.kinematic_chain.compute_link_poses(self._joints_state[0], self.root_pose)
+            for link, pose in zip(self.links.values(), link_poses):
+                link.actor.set_kinematic_target(pose)
@@ -10,18 +10,27 @@
 
 #include <Physics.h>
 #include <Scene.h>
+#include <SceneBatch.h>
 #include <Material.h>
 #include <RigidDynamic.h>
 #include <Shape.h>
+#include <ConvexMeshCache.h>
 #include <RigidStatic.h>
 #include <D6Joint.h>
+#include <JointGroup.h>
+#include <JointController.h>
 #include <Aggregate.h>
+#include <Articulation.h>
+#include <Rollout.h>
+#include <collision_utils.h>
 
 namespace py = pybind11;
 using py::arg;
 
 PYBIND11_MODULE(_pyphysx, m) {
 
+    quaternion_type(); // cache quaternion type used by the PxQuat caster
+
     /***
      * Define enumerations.
      */
@@ -128,34 +137,255 @@ PYBIND11_MODULE(_pyphysx, m) {
      * Define classes interface.
      */
 
+    py::class_<CpuDispatcher>(m, "CpuDispatcher")
+            .def(py::init<size_t, std::vector<uint32_t>>(),
+                 arg("num_threads") = 0,
+                 arg("affinity_masks") = std::vector<uint32_t>(),
+                 "Create dispatcher with its own worker threads. If specified, i-th thread is bound to the cores given "
+                 "by the i-th affinity mask."
+            )
+            .def_static("from_executor", &CpuDispatcher::from_executor,
+                        arg("executor"),
+                        arg("num_workers"),
+                        "Create dispatcher that submits simulation tasks to the python executor, e.g. "
+                        "concurrent.futures.ThreadPoolExecutor with num_workers workers. Tasks rejected by the "
+                        "executor (e.g. after shutdown) are run in the simulating thread and RuntimeError is raised "
+                        "once the step is finished."
+            )
+            .def("get_num_threads", &CpuDispatcher::get_num_threads);
+
     py::class_<Physics>(m, "Physics")
             .def_static("set_num_cpu", &Physics::set_num_cpu,
-                        arg("num_cpu") = 0
+                        arg("num_cpu") = 0,
+                        arg("affinity_masks") = std::vector<uint32_t>(),
+                        "Set number of worker threads (and optionally their affinity masks) of the dispatcher used by "
+                        "scenes created afterwards. The superseded dispatcher is released once no scene uses it."
+            )
+            .def_static("set_dispatcher",
+                        [](const CpuDispatcher &dispatcher) {
+                            Physics::set_dispatcher(dispatcher.get_dispatcher());
+                        },
+                        arg("dispatcher"),
+                        "Set dispatcher used by scenes created afterwards unless they specify their own."
             )
             .def_static("init_gpu", &Physics::init_gpu);
 
     py::class_<Scene>(m, "Scene")
-            .def(py::init<physx::PxFrictionType::Enum, physx::PxBroadPhaseType::Enum, std::vector<physx::PxSceneFlag::Enum>, size_t, float>(),
+            .def(py::init<physx::PxFrictionType::Enum, physx::PxBroadPhaseType::Enum, std::vector<physx::PxSceneFlag::Enum>, size_t, float, size_t, const CpuDispatcher *>(),
                  arg("friction_type") = physx::PxFrictionType::ePATCH,
                  arg("broad_phase_type") = physx::PxBroadPhaseType::eABP,
                  arg("scene_flags") = std::vector<physx::PxSceneFlag::Enum>(),
                  arg("gpu_max_num_partitions") = 8,
-                 arg("gpu_dynamic_allocation_scale") = 1.
+                 arg("gpu_dynamic_allocation_scale") = 1.,
+                 arg("contact_buffer_size") = 0,
+                 arg("dispatcher") = py::none()
             )
             .def("simulate", &Scene::simulate,
-                 arg("dt") = 1. / 60.
+                 arg("dt") = 1. / 60.,
+                 arg("substeps") = 1,
+                 "Simulate scene for time dt split into given number of substeps. Joint controllers are stepped "
+                 "before each substep."
+            )
+            .def("simulate_async", &Scene::simulate_async,
+                 arg("dt") = 1. / 60.,
+                 "Start simulation for given time step and return immediately. Use fetch_results to finish the step."
+            )
+            .def("fetch_results", &Scene::fetch_results,
+                 arg("block") = true,
+                 "Finish simulation started by simulate_async. Returns false if block is false and results are not "
+                 "ready yet."
+            )
+            .def("check_results", &Scene::check_results,
+                 "Return true if simulation started by simulate_async has finished."
+            )
+            .def("is_simulation_running", &Scene::is_simulation_running,
+                 "Return true if simulation was started by simulate_async and its results were not fetched yet."
+            )
+            .def("enable_state_buffer", &Scene::enable_state_buffer,
+                 arg("enable") = true,
+                 "Enable persistent buffer with state of dynamic actors that is refreshed after each simulation step."
+            )
+            .def("get_state_buffer", &Scene::get_state_buffer,
+                 "Get tuple of read-only views (poses Nx7, linear velocities Nx3, angular velocities Nx3) into the "
+                 "state buffer. Views are updated in place by simulation; obtain them again if the number of dynamic "
+                 "actors changes."
+            )
+            .def("clone", &Scene::clone,
+                 arg("n") = 1,
+                 "Create list of n new scenes with the same content. Actors, aggregates and D6 joints are cloned "
+                 "together with their state; materials and cooked meshes are shared. Scenes with articulations "
+                 "cannot be cloned."
+            )
+            .def("export", &Scene::export_to_file,
+                 arg("path"),
+                 arg("format") = "binary",
+                 "Export actors, aggregates and joints of the scene including shapes, materials and meshes into the "
+                 "file using PhysX serialization. Format is 'binary' or 'xml'. Python user data are not exported."
+            )
+            .def("load", &Scene::load,
+                 arg("path"),
+                 arg("format") = "binary",
+                 "Add content of the file created by export into the scene. Binary files are memory mapped."
+            )
+            .def("save_state", &Scene::save_state,
+                 "Save poses, velocities and kinematic targets of dynamic actors, drive targets of D6 joints, root "
+                 "and joint state of articulations, commanded positions and velocities of joint controllers, and "
+                 "simulation time into a compact binary blob (uint8 numpy array)."
+            )
+            .def("restore_state", &Scene::restore_state,
+                 arg("blob"),
+                 "Restore state saved by save_state. Scene must have the same dynamic actors, joints, "
+                 "articulations and joint controllers."
             )
             .def("add_actor", &Scene::add_actor,
                  arg("actor")
             )
+            .def("remove_actor", &Scene::remove_actor,
+                 arg("actor"),
+                 "Remove actor from the scene. Indices into get_dynamic_rigid_actors() may change, actor ids not."
+            )
+            .def("get_actor_id", &Scene::get_actor_id,
+                 arg("actor"),
+                 "Get stable id of the actor within the scene. Ids do not change if other actors are added or removed."
+            )
+            .def("get_dynamic_rigid_actors_ids", &Scene::get_dynamic_rigid_actors_ids,
+                 "Get ids of dynamic actors in the order given by get_dynamic_rigid_actors()."
+            )
             .def("get_static_rigid_actors", &Scene::get_static_rigid_actors)
             .def("get_dynamic_rigid_actors", &Scene::get_dynamic_rigid_actors)
+            .def("get_dynamic_rigid_actors_poses", &Scene::get_dynamic_rigid_actors_poses,
+                 arg("out") = py::none(),
+                 "Get poses of all dynamic actors as Nx7 float32 array [x,y,z,qw,qx,qy,qz]. "
+                 "Optionally, poses are written into the preallocated out array."
+            )
+            .def("set_dynamic_rigid_actors_poses", &Scene::set_dynamic_rigid_actors_poses,
+                 arg("indices"),
+                 arg("poses"),
+                 "Set poses (Nx7) of dynamic actors given by indices into get_dynamic_rigid_actors() list."
+            )
+            .def("set_dynamic_rigid_actors_linear_velocities", &Scene::set_dynamic_rigid_actors_linear_velocities,
+                 arg("indices"),
+                 arg("velocities")
+            )
+            .def("set_dynamic_rigid_actors_angular_velocities", &Scene::set_dynamic_rigid_actors_angular_velocities,
+                 arg("indices"),
+                 arg("velocities")
+            )
+            .def("add_dynamic_rigid_actors_forces", &Scene::add_dynamic_rigid_actors_forces,
+                 arg("indices"),
+                 arg("forces"),
+                 arg("force_mode") = physx::PxForceMode::eFORCE
+            )
+            .def("add_dynamic_rigid_actors_torques", &Scene::add_dynamic_rigid_actors_torques,
+                 arg("indices"),
+                 arg("torques"),
+                 arg("torque_mode") = physx::PxForceMode::eFORCE
+            )
+            .def("raycast_batch", &Scene::raycast_batch,
+                 arg("origins"),
+                 arg("directions"),
+                 arg("max_dist") = 1e3,
+                 "Cast rays given by origins (Nx3) and directions (Nx3). Return tuple (distances, positions, normals, "
+                 "actor_indices) of the closest hits. Actor index refers to get_dynamic_rigid_actors(), it is -2 for "
+                 "static actors and -1 if nothing was hit. Only shapes with SCENE_QUERY_SHAPE flag are hit."
+            )
+            .def("sweep_batch", &Scene::sweep_batch,
+                 arg("shape"),
+                 arg("poses"),
+                 arg("directions"),
+                 arg("max_dist") = 1e3,
+                 "Sweep the shape geometry from poses (Nx7) along directions (Nx3). Returns the same tuple as "
+                 "raycast_batch."
+            )
+            .def("overlap_batch", &Scene::overlap_batch,
+                 arg("shape"),
+                 arg("poses"),
+                 "Check overlaps of the shape geometry placed at poses (Nx7) with the scene. Return index of an "
+                 "overlapping dynamic actor for each pose, -2 for static actor, and -1 if there is no overlap."
+            )
+            .def("find_overlapping_pairs", &Scene::find_overlapping_pairs,
+                 arg("actors") = py::none(),
+                 "Return Kx2 array of index pairs of overlapping actors. Indices refer to the given list of actors or "
+                 "to get_dynamic_rigid_actors() if actors are None."
+            )
+            .def("get_contacts", &Scene::get_contacts,
+                 "Get contacts collected since the last call as structured array with fields actor0, actor1, "
+                 "position, normal, impulse, and separation. Requires scene created with contact_buffer_size > 0."
+            )
+            .def("get_num_dropped_contacts", &Scene::get_num_dropped_contacts,
+                 "Number of contacts overwritten in the buffer since the last get_contacts call."
+            )
             .def("add_aggregate", &Scene::add_aggregate,
                  arg("agg")
             )
+            .def("remove_aggregate", &Scene::remove_aggregate,
+                 arg("agg"),
+                 "Remove aggregate together with its actors from the scene."
+            )
             .def("get_aggregates", &Scene::get_aggregates)
+            .def("add_articulation", &Scene::add_articulation,
+                 arg("articulation"),
+                 "Add articulation into the scene. Joint positions and velocities set before are applied."
+            )
+            .def("remove_articulation", &Scene::remove_articulation,
+                 arg("articulation")
+            )
+            .def("add_joint_controller", &Scene::add_joint_controller,
+                 arg("controller"),
+                 "Add joint controller that is stepped natively before every simulation (sub)step."
+            )
+            .def("remove_joint_controller", &Scene::remove_joint_controller,
+                 arg("controller")
+            )
+            .def("get_joint_controllers", &Scene::get_joint_controllers)
+            .def("get_articulations", &Scene::get_articulations,
+                 "Get all articulations of the scene including those added as part of aggregates."
+            )
             .def_readwrite("simulation_time", &Scene::simulation_time);
 
+    py::class_<SceneBatch>(m, "SceneBatch")
+            .def(py::init<size_t, physx::PxFrictionType::Enum, physx::PxBroadPhaseType::Enum, std::vector<physx::PxSceneFlag::Enum>, size_t, float, const CpuDispatcher *>(),
+                 arg("num_scenes"),
+                 arg("friction_type") = physx::PxFrictionType::ePATCH,
+                 arg("broad_phase_type") = physx::PxBroadPhaseType::eABP,
+                 arg("scene_flags") = std::vector<physx::PxSceneFlag::Enum>(),
+                 arg("gpu_max_num_partitions") = 8,
+                 arg("gpu_dynamic_allocation_scale") = 1.,
+                 arg("dispatcher") = py::none()
+            )
+            .def_static("from_scene", &SceneBatch::from_scene,
+                        arg("scene"),
+                        arg("num_scenes"),
+                        "Create batch of num_scenes clones of the given scene."
+            )
+            .def("__len__", &SceneBatch::get_num_scenes)
+            .def("get_num_scenes", &SceneBatch::get_num_scenes)
+            .def("get_scene", &SceneBatch::get_scene,
+                 arg("i"),
+                 py::return_value_policy::reference_internal,
+                 "Get i-th scene of the batch. The scene is owned by the batch."
+            )
+            .def("simulate", &SceneBatch::simulate,
+                 arg("dt") = 1. / 60.,
+                 arg("substeps") = 1,
+                 "Simulate all scenes concurrently for given time step split into substeps; joint controllers of the "
+                 "scenes are stepped before each substep."
+            )
+            .def("get_dynamic_rigid_actors_poses", &SceneBatch::get_dynamic_rigid_actors_poses,
+                 arg("out") = py::none(),
+                 "Get poses of dynamic actors of all scenes as N_scenes x N_actors x 7 float32 array."
+            )
+            .def("get_dynamic_rigid_actors_linear_velocities",
+                 &SceneBatch::get_dynamic_rigid_actors_linear_velocities,
+                 arg("out") = py::none(),
+                 "Get linear velocities of dynamic actors of all scenes as N_scenes x N_actors x 3 float32 array."
+            )
+            .def("get_dynamic_rigid_actors_angular_velocities",
+                 &SceneBatch::get_dynamic_rigid_actors_angular_velocities,
+                 arg("out") = py::none(),
+                 "Get angular velocities of dynamic actors of all scenes as N_scenes x N_actors x 3 float32 array."
+            );
+
     py::class_<Aggregate>(m, "Aggregate")
             .def(py::init<size_t, bool>(),
                  arg("max_size") = 256,
@@ -163,7 +393,39 @@ PYBIND11_MODULE(_pyphysx, m) {
             )
             .def("add_actor", &Aggregate::add_actor, arg("actor"))
             .def("remove_actor", &Aggregate::remove_actor, arg("actor"))
-            .def("get_actors", &Aggregate::get_actors);
+            .def("get_actors", &Aggregate::get_actors)
+            .def("get_actors_poses", &Aggregate::get_actors_poses,
+                 arg("out") = py::none(),
+                 "Get poses of all actors as Nx7 float32 array [x,y,z,qw,qx,qy,qz]. "
+                 "Optionally, poses are written into the preallocated out array."
+            )
+            .def("set_actors_poses", &Aggregate::set_actors_poses,
+                 arg("indices"),
+                 arg("poses"),
+                 "Set poses (Nx7) of actors given by indices into get_actors() list."
+            )
+            .def("set_actors_linear_velocities", &Aggregate::set_actors_linear_velocities,
+                 arg("indices"),
+                 arg("velocities")
+            )
+            .def("set_actors_angular_velocities", &Aggregate::set_actors_angular_velocities,
+                 arg("indices"),
+                 arg("velocities")
+            )
+            .def("add_actors_forces", &Aggregate::add_actors_forces,
+                 arg("indices"),
+                 arg("forces"),
+                 arg("force_mode") = physx::PxForceMode::eFORCE
+            )
+            .def("add_actors_torques", &Aggregate::add_actors_torques,
+                 arg("indices"),
+                 arg("torques"),
+                 arg("torque_mode") = physx::PxForceMode::eFORCE
+            )
+            .def("add_articulation", &Aggregate::add_articulation,
+                 arg("articulation"),
+                 "Add articulation into the aggregate, its links are counted as actors of the aggregate."
+            );
 
     py::class_<Material>(m, "Material")
             .def(py::init<float, float, float>(),
@@ -214,7 +476,13 @@ PYBIND11_MODULE(_pyphysx, m) {
             .def("set_local_pose", &Shape::set_local_pose,
                  arg("pose") = physx::PxTransform(physx::PxIdentity)
             )
-            .def("get_local_pose", &Shape::get_local_pose)
+            .def("get_local_pose",
+                 [](Shape &s, const std::string &pose_format) {
+                     return pose_to_python(s.get_local_pose(), pose_format);
+                 },
+                 arg("pose_format") = "tuple",
+                 "Get local pose as (pos, quat) tuple or as [x,y,z,qw,qx,qy,qz] array if pose_format is 'array'."
+            )
             .def("set_user_data", &Shape::set_user_data,
                  arg("o")
             )
@@ -245,11 +513,37 @@ PYBIND11_MODULE(_pyphysx, m) {
                  "Return true if two shapes overlaps."
             );
 
+    py::class_<ConvexMeshCache>(m, "ConvexMeshCache")
+            .def_static("set_max_size", &ConvexMeshCache::set_max_size,
+                        arg("max_size") = 1024,
+                        "Set maximum number of cached convex meshes. Zero disables the cache."
+            )
+            .def_static("get_max_size", &ConvexMeshCache::get_max_size)
+            .def_static("set_cache_dir", &ConvexMeshCache::set_cache_dir,
+                        arg("path"),
+                        "Set existing directory in which cooked meshes are stored and shared between processes. "
+                        "Empty path disables the persistent cache. Default is PYPHYSX_CONVEX_MESH_CACHE_DIR env. variable."
+            )
+            .def_static("get_cache_dir", &ConvexMeshCache::get_cache_dir)
+            .def_static("clear", &ConvexMeshCache::clear_cache,
+                        "Release all cached meshes. Existing shapes are not affected."
+            )
+            .def_static("get_statistics", &ConvexMeshCache::get_statistics,
+                        "Get dictionary with number of cache hits, misses, disk hits, cached meshes and maximum size."
+            )
+            .def_static("reset_statistics", &ConvexMeshCache::reset_statistics);
+
     py::class_<RigidActor>(m, "RigidActor")
             .def("set_global_pose", &RigidActor::set_global_pose,
                  arg("pose") = physx::PxTransform(physx::PxIdentity)
             )
-            .def("get_global_pose", &RigidActor::get_global_pose)
+            .def("get_global_pose",
+                 [](RigidActor &a, const std::string &pose_format) {
+                     return pose_to_python(a.get_global_pose(), pose_format);
+                 },
+                 arg("pose_format") = "tuple",
+                 "Get global pose as (pos, quat) tuple or as [x,y,z,qw,qx,qy,qz] array if pose_format is 'array'."
+            )
             .def("attach_shape", &RigidActor::attach_shape,
                  arg("shape")
             )
@@ -330,6 +624,101 @@ PYBIND11_MODULE(_pyphysx, m) {
                         arg("distance") = 0.
             );
 
+    py::class_<ArticulationLink, RigidActor>(m, "ArticulationLink")
+            .def("get_mass", &ArticulationLink::get_mass)
+            .def("set_mass", &ArticulationLink::set_mass,
+                 arg("mass") = 1.
+            )
+            .def("get_linear_velocity", &ArticulationLink::get_linear_velocity)
+            .def("get_angular_velocity", &ArticulationLink::get_angular_velocity);
+
+    py::class_<Articulation>(m, "Articulation")
+            .def(py::init<bool>(),
+                 arg("fix_base") = false,
+                 "Create reduced coordinate articulation. Root link is fixed in the world if fix_base is true."
+            )
+            .def("set_fix_base", &Articulation::set_fix_base,
+                 arg("fix_base")
+            )
+            .def("is_in_scene", &Articulation::is_in_scene)
+            .def("release", &Articulation::release,
+                 "Release the articulation together with its links and joints; it is removed from the scene."
+            )
+            .def("create_link", &Articulation::create_link,
+                 arg("parent") = py::none(),
+                 arg("pose") = physx::PxTransform(physx::PxIdentity),
+                 "Create new link connected to the parent link. Root link is created if parent is None."
+            )
+            .def("get_links", &Articulation::get_links)
+            .def("configure_joint", &Articulation::configure_joint,
+                 arg("link"),
+                 arg("joint_type") = "fixed",
+                 arg("parent_pose") = physx::PxTransform(physx::PxIdentity),
+                 arg("child_pose") = physx::PxTransform(physx::PxIdentity),
+                 arg("lower_limit") = -std::numeric_limits<float>::infinity(),
+                 arg("upper_limit") = std::numeric_limits<float>::infinity(),
+                 "Configure joint (fixed, revolute, or prismatic) that connects the link to its parent. Revolute "
+                 "joint rotates about and prismatic translates along x-axis of the joint frame. Movable joints are "
+                 "ordered in the order of configuration in the array interface."
+            )
+            .def("get_num_joints", &Articulation::get_num_joints,
+                 "Get number of movable joints."
+            )
+            .def("set_joint_limits", &Articulation::set_joint_limits,
+                 arg("link"),
+                 arg("lower_limit") = -std::numeric_limits<float>::infinity(),
+                 arg("upper_limit") = std::numeric_limits<float>::infinity(),
+                 "Set limits of the movable joint. Motion is free if both limits are infinite; limits must be either "
+                 "both finite or both infinite."
+            )
+            .def("get_joint_limits", &Articulation::get_joint_limits,
+                 arg("link")
+            )
+            .def("set_joint_drive", &Articulation::set_joint_drive,
+                 arg("link"),
+                 arg("stiffness") = 0.,
+                 arg("damping") = 0.,
+                 arg("force_limit") = std::numeric_limits<float>::max(),
+                 arg("is_acceleration") = false
+            )
+            .def("set_joint_drive_target", &Articulation::set_joint_drive_target,
+                 arg("link"),
+                 arg("target")
+            )
+            .def("set_joint_drive_velocity", &Articulation::set_joint_drive_velocity,
+                 arg("link"),
+                 arg("velocity")
+            )
+            .def("set_root_pose", &Articulation::set_root_pose,
+                 arg("pose")
+            )
+            .def("get_joint_positions", &Articulation::get_joint_positions,
+                 arg("out") = py::none(),
+                 "Get positions of all movable joints as float32 array."
+            )
+            .def("get_joint_velocities", &Articulation::get_joint_velocities,
+                 arg("out") = py::none(),
+                 "Get velocities of all movable joints as float32 array."
+            )
+            .def("set_joint_positions", &Articulation::set_joint_positions,
+                 arg("positions"),
+                 "Teleport all movable joints into the given positions."
+            )
+            .def("set_joint_velocities", &Articulation::set_joint_velocities,
+                 arg("velocities")
+            )
+            .def("get_drive_targets", &Articulation::get_drive_targets,
+                 arg("out") = py::none()
+            )
+            .def("set_drive_targets", &Articulation::set_drive_targets,
+                 arg("targets"),
+                 "Set drive targets of all movable joints in one call."
+            )
+            .def("set_drive_velocities", &Articulation::set_drive_velocities,
+                 arg("velocities"),
+                 "Set drive velocities of all movable joints in one call."
+            );
+
     py::class_<D6Joint>(m, "D6Joint")
             .def(py::init<RigidActor, RigidActor, physx::PxTransform, physx::PxTransform>(),
                  arg("actor0"), arg("actor1"),
@@ -343,10 +732,22 @@ PYBIND11_MODULE(_pyphysx, m) {
             .def("get_motion", &D6Joint::get_motion,
                  arg("axis")
             )
-            .def("get_local_pose", &D6Joint::get_local_pose,
-                 arg("actor_id") = 0
+            .def("get_local_pose",
+                 [](D6Joint &j, size_t actor_id, const std::string &pose_format) {
+                     return pose_to_python(j.get_local_pose(actor_id), pose_format);
+                 },
+                 arg("actor_id") = 0,
+                 arg("pose_format") = "tuple",
+                 "Get local pose as (pos, quat) tuple or as [x,y,z,qw,qx,qy,qz] array if pose_format is 'array'."
+            )
+            .def("get_relative_transform",
+                 [](D6Joint &j, const std::string &pose_format) {
+                     return pose_to_python(j.get_relative_transform(), pose_format);
+                 },
+                 arg("pose_format") = "tuple",
+                 "Get relative transform as (pos, quat) tuple or as [x,y,z,qw,qx,qy,qz] array if pose_format is "
+                 "'array'."
             )
-            .def("get_relative_transform", &D6Joint::get_relative_transform)
             .def("set_linear_limit", &D6Joint::set_linear_limit,
                  arg("axis"),
                  arg("lower_limit"),
@@ -415,6 +816,123 @@ PYBIND11_MODULE(_pyphysx, m) {
             .def("is_broken", &D6Joint::is_broken)
             .def("release", &D6Joint::release);
 
+    py::class_<JointGroup>(m, "JointGroup")
+            .def(py::init<std::vector<D6Joint>, std::vector<std::string>>(),
+                 arg("joints"),
+                 arg("joint_types"),
+                 "Group of revolute (rotation about x-axis) or prismatic (translation along x-axis) D6 joints whose "
+                 "values are exchanged with numpy arrays in one call."
+            )
+            .def("get_num_joints", &JointGroup::get_num_joints)
+            .def("set_drive_positions", &JointGroup::set_drive_positions,
+                 arg("positions"),
+                 "Set drive positions of all joints from the array of joint values."
+            )
+            .def("set_drive_velocities", &JointGroup::set_drive_velocities,
+                 arg("velocities"),
+                 "Set drive velocities of all joints from the array of joint velocities."
+            )
+            .def("get_positions", &JointGroup::get_positions,
+                 arg("out") = py::none(),
+                 "Get measured positions of all joints projected onto the joint axis."
+            )
+            .def("get_velocities", &JointGroup::get_velocities,
+                 arg("out") = py::none(),
+                 "Get measured velocities of all joints projected onto the joint axis."
+            )
+            .def("get_state", &JointGroup::get_state,
+                 "Get tuple (positions N, velocities N, forces Nx3, torques Nx3) of all joints in one call."
+            );
+
+    py::class_<JointController, std::shared_ptr<JointController>>(m, "JointController")
+            .def(py::init<const JointGroup &, py::object>(),
+                 arg("joints"),
+                 arg("state"),
+                 "Create controller of the joint group. State is 4xN float64 array of commanded positions, "
+                 "commanded velocities, lower limits, and upper limits that is modified in place."
+            )
+            .def(py::init<const Articulation &, py::object>(),
+                 arg("joints"),
+                 arg("state"),
+                 "Create controller of movable joints of the articulation."
+            )
+            .def("get_num_joints", &JointController::get_num_joints)
+            .def("step", &JointController::step,
+                 arg("dt"),
+                 "Integrate commanded positions from commanded velocities for time dt, clamp them to the limits, "
+                 "and set drive targets."
+            );
+
+    py::class_<Rollout>(m, "Rollout")
+            .def(py::init<Scene &>(),
+                 arg("scene"),
+                 py::keep_alive<1, 2>(),
+                 "Native rollout of the action sequence in the scene. Columns of the action array are mapped to the "
+                 "joint targets or actor forces in the order in which they were added."
+            )
+            .def("get_action_size", &Rollout::get_action_size,
+                 "Get number of columns of the action array."
+            )
+            .def("add_joint_targets", &Rollout::add_joint_targets,
+                 arg("joints"),
+                 "Map next N action columns to drive positions of the joint group. Commanded state of TreeRobot is "
+                 "not updated, use add_controller_targets if the robot is updated after the rollout."
+            )
+            .def("add_controller_targets", &Rollout::add_controller_targets,
+                 arg("controller"),
+                 "Map next N action columns to commanded positions of the joint controller. Drive targets and the "
+                 "commanded state shared with the controller (e.g. by TreeRobot) are updated."
+            )
+            .def("add_articulation_targets", &Rollout::add_articulation_targets,
+                 arg("articulation"),
+                 "Map next N action columns to drive targets of movable joints of the articulation."
+            )
+            .def("add_actor_forces", &Rollout::add_actor_forces,
+                 arg("indices"),
+                 arg("force_mode") = physx::PxForceMode::eFORCE,
+                 "Map next 3K action columns to forces of the K dynamic actors given by indices into "
+                 "scene.get_dynamic_rigid_actors()."
+            )
+            .def("add_actor_torques", &Rollout::add_actor_torques,
+                 arg("indices"),
+                 arg("torque_mode") = physx::PxForceMode::eFORCE,
+                 "Map next 3K action columns to torques of the K dynamic actors given by indices."
+            )
+            .def("record_actor_poses", &Rollout::record_actor_poses,
+                 arg("indices"),
+                 "Record poses of the actors, recorded array has shape TxKx7."
+            )
+            .def("record_actor_linear_velocities", &Rollout::record_actor_linear_velocities,
+                 arg("indices"),
+                 "Record linear velocities of the actors, recorded array has shape TxKx3."
+            )
+            .def("record_actor_angular_velocities", &Rollout::record_actor_angular_velocities,
+                 arg("indices"),
+                 "Record angular velocities of the actors, recorded array has shape TxKx3."
+            )
+            .def("record_joint_positions", &Rollout::record_joint_positions,
+                 arg("joints"),
+                 "Record measured positions of the joint group, recorded array has shape TxN."
+            )
+            .def("record_joint_velocities", &Rollout::record_joint_velocities,
+                 arg("joints"),
+                 "Record measured velocities of the joint group, recorded array has shape TxN."
+            )
+            .def("record_articulation_joint_positions", &Rollout::record_articulation_joint_positions,
+                 arg("articulation"),
+                 "Record positions of movable joints of the articulation, recorded array has shape TxN."
+            )
+            .def("record_articulation_joint_velocities", &Rollout::record_articulation_joint_velocities,
+                 arg("articulation"),
+                 "Record velocities of movable joints of the articulation, recorded array has shape TxN."
+            )
+            .def("run", &Rollout::run,
+                 arg("actions"),
+                 arg("dt") = 1. / 60.,
+                 arg("substeps") = 1,
+                 "Simulate T steps for the TxA action array and return tuple of recorded arrays."
+            );
+
 
     /***
      * Arbitrary support functions.
@@ -424,4 +942,13 @@ PYBIND11_MODULE(_pyphysx, m) {
           arg("pose") = physx::PxTransform(physx::PxIdentity),
           "A function that takes all allowed pose representation and returns tuple pose representation.");
 
+    m.def("check_collisions_batch", &check_collisions_batch,
+          arg("links"),
+          arg("poses"),
+          arg("self_collision_pairs"),
+          arg("environment") = std::vector<RigidActor>(),
+          "Check collisions of links placed at M configurations given by poses (M x L x 7). Link pairs given by "
+          "self_collision_pairs (K x 2) are checked against each other and all links are checked against environment "
+          "actors. Returns boolean array of size M. Simulation state is not modified.");
+
 }
@@ -29,6 +29,18 @@ class ActorTest(unittest.TestCase):
         np.testing.assert_almost_equal(p, [0, 2, 1])
         np.testing.assert_almost_equal(npq.as_float_array(q), np.array([1, 0, 0, 1]) / np.sqrt(2))  # is normalized
 
+    def test_global_pose_array(self):
+        actor = RigidDynamic()
+        actor.set_global_pose(([0, 2, 1], [1, 0, 0, 1]))
+        pose = actor.get_global_pose(pose_format='array')
+        self.assertEqual(pose.dtype, np.float32)
+        np.testing.assert_almost_equal(pose, [0, 2, 1, 1 / np.sqrt(2), 0, 0, 1 / np.sqrt(2)])
+        actor.set_global_pose(pose)
+        p, q = actor.get_global_pose()
+        np.testing.assert_almost_equal(p, [0, 2, 1])
+        with self.assertRaises(ValueError):
+            actor.get_global_pose(pose_format='matrix')
+
     def test_mass(self):
         actor = RigidDynamic()
         actor.set_mass(0.5)
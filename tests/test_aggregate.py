@@ -39,6 +39,30 @@ class AggregateTestCase(unittest.TestCase):
         agg.add_actor(actors[5])
         self.assertEqual(5, len(agg.get_actors()))
 
+    def test_get_actors_poses(self):
+        agg = Aggregate()
+        self.assertEqual(agg.get_actors_poses().shape, (0, 7))
+        for i in range(4):
+            a = RigidDynamic()
+            a.set_global_pose([0., 0., i])
+            agg.add_actor(a)
+        poses = agg.get_actors_poses()
+        self.assertEqual(poses.shape, (4, 7))
+        np.testing.assert_almost_equal(poses[:, 2], np.arange(4))
+        np.testing.assert_almost_equal(poses[:, 3:], np.tile([1., 0., 0., 0.], (4, 1)))
+
+    def test_set_actors_batched(self):
+        agg = Aggregate()
+        dyn = RigidDynamic()
+        agg.add_actor(RigidStatic())
+        agg.add_actor(dyn)
+        agg.set_actors_poses([0, 1], [[0, 0, 1, 1, 0, 0, 0], [0, 0, 2, 1, 0, 0, 0]])
+        np.testing.assert_almost_equal(agg.get_actors_poses()[:, 2], [1, 2])
+        agg.set_actors_linear_velocities([1], [[0, 0, 3]])
+        np.testing.assert_almost_equal(dyn.get_linear_velocity(), [0, 0, 3])
+        with self.assertRaises(ValueError):
+            agg.set_actors_linear_velocities([0], [[0, 0, 3]])  # static actor cannot have velocity
+
 
 if __name__ == '__main__':
     unittest.main()
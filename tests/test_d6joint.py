@@ -19,6 +19,7 @@ class D6JointTest(unittest.TestCase):
         j = D6Joint(a1, a2, local_pose0=(0., 3., 0.), local_pose1=(0., -5., 0.))
         self.assertAlmostEqual(j.get_local_pose(0)[0][1], 3.)
         self.assertAlmostEqual(j.get_local_pose(1)[0][1], -5.)
+        self.assertAlmostEqual(j.get_local_pose(1, pose_format='array')[1], -5.)
 
     def test_relative_transform(self):
         """
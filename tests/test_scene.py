@@ -7,10 +7,14 @@
 import numpy as np
 import unittest
 import sys
+import tempfile
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append('lib')
 
 from pyphysx import *
+import quaternion as npq
 
 
 class SceneTestCase(unittest.TestCase):
@@ -24,6 +28,88 @@ class SceneTestCase(unittest.TestCase):
         expected_distance = -0.5 * 9.81 * scene.simulation_time ** 2
         self.assertAlmostEqual(actor.get_global_pose()[0][2], expected_distance, places=2)
 
+    def test_simulation_dispatchers(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            dispatchers = [CpuDispatcher(num_threads=2), CpuDispatcher(2, affinity_masks=[1, 2]),
+                           CpuDispatcher.from_executor(executor, num_workers=2)]
+            self.assertEqual(dispatchers[2].get_num_threads(), 2)
+            for d in dispatchers:
+                actor = RigidDynamic()
+                scene = Scene(dispatcher=d)
+                scene.add_actor(actor)
+                for _ in range(48):
+                    scene.simulate(dt=0.5 / 48)
+                expected_distance = -0.5 * 9.81 * scene.simulation_time ** 2
+                self.assertAlmostEqual(actor.get_global_pose()[0][2], expected_distance, places=1)
+                clone = scene.clone()[0]
+                clone.simulate(0.1)
+        with self.assertRaises(ValueError):
+            CpuDispatcher(2, affinity_masks=[1])
+        with self.assertRaises(ValueError):
+            CpuDispatcher.from_executor(object(), num_workers=2)
+        with self.assertRaises(ValueError):
+            CpuDispatcher.from_executor(ThreadPoolExecutor(max_workers=1), num_workers=0)
+
+    def test_simulation_dispatcher_executor_shutdown(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        actor = RigidDynamic()
+        scene = Scene(dispatcher=CpuDispatcher.from_executor(executor, num_workers=2))
+        scene.add_actor(actor)
+        scene.simulate(0.1)
+        executor.shutdown()
+        with self.assertRaises(RuntimeError):  # tasks are run in the simulating thread and the step is finished
+            scene.simulate(0.1)
+        self.assertAlmostEqual(scene.simulation_time, 0.2)
+        self.assertAlmostEqual(actor.get_linear_velocity()[2], -9.81 * 0.2, places=3)
+        scene.simulate_async(0.1)
+        with self.assertRaises(RuntimeError):
+            scene.fetch_results()
+        self.assertFalse(scene.is_simulation_running())
+        self.assertAlmostEqual(scene.simulation_time, 0.3)
+
+    def test_simulation_substeps(self):
+        actor = RigidDynamic()
+        scene = Scene()
+        scene.add_actor(actor)
+        for _ in range(48):
+            scene.simulate(dt=0.5 / 48, substeps=10)
+        self.assertAlmostEqual(scene.simulation_time, 0.5)
+        expected_distance = -0.5 * 9.81 * scene.simulation_time ** 2
+        self.assertAlmostEqual(actor.get_global_pose()[0][2], expected_distance, places=2)
+        with self.assertRaises(ValueError):
+            scene.simulate(0.1, substeps=0)
+
+    def test_simulation_async(self):
+        actor = RigidDynamic()
+        scene = Scene()
+        scene.add_actor(actor)
+        for _ in range(480):
+            scene.simulate_async(dt=0.5 / 480)
+            self.assertTrue(scene.fetch_results())
+            self.assertTrue(scene.check_results())
+        self.assertAlmostEqual(scene.simulation_time, 0.5)
+        expected_distance = -0.5 * 9.81 * scene.simulation_time ** 2
+        self.assertAlmostEqual(actor.get_global_pose()[0][2], expected_distance, places=2)
+
+        scene.simulate_async(dt=0.1)
+        with self.assertRaises(RuntimeError):
+            scene.simulate_async(dt=0.1)
+        while not scene.fetch_results(block=False):
+            pass
+        self.assertAlmostEqual(scene.simulation_time, 0.6)
+
+        scene.simulate_async(0.1)
+        self.assertTrue(scene.is_simulation_running())
+        with self.assertRaises(RuntimeError):
+            scene.simulate(0.1)
+        scene.fetch_results()
+        self.assertFalse(scene.is_simulation_running())
+        scene.simulate_async(0.)
+        with self.assertRaises(RuntimeError):
+            scene.simulate_async(0.1)
+        self.assertTrue(scene.fetch_results())
+        self.assertFalse(scene.is_simulation_running())
+
     def test_get_actors(self):
         scene = Scene()
         r1 = RigidDynamic()
@@ -41,6 +127,61 @@ class SceneTestCase(unittest.TestCase):
         self.assertAlmostEqual(2., actors[1].get_mass())
         self.assertAlmostEqual(3., actors[2].get_mass())
 
+    def test_actors_ids_and_removal(self):
+        scene = Scene()
+        actors = [RigidDynamic() for _ in range(4)]
+        for a in actors:
+            scene.add_actor(a)
+        static = RigidStatic()
+        scene.add_actor(static)
+        ids = [scene.get_actor_id(a) for a in actors]
+        self.assertListEqual(ids, [0, 1, 2, 3])
+        self.assertEqual(scene.get_actor_id(static), 4)
+        self.assertTrue(scene.get_dynamic_rigid_actors()[0] is scene.get_dynamic_rigid_actors()[0])  # cached
+
+        scene.remove_actor(actors[1])
+        self.assertEqual(3, len(scene.get_dynamic_rigid_actors()))
+        self.assertListEqual(sorted(scene.get_dynamic_rigid_actors_ids().tolist()), [0, 2, 3])
+        self.assertEqual(scene.get_actor_id(actors[3]), 3)
+        with self.assertRaises(ValueError):
+            scene.get_actor_id(actors[1])
+        with self.assertRaises(ValueError):
+            scene.remove_actor(actors[1])
+
+        scene.add_actor(actors[1])
+        self.assertEqual(scene.get_actor_id(actors[1]), 5)  # ids are not reused
+        self.assertEqual(4, len(scene.get_dynamic_rigid_actors()))
+        for a, i in zip(scene.get_dynamic_rigid_actors(), scene.get_dynamic_rigid_actors_ids()):
+            self.assertEqual(scene.get_actor_id(a), i)
+
+        agg = Aggregate()
+        scene.add_aggregate(agg)
+        agg.add_actor(RigidDynamic())  # added to the scene through the aggregate
+        self.assertEqual(5, len(scene.get_dynamic_rigid_actors()))
+        scene.remove_aggregate(agg)
+        self.assertEqual(4, len(scene.get_dynamic_rigid_actors()))
+
+    def test_aggregate_actors_replaced_in_scene(self):
+        scene = Scene()
+        a, b = RigidDynamic(), RigidDynamic()
+        a.set_global_pose([1., 0, 0])
+        b.set_global_pose([2., 0, 0])
+        agg = Aggregate()
+        agg.add_actor(a)
+        scene.add_aggregate(agg)
+        id_a = scene.get_actor_id(a)
+        np.testing.assert_almost_equal(scene.get_dynamic_rigid_actors_poses()[:, 0], [1.])
+
+        agg.remove_actor(a)
+        agg.add_actor(b)  # the number of actors does not change
+        actors = scene.get_dynamic_rigid_actors()
+        self.assertEqual(len(actors), 1)
+        self.assertTrue(actors[0].get_global_pose()[0][0] == 2.)
+        np.testing.assert_almost_equal(scene.get_dynamic_rigid_actors_poses()[:, 0], [2.])
+        self.assertNotEqual(scene.get_actor_id(b), id_a)
+        with self.assertRaises(ValueError):
+            scene.get_actor_id(a)
+
     def test_get_aggregates(self):
         scene = Scene()
         agg = Aggregate()
@@ -56,6 +197,315 @@ class SceneTestCase(unittest.TestCase):
 
         self.assertEqual(2, len(scene.get_aggregates()))
 
+    def test_get_dynamic_actors_poses(self):
+        scene = Scene()
+        actors = [RigidDynamic() for _ in range(3)]
+        for i, a in enumerate(actors):
+            a.set_global_pose(([i, 2 * i, 3 * i], [1, 0, 0, 1]))
+            scene.add_actor(a)
+        scene.add_actor(RigidStatic())
+        poses = scene.get_dynamic_rigid_actors_poses()
+        self.assertEqual(poses.shape, (3, 7))
+        self.assertEqual(poses.dtype, np.float32)
+        for a, pose in zip(scene.get_dynamic_rigid_actors(), poses):
+            p, q = a.get_global_pose()
+            np.testing.assert_almost_equal(pose[:3], p)
+            np.testing.assert_almost_equal(pose[3:], [q.w, q.x, q.y, q.z])
+
+        out = np.zeros((3, 7), dtype=np.float32)
+        res = scene.get_dynamic_rigid_actors_poses(out=out)
+        self.assertTrue(res is out)
+        np.testing.assert_almost_equal(out, poses)
+        with self.assertRaises(ValueError):
+            scene.get_dynamic_rigid_actors_poses(out=np.zeros((2, 7), dtype=np.float32))
+        with self.assertRaises(ValueError):
+            scene.get_dynamic_rigid_actors_poses(out=np.zeros((3, 7)))
+
+    def test_state_buffer(self):
+        scene = Scene()
+        with self.assertRaises(RuntimeError):
+            scene.get_state_buffer()
+        for i in range(3):
+            a = RigidDynamic()
+            a.attach_shape(Shape.create_box([0.1] * 3, Material()))
+            a.set_global_pose([i, 0, 0])
+            a.set_linear_velocity([0, 0, i])
+            a.disable_gravity()
+            scene.add_actor(a)
+        scene.enable_state_buffer()
+        poses, lin_vel, ang_vel = scene.get_state_buffer()
+        self.assertTupleEqual(poses.shape, (3, 7))
+        self.assertTupleEqual(lin_vel.shape, (3, 3))
+        self.assertTupleEqual(ang_vel.shape, (3, 3))
+        self.assertFalse(poses.flags.writeable)
+        np.testing.assert_almost_equal(poses, scene.get_dynamic_rigid_actors_poses())
+
+        scene.simulate(0.1)
+        np.testing.assert_almost_equal(poses, scene.get_dynamic_rigid_actors_poses())  # updated in place
+        np.testing.assert_almost_equal(poses[:, 2], [0., 0.1, 0.2], decimal=4)
+        np.testing.assert_almost_equal(lin_vel[:, 2], [0., 1., 2.], decimal=4)
+
+        scene.simulate_async(0.1)
+        scene.fetch_results()
+        np.testing.assert_almost_equal(poses[:, 2], [0., 0.2, 0.4], decimal=4)
+
+        scene.enable_state_buffer()  # already enabled, the views stay valid
+        scene.simulate(0.1)
+        np.testing.assert_almost_equal(poses[:, 2], [0., 0.3, 0.6], decimal=4)
+
+        empty = Scene()
+        empty.enable_state_buffer()
+        poses, lin_vel, ang_vel = empty.get_state_buffer()
+        self.assertTupleEqual(poses.shape, (0, 7))
+        self.assertTupleEqual(ang_vel.shape, (0, 3))
+
+    def test_save_restore_state(self):
+        scene = Scene()
+        actors = [RigidDynamic() for _ in range(3)]
+        for i, a in enumerate(actors):
+            a.attach_shape(Shape.create_box([0.1] * 3, Material()))
+            a.set_global_pose([2. * i, 0, 0])
+            a.set_linear_velocity([1., 0, 0])
+            scene.add_actor(a)
+        joint = D6Joint(actors[0], actors[1], local_pose0=[1., 0, 0], local_pose1=[-1., 0, 0])
+        joint.set_drive_velocity([0., 0., 1.], [0., 0., 0.])
+        scene.simulate(0.1)
+        blob = scene.save_state()
+        poses = scene.get_dynamic_rigid_actors_poses()
+        for _ in range(10):
+            scene.simulate(0.1)
+        joint.set_drive_velocity([0., 0., 0.], [0., 0., 0.])
+        self.assertFalse(np.allclose(poses, scene.get_dynamic_rigid_actors_poses()))
+
+        scene.restore_state(blob)
+        self.assertAlmostEqual(scene.simulation_time, 0.1)
+        np.testing.assert_almost_equal(poses, scene.get_dynamic_rigid_actors_poses())
+        np.testing.assert_almost_equal(joint.get_drive_velocity()[0], [0., 0., 1.])
+        self.assertEqual(len(scene.save_state()), len(blob))
+
+        scene.add_actor(RigidDynamic())
+        with self.assertRaises(ValueError):
+            scene.restore_state(blob)
+
+    def test_rollout(self):
+        scene = Scene()
+        actors = [RigidDynamic() for _ in range(2)]
+        for i, a in enumerate(actors):
+            a.set_mass(2.)
+            a.set_global_pose([2. * i, 0, 0])
+            scene.add_actor(a)
+        rollout = Rollout(scene)
+        rollout.add_actor_forces([1])
+        rollout.record_actor_poses([0, 1])
+        rollout.record_actor_linear_velocities([1])
+        self.assertEqual(rollout.get_action_size(), 3)
+
+        blob = scene.save_state()
+        actions = np.tile([0., 0., 2. * 9.81], (48, 1))
+        poses, velocities = rollout.run(actions, dt=0.5 / 48, substeps=2)
+        self.assertEqual(poses.shape, (48, 2, 7))
+        self.assertEqual(velocities.shape, (48, 1, 3))
+        self.assertAlmostEqual(scene.simulation_time, 0.5)
+        self.assertAlmostEqual(poses[-1, 0, 2], -0.5 * 9.81 * 0.5 ** 2, places=2)
+        np.testing.assert_almost_equal(poses[:, 1, :3], np.tile([2., 0, 0], (48, 1)), decimal=4)
+        np.testing.assert_almost_equal(velocities, 0., decimal=4)
+        np.testing.assert_almost_equal(scene.get_dynamic_rigid_actors_poses(), poses[-1])
+
+        scene.restore_state(blob)
+        poses_restored, _ = rollout.run(actions, dt=0.5 / 48, substeps=2)
+        np.testing.assert_almost_equal(poses_restored, poses)
+
+        with self.assertRaises(ValueError):
+            rollout.run(np.zeros((10, 2)))
+        with self.assertRaises(ValueError):
+            rollout.run(actions, substeps=0)
+        rollout.record_actor_poses([2])
+        with self.assertRaises(IndexError):
+            rollout.run(actions)
+
+    def test_clone(self):
+        scene = Scene()
+        mat = Material(0.5, 0.5)
+        scene.add_actor(RigidStatic.create_plane(mat))
+        actors = [RigidDynamic() for _ in range(2)]
+        for i, a in enumerate(actors):
+            a.attach_shape(Shape.create_box([0.1] * 3, mat))
+            a.set_global_pose([0, 0, 1. + i])
+            a.set_mass(1. + i)
+            scene.add_actor(a)
+        agg = Aggregate()
+        agg.add_actor(RigidDynamic())
+        scene.add_aggregate(agg)
+        D6Joint(actors[0], actors[1], local_pose0=[0, 0, 0.5], local_pose1=[0, 0, -0.5])
+        actors[0].set_linear_velocity([1., 0, 0])
+        scene.simulation_time = 2.
+
+        clones = scene.clone(n=2)
+        self.assertEqual(2, len(clones))
+        for c in clones:
+            self.assertEqual(3, len(c.get_dynamic_rigid_actors()))
+            self.assertEqual(1, len(c.get_static_rigid_actors()))
+            self.assertEqual(1, len(c.get_aggregates()))
+            self.assertAlmostEqual(c.simulation_time, 2.)
+            np.testing.assert_almost_equal(c.get_dynamic_rigid_actors_poses(), scene.get_dynamic_rigid_actors_poses())
+            c_actors = c.get_dynamic_rigid_actors()
+            self.assertAlmostEqual(c_actors[1].get_mass(), 2.)
+            np.testing.assert_almost_equal(c_actors[0].get_linear_velocity(), [1., 0, 0])
+            shape = c_actors[0].get_atached_shapes()[0]
+            self.assertAlmostEqual(shape.get_materials()[0].get_static_friction(), 0.5)
+            self.assertEqual(len(c.save_state()), len(scene.save_state()))  # joint is cloned too
+
+        clones[0].simulate(0.1)
+        np.testing.assert_almost_equal(clones[1].get_dynamic_rigid_actors_poses(), scene.get_dynamic_rigid_actors_poses())
+        batch = SceneBatch.from_scene(scene, 3)
+        self.assertEqual(3, len(batch))
+        batch.simulate(0.1)
+
+    def test_export_load(self):
+        scene = Scene()
+        mat = Material(0.3, 0.3)
+        scene.add_actor(RigidStatic.create_plane(mat))
+        actors = [RigidDynamic() for _ in range(2)]
+        for i, a in enumerate(actors):
+            a.attach_shape(Shape.create_box([0.1] * 3, mat))
+            a.set_global_pose([0, 0, 1. + i])
+            scene.add_actor(a)
+        D6Joint(actors[0], actors[1], local_pose0=[0, 0, 0.5], local_pose1=[0, 0, -0.5])
+        with tempfile.TemporaryDirectory() as tmp:
+            for fmt in ['binary', 'xml']:
+                path = os.path.join(tmp, 'scene.' + fmt)
+                scene.export(path, format=fmt)
+                loaded = Scene()
+                loaded.load(path, format=fmt)
+                loaded.load(path, format=fmt)  # every load creates new objects
+                self.assertEqual(4, len(loaded.get_dynamic_rigid_actors()))
+                self.assertEqual(2, len(loaded.get_static_rigid_actors()))
+                np.testing.assert_almost_equal(np.sort(loaded.get_dynamic_rigid_actors_poses()[:, 2]), [1, 1, 2, 2])
+                empty = len(Scene().save_state())
+                self.assertEqual(len(loaded.save_state()) - empty, 2 * (len(scene.save_state()) - empty))  # joints
+                shape = loaded.get_dynamic_rigid_actors()[0].get_atached_shapes()[0]
+                self.assertAlmostEqual(shape.get_materials()[0].get_static_friction(), 0.3)
+                loaded.simulate(0.1)
+            with self.assertRaises(ValueError):
+                scene.export(os.path.join(tmp, 'scene.json'), format='json')
+            with self.assertRaises(ValueError):
+                Scene().load(os.path.join(tmp, 'missing.binary'))
+
+    def test_set_dynamic_actors_batched(self):
+        scene = Scene()
+        for _ in range(4):
+            a = RigidDynamic()
+            a.attach_shape(Shape.create_box([0.1] * 3, Material()))
+            a.set_mass(1.)
+            a.disable_gravity()
+            scene.add_actor(a)
+        actors = scene.get_dynamic_rigid_actors()
+        ind = np.array([1, 3])
+        scene.set_dynamic_rigid_actors_poses(ind, [[1, 2, 3, 1, 0, 0, 0], [4, 5, 6, 0, 0, 0, 2]])
+        np.testing.assert_almost_equal(actors[1].get_global_pose()[0], [1, 2, 3])
+        np.testing.assert_almost_equal(actors[3].get_global_pose()[0], [4, 5, 6])
+        np.testing.assert_almost_equal(npq.as_float_array(actors[3].get_global_pose()[1]), [0, 0, 0, 1])
+        np.testing.assert_almost_equal(actors[0].get_global_pose()[0], [0, 0, 0])
+
+        scene.set_dynamic_rigid_actors_linear_velocities(ind, [[1, 0, 0], [0, 1, 0]])
+        scene.set_dynamic_rigid_actors_angular_velocities(ind, [[0, 0, 1], [0, 0, 2]])
+        np.testing.assert_almost_equal(actors[1].get_linear_velocity(), [1, 0, 0])
+        np.testing.assert_almost_equal(actors[3].get_angular_velocity(), [0, 0, 2])
+
+        scene.add_dynamic_rigid_actors_forces([0], [[0, 0, 1.]], ForceMode.VELOCITY_CHANGE)
+        scene.add_dynamic_rigid_actors_torques([2], [[0, 0, 1.]], ForceMode.VELOCITY_CHANGE)
+        scene.simulate(0.1)
+        np.testing.assert_almost_equal(actors[0].get_linear_velocity(), [0, 0, 1], decimal=3)
+        self.assertGreater(actors[2].get_angular_velocity()[2], 0.)
+
+        with self.assertRaises(IndexError):
+            scene.set_dynamic_rigid_actors_linear_velocities([4], [[1, 0, 0]])
+        with self.assertRaises(ValueError):
+            scene.set_dynamic_rigid_actors_linear_velocities([0, 1], [[1, 0, 0]])
+
+    def test_scene_queries_batched(self):
+        scene = Scene()
+        ground = RigidStatic()
+        ground_shape = Shape.create_box([10, 10, 0.1], Material())
+        ground_shape.set_flag(ShapeFlag.SCENE_QUERY_SHAPE, True)
+        ground.attach_shape(ground_shape)
+        ground.set_global_pose([0, 0, -0.05])
+        scene.add_actor(ground)
+        for i in range(2):
+            a = RigidDynamic()
+            shape = Shape.create_box([0.2] * 3, Material())
+            shape.set_flag(ShapeFlag.SCENE_QUERY_SHAPE, True)
+            a.attach_shape(shape)
+            a.set_global_pose([i, 0, 1])
+            scene.add_actor(a)
+
+        origins = [[0, 0, 2], [1, 0, 2], [2, 0, 2], [2, 0, 2]]
+        directions = [[0, 0, -1], [0, 0, -2], [0, 0, -1], [0, 0, 1]]
+        distances, positions, normals, actor_indices = scene.raycast_batch(origins, directions, max_dist=10.)
+        np.testing.assert_almost_equal(distances[:3], [0.9, 0.9, 2.], decimal=4)
+        self.assertTrue(np.isinf(distances[3]))
+        np.testing.assert_almost_equal(positions[1], [1, 0, 1.1], decimal=4)
+        np.testing.assert_almost_equal(normals[0], [0, 0, 1], decimal=4)
+        np.testing.assert_equal(actor_indices, [0, 1, -2, -1])
+
+        sphere = Shape.create_sphere(0.1, Material())
+        distances, _, _, actor_indices = scene.sweep_batch(sphere, [[1, 0, 2, 1, 0, 0, 0]], [[0, 0, -1]])
+        np.testing.assert_almost_equal(distances, [0.8], decimal=4)
+        np.testing.assert_equal(actor_indices, [1])
+
+        poses = [[0, 0, 1, 1, 0, 0, 0], [0, 0, 0, 1, 0, 0, 0], [5, 5, 5, 1, 0, 0, 0]]
+        np.testing.assert_equal(scene.overlap_batch(sphere, poses), [0, -2, -1])
+
+        with self.assertRaises(ValueError):
+            scene.raycast_batch(origins, directions[:2])
+
+    def test_contacts(self):
+        scene = Scene(contact_buffer_size=1000)
+        scene.add_actor(RigidStatic.create_plane(Material()))
+        actor = RigidDynamic()
+        actor.attach_shape(Shape.create_box([0.2] * 3, Material()))
+        actor.set_mass(1.)
+        actor.set_global_pose([0, 0, 0.11])
+        scene.add_actor(actor)
+        scene.simulate(0.01)
+        contacts = scene.get_contacts()
+        self.assertGreater(len(contacts), 0)
+        self.assertEqual(set(contacts.dtype.names), {'actor0', 'actor1', 'position', 'normal', 'impulse', 'separation'})
+        self.assertEqual(contacts['position'].shape, (len(contacts), 3))
+        np.testing.assert_equal(np.sort([contacts['actor0'], contacts['actor1']], axis=0), [[-2] * len(contacts),
+                                                                                              [0] * len(contacts)])
+        np.testing.assert_almost_equal(np.abs(contacts['normal'][:, 2]), 1., decimal=3)
+        self.assertEqual(len(scene.get_contacts()), 0)
+        self.assertEqual(scene.get_num_dropped_contacts(), 0)
+
+        scene = Scene(contact_buffer_size=2)
+        scene.add_actor(RigidStatic.create_plane(Material()))
+        actor = RigidDynamic()
+        actor.attach_shape(Shape.create_box([0.2] * 3, Material()))
+        actor.set_global_pose([0, 0, 0.09])
+        scene.add_actor(actor)
+        scene.simulate(0.01)
+        self.assertEqual(len(scene.get_contacts()), 2)
+
+        with self.assertRaises(RuntimeError):
+            Scene().get_contacts()
+
+    def test_find_overlapping_pairs(self):
+        scene = Scene()
+        for x in [0., 0.15, 1., 5., 5.15, 5.3]:
+            a = RigidDynamic()
+            a.attach_shape(Shape.create_box([0.2] * 3, Material()))
+            a.set_global_pose([x, 0, 0])
+            scene.add_actor(a)
+        np.testing.assert_equal(scene.find_overlapping_pairs(), [[0, 1], [3, 4], [4, 5]])
+
+        table = RigidStatic()
+        table.attach_shape(Shape.create_box([2., 1., 0.1], Material()))
+        table.set_global_pose([0.5, 0, -0.1])
+        actors = [table] + scene.get_dynamic_rigid_actors()
+        np.testing.assert_equal(scene.find_overlapping_pairs(actors), [[0, 1], [0, 2], [0, 3], [1, 2], [4, 5], [5, 6]])
+        self.assertEqual(scene.find_overlapping_pairs([]).shape, (0, 2))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+# Copyright (c) CTU  - All Rights Reserved
+# Created on: 10/17/26
+#     Author: Vladimir Petrik <vladimir.petrik@cvut.cz>
+
+import numpy as np
+import unittest
+import sys
+
+sys.path.append('lib')
+
+from pyphysx import *
+
+
+class SceneBatchTestCase(unittest.TestCase):
+
+    def test_simulate_batch(self):
+        batch = SceneBatch(num_scenes=4)
+        self.assertEqual(4, len(batch))
+        for i in range(len(batch)):
+            for j in range(2):
+                a = RigidDynamic()
+                a.set_global_pose([i, j, 0.])
+                batch.get_scene(i).add_actor(a)
+        for _ in range(480):
+            batch.simulate(dt=0.5 / 480)
+        self.assertAlmostEqual(batch.get_scene(2).simulation_time, 0.5)
+
+        poses = batch.get_dynamic_rigid_actors_poses()
+        self.assertEqual(poses.shape, (4, 2, 7))
+        self.assertEqual(poses.dtype, np.float32)
+        np.testing.assert_almost_equal(poses[:, :, 2], -0.5 * 9.81 * 0.5 ** 2, decimal=2)
+        np.testing.assert_almost_equal(poses[3, 1, :2], [3, 1])
+        velocities = batch.get_dynamic_rigid_actors_linear_velocities()
+        self.assertEqual(velocities.shape, (4, 2, 3))
+        np.testing.assert_almost_equal(velocities[:, :, 2], -9.81 * 0.5, decimal=2)
+        np.testing.assert_almost_equal(batch.get_dynamic_rigid_actors_angular_velocities(), 0.)
+
+        out = np.zeros((4, 2, 7), dtype=np.float32)
+        self.assertTrue(batch.get_dynamic_rigid_actors_poses(out=out) is out)
+        np.testing.assert_almost_equal(out, poses)
+
+        batch.get_scene(0).add_actor(RigidDynamic())
+        with self.assertRaises(ValueError):
+            batch.get_dynamic_rigid_actors_poses()
+        with self.assertRaises(IndexError):
+            batch.get_scene(4)
+
+    def test_simulate_batch_substeps(self):
+        batch = SceneBatch(num_scenes=2)
+        for i in range(len(batch)):
+            batch.get_scene(i).add_actor(RigidDynamic())
+        for _ in range(48):
+            batch.simulate(dt=0.5 / 48, substeps=10)
+        self.assertAlmostEqual(batch.get_scene(1).simulation_time, 0.5)
+        poses = batch.get_dynamic_rigid_actors_poses()
+        np.testing.assert_almost_equal(poses[:, :, 2], -0.5 * 9.81 * 0.5 ** 2, decimal=2)
+        with self.assertRaises(ValueError):
+            batch.simulate(0.1, substeps=0)
+
+        batch.get_scene(1).simulate_async(0.1)
+        with self.assertRaises(RuntimeError):
+            batch.simulate(0.1)
+        batch.get_scene(1).fetch_results()
+        batch.simulate(0.1)
+        self.assertAlmostEqual(batch.get_scene(0).simulation_time, 0.6)
+        self.assertAlmostEqual(batch.get_scene(1).simulation_time, 0.7)
+
+
+if __name__ == '__main__':
+    unittest.main()
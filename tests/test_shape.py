@@ -36,6 +36,48 @@ class ShapeTestCase(unittest.TestCase):
         s = Shape.create_convex_mesh_from_points(points, Material(), scale=0.5)
         self.assertEqual(s.get_shape_data().shape[0], 6)  # additional 3 faces but one is removed from previous shape
 
+    def test_convex_mesh_cache(self):
+        ConvexMeshCache.clear()
+        ConvexMeshCache.reset_statistics()
+        points = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1.]])
+        s1 = Shape.create_convex_mesh_from_points(points, Material(), scale=0.5)
+        s2 = Shape.create_convex_mesh_from_points(points, Material(), scale=2.)
+        stats = ConvexMeshCache.get_statistics()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['size'], 1)
+        np.testing.assert_almost_equal(4 * s1.get_shape_data(), s2.get_shape_data())  # shared mesh, different scale
+
+        Shape.create_convex_mesh_from_points(points, Material(), vertex_limit=16)
+        self.assertEqual(ConvexMeshCache.get_statistics()['misses'], 2)
+
+        ConvexMeshCache.set_max_size(1)
+        self.assertEqual(ConvexMeshCache.get_statistics()['size'], 1)
+        self.assertEqual(s1.get_shape_data().shape[0], 4)  # evicted mesh is still valid for the existing shape
+        ConvexMeshCache.clear()
+        self.assertEqual(ConvexMeshCache.get_statistics()['size'], 0)
+        ConvexMeshCache.set_max_size()
+
+    def test_convex_mesh_disk_cache(self):
+        import os
+        import tempfile
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ConvexMeshCache.set_cache_dir(cache_dir)
+            ConvexMeshCache.clear()
+            ConvexMeshCache.reset_statistics()
+            points = np.array([[0, 0, 0], [2, 0, 0], [0, 2, 0], [0, 0, 2.]])
+            s1 = Shape.create_convex_mesh_from_points(points, Material())
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            ConvexMeshCache.clear()  # simulates new process, i.e. empty in-memory cache
+            s2 = Shape.create_convex_mesh_from_points(points, Material())
+            stats = ConvexMeshCache.get_statistics()
+            self.assertEqual(stats['misses'], 2)
+            self.assertEqual(stats['disk_hits'], 1)
+            np.testing.assert_almost_equal(s1.get_shape_data(), s2.get_shape_data())
+            ConvexMeshCache.set_cache_dir('')
+        with self.assertRaises(ValueError):
+            ConvexMeshCache.set_cache_dir(cache_dir)
+
     def test_userdata(self):
         name1 = "asdf"
         shape = Shape.create_sphere(1., Material())
@@ -131,6 +131,60 @@ class TransformationTestCase(unittest.TestCase):
         self.assertAlmostEqual(np.linalg.norm(u - u1), 0.)
         self.assertAlmostEqual(npq.rotation_intrinsic_distance(npq.one, quat_between_two_vectors(v, v)), 0.)
 
+    def test_batched_pose_arrays(self):
+        rng = np.random.RandomState(0)
+        n = 5
+        poses1 = np.hstack([rng.randn(n, 3), Rotation.random(n, random_state=1).as_quat()[:, [3, 0, 1, 2]]])
+        poses2 = np.hstack([rng.randn(n, 3), Rotation.random(n, random_state=2).as_quat()[:, [3, 0, 1, 2]]])
+        products = multiply_pose_arrays(poses1, poses2)
+        inverses = inverse_pose_arrays(poses1)
+        matrices = pose_arrays_to_transformation_matrices(poses1)
+        self.assertTupleEqual(products.shape, (n, 7))
+        self.assertTupleEqual(matrices.shape, (n, 4, 4))
+        for i in range(n):
+            self.assertTrue(np.allclose(get_t_matrix(products[i]), get_t_matrix(poses1[i]) @ get_t_matrix(poses2[i])))
+            self.assertTrue(np.allclose(get_t_matrix(inverses[i]), np.linalg.inv(get_t_matrix(poses1[i]))))
+            self.assertTrue(np.allclose(matrices[i], get_t_matrix(poses1[i])))
+
+        single = multiply_pose_arrays(poses1, poses2[0])
+        for i in range(n):
+            self.assertTrue(np.allclose(get_t_matrix(single[i]), get_t_matrix(poses1[i]) @ get_t_matrix(poses2[0])))
+
+    def test_batched_pose_arrays_match_single_pose(self):
+        pose1 = (np.array([0.1, -0.2, 0.3]), quat_from_euler('xyz', [0.3, -0.4, 1.2]))
+        pose2 = (np.array([-0.5, 0.4, 0.2]), quat_from_euler('XYZ', [-0.1, 0.7, 0.2]))
+        arr1, arr2 = pose_to_array(pose1), pose_to_array(pose2)
+        self.assertTrue(np.allclose(multiply_pose_arrays(arr1, arr2),
+                                    pose_to_array(multiply_transformations(pose1, pose2))))
+        self.assertTrue(np.allclose(inverse_pose_arrays(arr1), pose_to_array(inverse_transform(pose1))))
+        self.assertTrue(np.allclose(pose_arrays_to_transformation_matrices(arr1), pose_to_transformation_matrix(pose1)))
+        self.assertTrue(np.allclose(quat_arrays_from_euler('xyz', [0.3, -0.4, 1.2]), npq.as_float_array(pose1[1])))
+
+        arr = np.array([1., 2., 3., 2., 0., 0., 0.])
+        self.assertTrue(np.allclose(pose_to_array(arr), arr))  # arrays are passed through without normalization
+        self.assertTrue(np.allclose(pose_to_array((arr[:3], npq.quaternion(*arr[3:]))), arr))
+
+    def test_batched_euler(self):
+        angles = np.random.RandomState(0).randn(4, 3)
+        for seq in ['XYZ', 'xyz', 'zyx', 'XYX']:
+            q = quat_arrays_from_euler(seq, angles)
+            expq = Rotation.from_euler(seq, angles).as_quat()[:, [3, 0, 1, 2]]
+            self.assertTrue(np.allclose(np.abs(np.sum(q * expq, axis=-1)), 1.))
+
+    def test_slerp(self):
+        q0 = npq.as_float_array(npq.one)
+        q1 = npq.as_float_array(quat_from_euler('z', np.pi / 2))
+        q = slerp_quaternion_arrays(q0, q1, np.array([0., 0.5, 1.]))
+        self.assertTrue(np.allclose(q[0], q0))
+        self.assertTrue(np.allclose(q[1], npq.as_float_array(quat_from_euler('z', np.pi / 4))))
+        self.assertTrue(np.allclose(q[2], q1))
+        self.assertTrue(np.allclose(slerp_quaternion_arrays(q0, -q1, 0.5), q[1]))  # shortest path
+        self.assertTrue(np.allclose(slerp_quaternion_arrays(q0, q0, 0.3), q0))
+
+        p = slerp_pose_arrays(np.concatenate([[0., 0., 0.], q0]), np.concatenate([[2., 0., 0.], q1]), 0.5)
+        self.assertTrue(np.allclose(p[:3], [1., 0., 0.]))
+        self.assertTrue(np.allclose(p[3:], q[1]))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -113,6 +113,60 @@ class TreeRobotTestCase(unittest.TestCase):
         self.assert_pose(transformations['l4'], ((2, 2, -1), quat_from_euler('x', [np.deg2rad(90)])))
         self.assert_pose(transformations['l5'], ((2, 2, 0), quat_from_euler('x', [np.deg2rad(90)])))
 
+    def test_kinematic_chain_batch(self):
+        r = TreeRobot()
+        [r.add_link(Link('l{}'.format(i), RigidDynamic())) for i in range(4)]
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='revolute'), local_pose0=((0, 0, 1), quat_from_euler('y', 0.3)))
+        r.add_joint('l1', 'l2', Joint('j1', joint_type='prismatic', null_value=0.2), local_pose0=(0, 1, 0),
+                    local_pose1=((0, 0, 0.5), quat_from_euler('z', 0.4)))
+        r.add_joint('l1', 'l3', Joint('j2', joint_type='fixed'), local_pose0=(1, 0, 0))
+        r.attach_root_node_to_pose(((1, 2, 3), quat_from_euler('xyz', [0.1, 0.2, 0.3])))
+        q_batch = np.random.uniform(-1, 1, size=(5, 2))
+        poses = r.compute_link_poses_batch(q_batch)
+        self.assertEqual(poses.shape, (5, 4, 7))
+        for q, link_poses in zip(q_batch, poses):
+            transformations = r.compute_link_transformations(dict(j0=q[0], j1=q[1]))
+            single_poses = r.kinematic_chain.compute_link_poses(q, r.root_pose)
+            for i, link_name in enumerate(r.links.keys()):
+                self.assert_pose(array_to_pose(link_poses[i]), transformations[link_name])
+                self.assert_pose(array_to_pose(single_poses[i]), transformations[link_name])
+            expected = multiply_transformations(multiply_transformations(
+                r.root_pose, ((0, 0, 1), quat_from_euler('y', 0.3))), ((0, 0, 0), quat_from_euler('x', q[0])))
+            self.assert_pose(transformations['l1'], expected)
+            self.assert_pose(transformations['l3'], multiply_transformations(expected, (1, 0, 0)))
+        np.testing.assert_almost_equal(r.kinematic_chain.joint_values_to_array(dict(j0=1.)), [1., 0.2])
+
+        chain = r.kinematic_chain
+        self.assertTrue(chain is r.kinematic_chain)
+        r.add_link(Link('l4', RigidDynamic()))
+        r.add_joint('l3', 'l4', Joint('j3', joint_type='revolute'))
+        self.assertFalse(chain is r.kinematic_chain)
+        self.assertEqual(r.compute_link_poses_batch(np.zeros((2, 3))).shape, (2, 5, 7))
+
+    def test_joint_cache(self):
+        r = TreeRobot()
+        [r.add_link(Link('l{}'.format(i), RigidDynamic())) for i in range(2)]
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='revolute'), local_pose0=(0, 0, 1), local_pose1=(0, 1, 0),
+                    lower_limit=-1, upper_limit=2)
+        joint = r.movable_joints['j0']
+        self.assertAlmostEqual(joint.get_limits()[0], -1)
+        self.assertAlmostEqual(joint.get_limits()[1], 2)
+        self.assertTrue(joint.get_limits() is joint.get_limits())
+        t0, t1, t1_inv = joint.local_poses
+        self.assert_pose(t0, (0, 0, 1))
+        self.assert_pose(t1_inv, (0, -1, 0))
+        self.assertTrue(joint.local_poses is joint.local_poses)
+
+        joint.set_limits(-0.5, 0.5)
+        self.assertAlmostEqual(joint.get_limits()[1], 0.5)
+        joint.set_limits()
+        self.assertEqual(joint.get_limits(), (-np.inf, np.inf))
+
+        joint.physx_joint.set_motion(D6Axis.TWIST, D6Motion.LIMITED)  # direct modification requires invalidation
+        self.assertEqual(joint.get_limits(), (-np.inf, np.inf))
+        joint.invalidate_cache()
+        self.assertAlmostEqual(joint.get_limits()[1], 0.5)
+
     def test_kinematic_joint(self):
         j = KinematicPhysXJoint(None, None, (0, 0, 1), (0, 0, 2))
         self.assert_pose(j.get_local_pose(0), (0, 0, 1))
@@ -139,6 +193,189 @@ class TreeRobotTestCase(unittest.TestCase):
         r.update(1.)
         self.assertAlmostEqual(r.movable_joints['j0'].commanded_joint_position, 0.3)
 
+    def test_joint_arrays(self):
+        r = TreeRobot()
+        for i in range(3):
+            r.add_link(Link('l{}'.format(i), RigidDynamic()))
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='prismatic'), local_pose0=(0, 0, 1), lower_limit=-1,
+                    upper_limit=0.5)
+        r.add_joint('l1', 'l2', Joint('j1', joint_type='revolute', null_value=0.3), local_pose0=(0, 0, 1))
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0., 0.3])
+        np.testing.assert_almost_equal(r.get_joint_limits(), [[-1, -np.inf], [0.5, np.inf]])
+        self.assertEqual(r.joint_group.get_num_joints(), 2)
+
+        r.set_joint_positions(np.array([0.1, 0.2]))
+        r.set_joint_velocities(np.array([1., -1.]))
+        self.assertAlmostEqual(r.movable_joints['j1'].commanded_joint_position, 0.2)
+        self.assertAlmostEqual(r.movable_joints['j0'].commanded_joint_velocity, 1.)
+        pos, _ = r.movable_joints['j0'].physx_joint.get_drive_position()
+        self.assertAlmostEqual(pos[0], 0.1, places=5)
+        _, q = r.movable_joints['j1'].physx_joint.get_drive_position()
+        self.assertAlmostEqual(npq.rotation_intrinsic_distance(q, quat_from_euler('x', [0.2])), 0., places=5)
+
+        r.update(1.)
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0.5, -0.8])
+        r.movable_joints['j1'].set_joint_position(0.4)
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0.5, 0.4])
+        r.movable_joints['j0'].set_limits(-1, 1)
+        r.update(0.25)
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0.75, 0.15])
+        r.set_joints_position(dict(j0=0., j1=0.))
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0., 0.])
+        with self.assertRaises(ValueError):
+            r.joint_group.set_drive_positions(np.zeros(3))
+
+    def test_joint_state(self):
+        scene = Scene()
+        r = TreeRobot()
+        for i in range(3):
+            link = Link('l{}'.format(i), RigidDynamic())
+            link.actor.attach_shape(Shape.create_box([0.1] * 3, Material()))
+            r.add_link(link)
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='prismatic'), local_pose0=(0, 0, 0.3))
+        r.add_joint('l1', 'l2', Joint('j1', joint_type='revolute'), local_pose0=(0, 0, 0.3))
+        r.attach_root_node_to_pose(unit_pose())
+        r.reset_pose(dict(j0=0.2, j1=0.5))
+        scene.add_aggregate(r.get_aggregate())
+        np.testing.assert_almost_equal(r.get_joint_positions(), [0.2, 0.5], decimal=5)
+        np.testing.assert_almost_equal(r.get_joint_velocities(), [0., 0.], decimal=5)
+
+        for joint in r.movable_joints.values():
+            joint.configure_drive(stiffness=1e6, damping=1e4)
+        r.set_joint_velocities([0.1, 0.2])
+        for _ in range(10):
+            r.update(0.01)
+            scene.simulate(0.01)
+        positions, velocities, forces, torques = r.get_joint_state()
+        self.assertEqual(forces.shape, (2, 3))
+        self.assertEqual(torques.shape, (2, 3))
+        np.testing.assert_almost_equal(positions, [0.21, 0.52], decimal=2)
+        np.testing.assert_almost_equal(velocities, [0.1, 0.2], decimal=1)
+        np.testing.assert_almost_equal(r.get_joint_positions(), positions)
+        for i, joint in enumerate(r.movable_joints.values()):
+            force, torque = joint.physx_joint.get_force_torque()
+            np.testing.assert_almost_equal(forces[i], force, decimal=3)
+            np.testing.assert_almost_equal(torques[i], torque, decimal=3)
+
+        with self.assertRaises(ValueError):
+            TreeRobot(kinematic=True).get_joint_state()
+
+    def test_joint_controller(self):
+        scene = Scene()
+        r = TreeRobot()
+        for i in range(3):
+            link = Link('l{}'.format(i), RigidDynamic())
+            link.actor.attach_shape(Shape.create_box([0.1] * 3, Material()))
+            r.add_link(link)
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='prismatic'), local_pose0=(0, 0, 0.3), lower_limit=-1,
+                    upper_limit=0.05)
+        r.add_joint('l1', 'l2', Joint('j1', joint_type='revolute'), local_pose0=(0, 0, 0.3))
+        r.attach_root_node_to_pose(unit_pose())
+        r.reset_pose()
+        scene.add_aggregate(r.get_aggregate())
+        for joint in r.movable_joints.values():
+            joint.configure_drive(stiffness=1e6, damping=1e4)
+        controller = r.get_joint_controller()
+        self.assertTrue(controller is r.get_joint_controller())
+        self.assertEqual(controller.get_num_joints(), 2)
+        scene.add_joint_controller(controller)
+        self.assertEqual(len(scene.get_joint_controllers()), 1)
+
+        r.set_joint_velocities([0.1, 0.2])
+        for _ in range(10):
+            scene.simulate(0.1, substeps=10)
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0.05, 0.2])
+        self.assertAlmostEqual(r.movable_joints['j1'].commanded_joint_position, 0.2)
+        np.testing.assert_almost_equal(r.get_joint_positions(), [0.05, 0.2], decimal=2)
+
+        r.movable_joints['j0'].set_limits(-1, 1)
+        scene.simulate(0.1, substeps=10)
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0.06, 0.22])
+        r.movable_joints['j0'].physx_joint.set_linear_limit(D6Axis.X, lower_limit=-1, upper_limit=0.07)
+        r.movable_joints['j0'].invalidate_cache()  # limits are refreshed for the controller
+        np.testing.assert_almost_equal(r.get_joint_limits()[:, 0], [-1, 0.07])
+        scene.simulate(0.1, substeps=10)
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0.07, 0.24])
+        scene.remove_joint_controller(controller)
+        scene.simulate(0.1, substeps=10)
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0.07, 0.24])
+        with self.assertRaises(ValueError):
+            scene.remove_joint_controller(controller)
+        with self.assertRaises(ValueError):
+            JointController(r.joint_group, np.zeros((4, 3)))
+
+    def test_save_restore_state_with_controller(self):
+        scene = Scene()
+        r = TreeRobot()
+        for i in range(3):
+            link = Link('l{}'.format(i), RigidDynamic())
+            link.actor.attach_shape(Shape.create_box([0.1] * 3, Material()))
+            r.add_link(link)
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='prismatic'), local_pose0=(0, 0, 0.3))
+        r.add_joint('l1', 'l2', Joint('j1', joint_type='revolute'), local_pose0=(0, 0, 0.3))
+        r.attach_root_node_to_pose(unit_pose())
+        r.reset_pose()
+        scene.add_aggregate(r.get_aggregate())
+        for joint in r.movable_joints.values():
+            joint.configure_drive(stiffness=1e6, damping=1e4)
+        scene.add_joint_controller(r.get_joint_controller())
+        r.set_joint_velocities([0.1, 0.2])
+        scene.simulate(0.1, substeps=10)
+        blob = scene.save_state()
+
+        r.set_joint_velocities([-0.1, -0.2])
+        scene.simulate(0.5, substeps=10)
+        scene.restore_state(blob)
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0.01, 0.02])
+        np.testing.assert_almost_equal(r.get_commanded_joint_velocities(), [0.1, 0.2])
+        scene.simulate(0.1, substeps=10)  # controller continues from the restored commands
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0.02, 0.04])
+
+        scene.remove_joint_controller(r.get_joint_controller())
+        with self.assertRaises(ValueError):
+            scene.restore_state(blob)
+
+    def test_rollout(self):
+        scene = Scene()
+        r = TreeRobot()
+        for i in range(3):
+            link = Link('l{}'.format(i), RigidDynamic())
+            link.actor.attach_shape(Shape.create_box([0.1] * 3, Material()))
+            r.add_link(link)
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='prismatic'), local_pose0=(0, 0, 0.3))
+        r.add_joint('l1', 'l2', Joint('j1', joint_type='revolute'), local_pose0=(0, 0, 0.3))
+        r.attach_root_node_to_pose(unit_pose())
+        r.reset_pose()
+        scene.add_aggregate(r.get_aggregate())
+        for joint in r.movable_joints.values():
+            joint.configure_drive(stiffness=1e6, damping=1e4)
+
+        rollout = Rollout(scene)
+        rollout.add_joint_targets(r.joint_group)
+        rollout.record_joint_positions(r.joint_group)
+        rollout.record_joint_velocities(r.joint_group)
+        actions = np.linspace([0., 0.], [0.1, 0.4], 20)
+        positions, velocities = rollout.run(actions, dt=0.05, substeps=5)
+        self.assertEqual(positions.shape, (20, 2))
+        self.assertEqual(velocities.shape, (20, 2))
+        np.testing.assert_almost_equal(positions[-1], [0.1, 0.4], decimal=2)
+        np.testing.assert_almost_equal(r.get_joint_positions(), positions[-1])
+
+        controller = r.get_joint_controller()
+        scene.add_joint_controller(controller)
+        r.set_joint_velocities([0.5, 0.5])  # actions of the rollout override the controller
+        rollout = Rollout(scene)
+        rollout.add_controller_targets(controller)
+        rollout.record_joint_positions(r.joint_group)
+        positions, = rollout.run(actions[::-1], dt=0.05, substeps=5)
+        np.testing.assert_almost_equal(positions[-1], [0., 0.], decimal=2)
+        np.testing.assert_almost_equal(r.get_commanded_joint_positions(), [0., 0.])
+        scene.remove_joint_controller(controller)
+        r.set_joint_velocities([0., 0.])
+        r.update(0.05)  # commanded state is up to date, i.e. update keeps the targets of the rollout
+        scene.simulate(0.05)
+        np.testing.assert_almost_equal(r.get_joint_positions(), [0., 0.], decimal=2)
+
     def test_update_kin_target(self):
         scene = Scene()
         r = TreeRobot(kinematic=True)
@@ -153,6 +390,120 @@ class TreeRobotTestCase(unittest.TestCase):
         scene.simulate(0.1)
         self.assert_pose(r.links['l1'].actor.get_global_pose(), (0.01, 0, 1.0))
 
+    def test_check_collisions(self):
+        r = TreeRobot()
+        for i in range(3):
+            link = Link('l{}'.format(i), RigidDynamic())
+            link.actor.attach_shape(Shape.create_box([0.2] * 3, Material()))
+            r.add_link(link)
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='prismatic'), local_pose0=(0, 0, 0.3))
+        r.add_joint('l1', 'l2', Joint('j1', joint_type='revolute'), local_pose0=(0, 0, 0.3), local_pose1=(0, 0, -0.6))
+        np.testing.assert_equal(r.get_self_collision_pairs(), [[0, 2]])
+        poses = r.compute_link_poses_batch([[0., 0.], [1., 0.]])
+        self.assertEqual(poses.shape, (2, 3, 7))
+        np.testing.assert_almost_equal(poses[1, 2, :3], [1, 0, 1.2])
+
+        obstacle = RigidStatic()
+        obstacle.attach_shape(Shape.create_box([0.2] * 3, Material()))
+        obstacle.set_global_pose([1, 0, 0.3])
+        q = [[0., 0.], [1., 0.], [-1., 0.], [0., np.pi]]  # last configuration folds l2 back onto l0
+        np.testing.assert_equal(r.check_collisions(q, environment_actors=[obstacle]), [False, True, False, True])
+        np.testing.assert_equal(r.check_collisions(q), [False, False, False, True])
+        np.testing.assert_equal(r.check_collisions(q, [obstacle], self_collisions=False), [False, True, False, False])
+        self.assert_pose(r.links['l1'].actor.get_global_pose(), unit_pose())  # state is not modified
+
+    def test_articulation(self):
+        scene = Scene()
+        r = TreeRobot(articulation=True)
+        for i in range(3):
+            link = Link('l{}'.format(i), RigidDynamic())
+            link.actor.attach_shape(Shape.create_box([0.1] * 3, Material()))
+            r.add_link(link)
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='prismatic'), local_pose0=(0, 0, 0.3), lower_limit=-1,
+                    upper_limit=1)
+        r.add_joint('l1', 'l2', Joint('j1', joint_type='revolute'), local_pose0=(0, 0, 0.3))
+        r.attach_root_node_to_pose((1, 0, 0))
+        r.reset_pose(dict(j0=0.2, j1=0.5))
+        scene.add_aggregate(r.get_aggregate())
+        art = r.get_articulation()
+        self.assertTrue(art is r.get_articulation())
+        self.assertTrue(art.is_in_scene())
+        self.assertEqual(art.get_num_joints(), 2)
+        self.assertEqual(len(scene.get_articulations()), 1)
+        self.assertTrue(isinstance(r.links['l1'].actor, ArticulationLink))
+        self.assertEqual(len(r.links['l1'].actor.get_atached_shapes()), 1)
+        np.testing.assert_almost_equal(art.get_joint_positions(), [0.2, 0.5], decimal=5)
+        np.testing.assert_almost_equal(art.get_drive_targets(), [0.2, 0.5], decimal=5)
+        self.assertAlmostEqual(r.movable_joints['j0'].get_limits()[1], 1)
+        self.assertEqual(r.movable_joints['j1'].get_limits(), (-np.inf, np.inf))
+        self.assert_pose(r.links['l1'].actor.get_global_pose(), (1.2, 0, 0.3))
+
+        art.set_joint_positions([0.1, 0.])
+        art.set_joint_velocities([0.3, 0.])
+        np.testing.assert_almost_equal(art.get_joint_positions(), [0.1, 0.], decimal=5)
+        out = np.zeros(2, dtype=np.float32)
+        art.get_joint_velocities(out=out)
+        np.testing.assert_almost_equal(out, [0.3, 0.], decimal=5)
+        art.set_drive_targets(np.array([-0.1, 0.2]))
+        np.testing.assert_almost_equal(art.get_drive_targets(), [-0.1, 0.2], decimal=5)
+        r.movable_joints['j1'].set_joint_position(0.4)
+        np.testing.assert_almost_equal(art.get_drive_targets(), [-0.1, 0.4], decimal=5)
+        with self.assertRaises(ValueError):
+            art.set_drive_targets(np.zeros(3))
+        with self.assertRaises(ValueError):
+            art.set_joint_limits(r.links['l2'].actor, lower_limit=0.)
+        with self.assertRaises(RuntimeError):
+            r.add_link(Link('l3', RigidDynamic()))
+
+        r.movable_joints['j0'].configure_drive(stiffness=1e6, damping=1e4)
+        r.movable_joints['j0'].set_joint_position(-0.1)
+        for _ in range(100):
+            r.update(0.01)
+            scene.simulate(0.01)
+        self.assertAlmostEqual(art.get_joint_positions()[0], -0.1, places=2)
+
+    def test_articulation_invalid(self):
+        with self.assertRaises(ValueError):
+            TreeRobot(kinematic=True, articulation=True)
+        with self.assertRaises(ValueError):
+            TreeRobot().get_articulation()
+        with self.assertRaises(ValueError):
+            TreeRobot(articulation=True).attach_root_node_to_actor(RigidDynamic())
+
+    def test_articulation_save_restore_state(self):
+        scene = Scene()
+        r = TreeRobot(articulation=True)
+        for i in range(3):
+            link = Link('l{}'.format(i), RigidDynamic())
+            link.actor.attach_shape(Shape.create_box([0.1] * 3, Material()))
+            r.add_link(link)
+        r.add_joint('l0', 'l1', Joint('j0', joint_type='prismatic'), local_pose0=(0, 0, 0.3), lower_limit=-1,
+                    upper_limit=1)
+        r.add_joint('l1', 'l2', Joint('j1', joint_type='revolute'), local_pose0=(0, 0, 0.3))
+        r.attach_root_node_to_pose((1, 0, 0))
+        r.reset_pose(dict(j0=0.2, j1=0.5))
+        scene.add_aggregate(r.get_aggregate())
+        art = r.get_articulation()
+        art.set_joint_velocities([0.1, 0.2])
+        blob = scene.save_state()
+
+        art.set_joint_positions([-0.3, 0.])
+        art.set_drive_targets([-0.3, 0.])
+        scene.simulate(0.1)
+        scene.restore_state(blob)
+        np.testing.assert_almost_equal(art.get_joint_positions(), [0.2, 0.5], decimal=5)
+        np.testing.assert_almost_equal(art.get_joint_velocities(), [0.1, 0.2], decimal=5)
+        np.testing.assert_almost_equal(art.get_drive_targets(), [0.2, 0.5], decimal=5)
+        self.assert_pose(r.links['l1'].actor.get_global_pose(), (1.2, 0, 0.3))
+
+        with self.assertRaises(ValueError):
+            scene.clone()
+        scene.remove_aggregate(r.get_aggregate())
+        with self.assertRaises(ValueError):
+            scene.restore_state(blob)
+        art.release()
+        self.assertEqual(len(scene.get_articulations()), 0)
+
     def assert_pose(self, current_pose, desired_pose):
         """ Assert pose based on the distances. """
         current_pose = cast_transformation(current_pose)